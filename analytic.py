@@ -0,0 +1,57 @@
+import numpy as np
+
+from engine import STAGES
+
+# Tehlikesiz (ideal) boru hattı için kapalı form çözüm. Her aşama bir döngü
+# sürdüğünden, i. arabanın (0'dan başlayarak) zamanları doğrudan hesaplanır:
+#   boru hatlı  : başlangıç = 1 + i,      bitiş = başlangıç + S
+#   tek vuruşlu : başlangıç = 1 + i * S,  bitiş = başlangıç + S
+# Döngü tek tek adımlanmaz; milyonlarca araba tek bir vektörel çağrıda hesaplanır.
+
+
+def analytic_run(count, stage_count=len(STAGES)):
+    # Araba başına başlangıç / bitiş döngüleri ve hızlanma oranları
+    i = np.arange(count, dtype=np.int64)
+    pipelined_start_cycle = 1 + i
+    single_cycle_start_cycle = 1 + i * stage_count
+    pipelined_end_cycle = pipelined_start_cycle + stage_count
+    single_cycle_end_cycle = single_cycle_start_cycle + stage_count
+    return {
+        'pipelined_start_cycle': pipelined_start_cycle,
+        'pipelined_end_cycle': pipelined_end_cycle,
+        'single_cycle_start_cycle': single_cycle_start_cycle,
+        'single_cycle_end_cycle': single_cycle_end_cycle,
+        'speedup': single_cycle_end_cycle / pipelined_end_cycle,
+    }
+
+
+def analytic_summary(counts, stage_counts=len(STAGES)):
+    # summary_metrics ile aynı değerler; counts ve stage_counts dizi olabilir
+    # (NumPy yayınlama kurallarıyla çok sayıda hat yapılandırması aynı anda).
+    n = np.asarray(counts, dtype=np.int64)
+    s = np.asarray(stage_counts, dtype=np.int64)
+    n, s = np.broadcast_arrays(n, s)
+    # Bitiş döngülerinin toplamları (tam sayı olarak, summary_metrics ile birebir aynı sonuç için)
+    sum_pipelined = n * (1 + s) + n * (n - 1) // 2
+    sum_single_cycle = n * (1 + s) + s * (n * (n - 1) // 2)
+    total_pipelined = n + s
+    total_single_cycle = n * s + 1
+    # Hattın ilk dolma süresi (s - 1) düşülmüş boru hatlı döngü sayısı
+    pipelined_cycles = total_pipelined - 1 - (s - 1)
+    avg_pipelined = sum_pipelined / n
+    avg_single_cycle = sum_single_cycle / n
+    return {
+        'count': n,
+        'total_pipelined': total_pipelined,
+        'total_single_cycle': total_single_cycle,
+        'avg_pipelined': avg_pipelined,
+        'avg_single_cycle': avg_single_cycle,
+        'avg_speedup': avg_single_cycle / avg_pipelined,
+        'pipelined_throughput': n / total_pipelined,
+        'single_cycle_throughput': n / total_single_cycle,
+        # Tehlike olmadığından boru hatlıda CPI (ve IPC) tam 1, tek vuruşluda CPI aşama sayısıdır
+        'pipelined_cpi': pipelined_cycles / n,
+        'single_cycle_cpi': (total_single_cycle - 1) / n,
+        'pipelined_ipc': n / pipelined_cycles,
+    }
+
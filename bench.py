@@ -0,0 +1,275 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from engine import SimulationEngine, make_stages
+from workload import DependencyStream, SyntheticChassis
+
+# Simülasyon çekirdeği ve arayüz güncellemeleri için kıyaslama (benchmark) takımı.
+# Sonuçlar bir JSON taban çizgisine (baseline) yazılır; --compare ile yeni ölçümler
+# taban çizgisiyle karşılaştırılır ve eşikten fazla kötüleşme varsa çıkış kodu 1 olur.
+
+# (ad, aşama sayısı, araba sayısı, aşama süreleri, bağımlılık oranı, hat genişliği)
+ENGINE_CASES = [
+    ('ideal-5x1000', 5, 1000, None, 0.0, 1),
+    ('ideal-5x100000', 5, 100000, None, 0.0, 1),
+    ('hazard-5x100000', 5, 100000, None, 0.3, 1),
+    ('multicycle-5x100000', 5, 100000, [1, 1, 3, 2, 1], 0.0, 1),
+    ('deep-12x100000', 12, 100000, None, 0.0, 1),
+    ('wide-5x100000', 5, 100000, None, 0.3, 2),
+]
+
+# Geçmiş yapılarının tepe bellek ölçümü için araba sayıları
+MEMORY_COUNTS = [1000, 10000, 100000]
+
+# Arayüz güncelleme maliyetinin ölçüldüğü araba ve döngü sayıları
+GUI_COUNT = 200
+GUI_CYCLES = 500
+# Arayüz ölçümü alt sürecinin PySide6 kurulu değilken verdiği çıkış kodu
+GUI_UNAVAILABLE = 3
+
+# Ölçü adı -> iyi yön ('higher': büyük olan iyi, 'lower': küçük olan iyi)
+METRICS = {
+    'cycles_per_s': 'higher',
+    'instructions_per_s': 'higher',
+    'peak_bytes': 'lower',
+    'history_bytes': 'lower',
+    'update_pipelined_table_us': 'lower',
+    'update_single_cycle_table_us': 'lower',
+}
+
+
+def best_of(repeat, func):
+    # func'ı repeat kez çalıştır ve en kısa süreyi (saniye) ile son sonucu döndür.
+    # Çöp toplayıcı ölçüm sırasında kapatılır; en iyi süre gürültüden en az etkilenir.
+    best = None
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_engine(stage_count, count, latencies, hazard_rate, width, repeat):
+    # Geçmiş tutmadan (arayüzsüz mod gibi) tam çalıştırma hızı
+    def run():
+        engine = SimulationEngine(make_stages(stage_count), latencies, issue_width=width)
+        dependencies = DependencyStream(hazard_rate, seed=0) if hazard_rate else None
+        engine.load_source(SyntheticChassis(count), dependencies=dependencies, keep_history=False)
+        engine.run()
+        return engine.cycle - 1
+
+    elapsed, cycles = best_of(repeat, run)
+    return {
+        'cycles_per_s': cycles / elapsed,
+        'instructions_per_s': count / elapsed,
+    }
+
+
+def bench_memory(count):
+    # Geçmiş tutularak (arayüzdeki gibi) çalıştırmanın tepe belleği ve geçmiş yapılarının boyu
+    gc.collect()
+    tracemalloc.start()
+    try:
+        engine = SimulationEngine()
+        engine.load_source(SyntheticChassis(count))
+        engine.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'peak_bytes': peak,
+        'history_bytes': engine.pipeline_history.nbytes() + engine.single_cycle_history.nbytes(),
+    }
+
+
+def measure_gui(count, cycles):
+    # update_pipelined_table / update_single_cycle_table'ın döngü başına ortalama
+    # maliyeti (mikrosaniye). Ekran gerekmez: Qt 'offscreen' platformuyla açılır.
+    # PySide6 kurulu değilse None döner.
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PySide6.QtWidgets import QApplication
+        from gui import PipelineSimulator
+    except ImportError:
+        return None
+    app = QApplication.instance() or QApplication([])
+    window = PipelineSimulator()
+    window.show()
+    engine = window.engine
+    engine.load_source(SyntheticChassis(count))
+    window.pipeline_model.reload()
+    window.single_cycle_model.reload()
+
+    pipelined = single_cycle = 0.0
+    steps = 0
+    while steps < cycles and engine.step():
+        rows = len(engine.pipeline_history)
+        columns = len(engine.instruction_history)
+        start = time.perf_counter()
+        window.update_pipelined_table(rows, columns)
+        middle = time.perf_counter()
+        window.update_single_cycle_table(rows, columns)
+        pipelined += middle - start
+        single_cycle += time.perf_counter() - middle
+        app.processEvents()  # Çizim maliyeti ölçüme katılmaz ama birikmesin
+        steps += 1
+    window.close()
+    return {
+        'update_pipelined_table_us': pipelined / steps * 1e6,
+        'update_single_cycle_table_us': single_cycle / steps * 1e6,
+    }
+
+
+def bench_gui(count, cycles):
+    # measure_gui'yi ayrı bir süreçte çalıştır ve sonucunu döndür. PySide6, yorumlayıcı
+    # kapanırken Qt nesnelerini yok ederken çökebildiğinden (ör. none_dealloc) arayüz
+    # ölçümü kıyaslama sürecinin çıkış kodunu etkilemesin diye alt süreçte yapılır.
+    # Alt sürecin hata çıktısı olduğu gibi standart hataya geçer. PySide6 kurulu değilse
+    # ya da alt süreç başarısız olursa nedeni yazılır ve None döner; taban çizgisinde
+    # arayüz ölçümü varsa compare() bunu kötüleşme sayar.
+    command = [sys.executable, os.path.abspath(__file__), '--gui-child', str(count), str(cycles)]
+    completed = subprocess.run(command, stdout=subprocess.PIPE, text=True)
+    if completed.returncode == GUI_UNAVAILABLE:
+        print("Arayüz ölçümü atlandı: PySide6 kurulu değil.", file=sys.stderr)
+        return None
+    if completed.returncode != 0:
+        print(f"Arayüz ölçümü başarısız: alt süreç {completed.returncode} çıkış koduyla bitti.", file=sys.stderr)
+        return None
+    return json.loads(completed.stdout)
+
+
+def gui_child(count, cycles):
+    # bench_gui'nin alt süreci: sonucu JSON olarak yazar ve Qt'nin kapanış temizliğini
+    # atlayarak hemen çıkar
+    values = measure_gui(count, cycles)
+    if values is None:
+        os._exit(GUI_UNAVAILABLE)
+    sys.stdout.write(json.dumps(values))
+    sys.stdout.flush()
+    os._exit(0)
+
+
+def run_benchmarks(repeat=3, gui=True, progress=None):
+    # Tüm kıyaslamaları çalıştır; {kıyaslama adı: {ölçü: değer}} döndürür
+    results = {}
+
+    def report(name, values):
+        results[name] = values
+        if progress is not None:
+            progress(name, values)
+
+    for name, stage_count, count, latencies, hazard_rate, width in ENGINE_CASES:
+        report(f'engine/{name}', bench_engine(stage_count, count, latencies, hazard_rate, width, repeat))
+    for count in MEMORY_COUNTS:
+        report(f'memory/history-{count}', bench_memory(count))
+    if gui:
+        values = bench_gui(GUI_COUNT, GUI_CYCLES)
+        if values is not None:
+            report(f'gui/update-{GUI_COUNT}x{GUI_CYCLES}', values)
+    return results
+
+
+def compare(baseline, results, threshold, skipped=()):
+    # Taban çizgisindeki her ölçü için (ad, ölçü, eski, yeni, değişim, kötüleşme mi)
+    # satırları döndür. Değişim, iyi yöne göre işaretlenir: pozitif = iyileşme.
+    # Taban çizgisinde olup sonuçlarda bulunmayan kıyaslama veya ölçüler (ör. çöken
+    # arayüz ölçümü) yeni ve değişim değeri None olan bir kötüleşme satırıdır; yalnızca
+    # adı skipped içindeki öneklerden biriyle başlayan (bilerek atlanan) kıyaslamalar sayılmaz.
+    rows = []
+    for name, old_values in baseline.items():
+        values = results.get(name)
+        if values is None and name.startswith(tuple(skipped)):
+            continue
+        for metric, old in old_values.items():
+            new = None if values is None else values.get(metric)
+            if new is None:
+                rows.append((name, metric, old, None, None, True))
+                continue
+            if not old:
+                continue
+            change = (new - old) / old
+            if METRICS[metric] == 'lower':
+                change = -change
+            rows.append((name, metric, old, new, change, change < -threshold))
+    return rows
+
+
+def format_comparison(rows):
+    lines = []
+    for name, metric, old, new, change, regressed in rows:
+        if new is None:
+            lines.append(f"{name:32} {metric:30} {old:16.1f} {'-':>16} {'':>8} EKSİK")
+            continue
+        mark = "KÖTÜLEŞME" if regressed else ""
+        lines.append(f"{name:32} {metric:30} {old:16.1f} {new:16.1f} {change:+8.1%} {mark}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simülasyon çekirdeği ve arayüz güncellemeleri için kıyaslama takımı.")
+    parser.add_argument('-o', '--output', help='Sonuçları bu JSON dosyasına yaz (yeni taban çizgisi)')
+    parser.add_argument('--compare', metavar='DOSYA', help='Sonuçları bu taban çizgisiyle karşılaştır; eşikten fazla kötüleşmede çıkış kodu 1')
+    parser.add_argument('--threshold', type=float, default=0.10, help='İzin verilen en fazla kötüleşme oranı (varsayılan: 0.10 = %%10)')
+    parser.add_argument('--repeat', type=int, default=3, help='Hız ölçümlerinde tekrar sayısı; en iyi süre alınır (varsayılan: 3)')
+    parser.add_argument('--no-gui', action='store_true', help='Arayüz güncelleme ölçümlerini atla')
+    parser.add_argument('--gui-child', nargs=2, type=int, metavar=('ARABA', 'DÖNGÜ'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.gui_child:
+        gui_child(*args.gui_child)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    def progress(name, values):
+        text = ', '.join(f"{metric}={value:.1f}" for metric, value in values.items())
+        print(f"{name}: {text}", file=sys.stderr, flush=True)
+
+    results = run_benchmarks(args.repeat, not args.no_gui, progress)
+    if args.output:
+        document = {
+            'meta': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+            f.write('\n')
+
+    if baseline is None:
+        return 0
+    rows = compare(baseline, results, args.threshold, skipped=('gui/',) if args.no_gui else ())
+    print(format_comparison(rows))
+    missing = sum(1 for row in rows if row[3] is None)
+    regressions = sum(1 for row in rows if row[5]) - missing
+    if missing:
+        print(f"{missing} ölçü sonuçlarda yok (kıyaslama çöktü veya kaldırıldı).", file=sys.stderr)
+    if regressions:
+        print(f"{regressions} ölçü %{args.threshold * 100:g}'den fazla kötüleşti.", file=sys.stderr)
+    if missing or regressions:
+        return 1
+    print(f"Kötüleşme yok ({len(rows)} ölçü karşılaştırıldı).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
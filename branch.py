@@ -0,0 +1,155 @@
+# IF (Bellekten Getir / Şasi Montajı) aşamasındaki dallanma tahmincileri.
+# Dallanma olarak işaretlenen bir araba hatta girerken tahminciye sorulur; sonucu
+# EX aşamasından çıkarken belli olur. Tahmin yanlışsa arkasındaki (daha genç)
+# arabalar hattan atılır ve hat `penalty` döngü boyunca yeni araba almaz.
+# Tablo tabanlı tahmincilerin durumu bytearray içinde tutulur; dallanma
+# başına nesne oluşturulmaz. Komutlar 4 bayt hizalı olduğundan tablolar adresin
+# düşük iki biti atılarak indekslenir.
+
+PREDICTORS = ('taken', 'not-taken', '1bit', '2bit', 'gshare')
+
+
+class BranchPredictor:
+    # Ortak sayaçlar. Alt sınıflar predict() ve train() tanımlar.
+    def __init__(self, penalty=2):
+        if penalty < 0:
+            raise ValueError("Yanlış tahmin cezası negatif olamaz")
+        self.penalty = penalty
+        self.reset()
+
+    def reset(self):
+        # Tahmin tablolarını ilk durumuna getir ve sayaçları sıfırla
+        self.branches = 0
+        self.mispredictions = 0
+        self.flushed = 0
+        self.flush_cycles = 0
+
+    def predict(self, pc):
+        raise NotImplementedError
+
+    def train(self, pc, taken):
+        pass
+
+    def resolve(self, pc, taken, predicted):
+        # Dallanmanın gerçek sonucunu öğren; yanlış tahmin edildiyse True döner
+        self.branches += 1
+        self.train(pc, taken)
+        if taken == predicted:
+            return False
+        self.mispredictions += 1
+        self.flush_cycles += self.penalty
+        return True
+
+    def metrics(self):
+        branches = self.branches
+        return {
+            'branches': branches,
+            'branch_mispredictions': self.mispredictions,
+            'branch_accuracy': 1 - self.mispredictions / branches if branches else 0.0,
+            'branch_flushed': self.flushed,
+            'branch_flush_cycles': self.flush_cycles,
+        }
+
+
+class StaticPredictor(BranchPredictor):
+    # Her dallanma için hep aynı tahmin (taken=True: hep alınır)
+    def __init__(self, taken=False, penalty=2):
+        self.taken = taken
+        super().__init__(penalty)
+
+    def predict(self, pc):
+        return self.taken
+
+
+class OneBitPredictor(BranchPredictor):
+    # Dallanma adresinin düşük bitleriyle seçilen bir bitlik tablo: son sonucu tekrarlar
+    def __init__(self, table_bits=10, penalty=2):
+        self.mask = (1 << table_bits) - 1
+        super().__init__(penalty)
+
+    def reset(self):
+        super().reset()
+        self.table = bytearray(self.mask + 1)
+
+    def predict(self, pc):
+        return bool(self.table[(pc >> 2) & self.mask])
+
+    def train(self, pc, taken):
+        self.table[(pc >> 2) & self.mask] = taken
+
+
+class TwoBitPredictor(BranchPredictor):
+    # İki bitlik doygun sayaçlar (0-1: alınmaz, 2-3: alınır); tek bir sapma tahmini çevirmez
+    def __init__(self, table_bits=10, penalty=2):
+        self.mask = (1 << table_bits) - 1
+        super().__init__(penalty)
+
+    def reset(self):
+        super().reset()
+        self.table = bytearray([1]) * (self.mask + 1)  # Zayıf alınmaz
+
+    def index(self, pc):
+        return (pc >> 2) & self.mask
+
+    def predict(self, pc):
+        return self.table[self.index(pc)] >= 2
+
+    def train(self, pc, taken):
+        table = self.table
+        i = self.index(pc)
+        if taken:
+            if table[i] < 3:
+                table[i] += 1
+        elif table[i] > 0:
+            table[i] -= 1
+
+
+class GsharePredictor(TwoBitPredictor):
+    # Sayaç, dallanma adresi ile son history_bits dallanmanın sonuç geçmişinin XOR'uyla
+    # seçilir; böylece aynı dallanmanın farklı bağlamlardaki davranışı ayrı öğrenilir.
+    # Geçmiş tahmin anında tahmin edilen sonuçla (spekülatif) güncellenir; yanlış
+    # tahminde genç dallanmalar hattan atıldığından geçmiş, çözülmüş dallanmaların
+    # geçmişine (resolved_history) geri alınır. Dallanmalar sırayla çözüldüğünden
+    # bir dallanma çözülürken resolved_history, tahmin anındaki geçmişe eşittir.
+    def __init__(self, table_bits=10, history_bits=8, penalty=2):
+        self.history_mask = (1 << history_bits) - 1
+        super().__init__(table_bits, penalty)
+
+    def reset(self):
+        super().reset()
+        self.history = 0
+        self.resolved_history = 0
+
+    def predict(self, pc):
+        taken = self.table[((pc >> 2) ^ self.history) & self.mask] >= 2
+        self.history = ((self.history << 1) | taken) & self.history_mask
+        return taken
+
+    def index(self, pc):
+        return ((pc >> 2) ^ self.resolved_history) & self.mask
+
+    def train(self, pc, taken):
+        super().train(pc, taken)
+        self.resolved_history = ((self.resolved_history << 1) | taken) & self.history_mask
+
+    def resolve(self, pc, taken, predicted):
+        mispredicted = super().resolve(pc, taken, predicted)
+        if mispredicted:
+            self.history = self.resolved_history
+        return mispredicted
+
+
+def make_predictor(name, penalty=2, table_bits=10):
+    # PREDICTORS içindeki bir adla tahminci oluştur
+    if name == 'taken':
+        return StaticPredictor(True, penalty)
+    if name == 'not-taken':
+        return StaticPredictor(False, penalty)
+    if name == '1bit':
+        return OneBitPredictor(table_bits, penalty)
+    if name == '2bit':
+        return TwoBitPredictor(table_bits, penalty)
+    if name == 'gshare':
+        return GsharePredictor(table_bits, penalty=penalty)
+    raise ValueError(f"Bilinmeyen dallanma tahmincisi: {name}")
+
@@ -0,0 +1,97 @@
+import random
+from array import array
+
+# MEM (Bellek Erişimi / Cam ve Kapı Montajı) aşamasının arkasındaki parça tamponu.
+# Set-ilişkili (set-associative) bir önbellek olarak modellenir: adres satır
+# boyuna bölünerek satır numarası bulunur, satırın düşük bitleri seti seçer.
+# Etiketler ve kullanım zamanları set x yol (way) düzeninde düz dizilerde tutulur;
+# erişim başına nesne oluşturulmaz, milyonlarca erişim sabit bellekle işlenir.
+
+POLICIES = ('lru', 'fifo', 'random')
+EMPTY_TAG = -1
+
+
+def log2(value, name):
+    if value < 1 or value & (value - 1):
+        raise ValueError(f"{name} 2'nin kuvveti olmalıdır: {value}")
+    return value.bit_length() - 1
+
+
+class SetAssociativeCache:
+    # size: toplam kapasite (bayt), line_size: satır boyu (bayt), associativity:
+    # set başına yol sayısı, miss_penalty: ıskada araba MEM'de fazladan kaç döngü bekler.
+    # policy: 'lru' (en uzun süredir kullanılmayan), 'fifo' (en eski yüklenen) veya
+    # 'random' (boş yol yoksa rastgele) çıkarma.
+    def __init__(self, size=1024, associativity=2, line_size=64, policy='lru', miss_penalty=10, seed=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Bilinmeyen çıkarma politikası: {policy}")
+        if miss_penalty < 0:
+            raise ValueError("Iska cezası negatif olamaz")
+        self.line_bits = log2(line_size, "Satır boyu")
+        log2(associativity, "Yol sayısı")
+        if size < line_size * associativity:
+            raise ValueError("Önbellek boyu en az satır boyu x yol sayısı kadar olmalıdır")
+        self.set_count = 1 << log2(size // (line_size * associativity), "Set sayısı")
+        self.size = size
+        self.associativity = associativity
+        self.line_size = line_size
+        self.policy = policy
+        self.miss_penalty = miss_penalty
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        # Önbelleği boşalt ve sayaçları sıfırla
+        lines = self.set_count * self.associativity
+        # Yuvadaki satır numarası (EMPTY_TAG = boş) ve son kullanım / yüklenme zamanı
+        self.tags = array('q', [EMPTY_TAG]) * lines
+        self.stamps = array('q', [0]) * lines
+        self.tick = 0
+        self.rng = random.Random(self.seed)
+        self.hits = 0
+        self.misses = 0
+        self.stall_cycles = 0
+
+    def access(self, address):
+        # Adrese eriş; isabette 0, ıskada miss_penalty (fazladan bekleme döngüsü) döner
+        line = address >> self.line_bits
+        ways = self.associativity
+        base = (line & (self.set_count - 1)) * ways
+        end = base + ways
+        tags = self.tags
+        self.tick += 1
+        try:
+            slot = tags.index(line, base, end)
+        except ValueError:
+            pass
+        else:
+            self.hits += 1
+            if self.policy == 'lru':
+                self.stamps[slot] = self.tick
+            return 0
+
+        # Iska: boş yol varsa ona, yoksa politikaya göre seçilen yola yükle. Boş
+        # yolların zaman damgası 0 olduğundan LRU / FIFO'da önce onlar seçilir.
+        if self.policy == 'random':
+            try:
+                slot = tags.index(EMPTY_TAG, base, end)
+            except ValueError:
+                slot = base + self.rng.randrange(ways)
+        else:
+            stamps = self.stamps
+            slot = min(range(base, end), key=stamps.__getitem__)
+        tags[slot] = line
+        self.stamps[slot] = self.tick
+        self.misses += 1
+        self.stall_cycles += self.miss_penalty
+        return self.miss_penalty
+
+    def metrics(self):
+        accesses = self.hits + self.misses
+        return {
+            'cache_accesses': accesses,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_hit_rate': self.hits / accesses if accesses else 0.0,
+            'cache_miss_stall_cycles': self.stall_cycles,
+        }
@@ -0,0 +1,253 @@
+import argparse
+import json
+import sys
+
+from branch import PREDICTORS, make_predictor
+from cache import POLICIES, SetAssociativeCache
+from engine import STAGES, STALL_CAUSES, SimulationEngine, make_stages
+from profiler import ENGINE_PHASES, Profiler
+from tracefile import TraceWriter
+from workload import AddressStream, BranchStream, ChassisFile, DependencyStream, SyntheticChassis, chassis_lines
+
+# Grafik arayüz olmadan çalıştırma: PySide6 hiç içe aktarılmaz, bu yüzden
+# betiklerden ve CI'dan binlerce kez çağrılabilir.
+
+SUMMARY_LABELS = {
+    'count': "Toplam Araç Sayısı",
+    'total_pipelined': "Boru Hatlı Toplam Süre (döngü)",
+    'total_single_cycle': "Tek Vuruşlu Toplam Süre (döngü)",
+    'avg_pipelined': "Boru Hatlı Ortalama Bitiş Döngüsü",
+    'avg_single_cycle': "Tek Vuruşlu Ortalama Bitiş Döngüsü",
+    'avg_speedup': "Ortalama Hızlanma Oranı",
+    'pipelined_throughput': "Boru Hatlı Verimlilik (araç/döngü)",
+    'single_cycle_throughput': "Tek Vuruşlu Verimlilik (araç/döngü)",
+    'pipelined_cpi': "Boru Hatlı CPI",
+    'single_cycle_cpi': "Tek Vuruşlu CPI",
+    'pipelined_ipc': "Boru Hatlı IPC",
+    'stall_data': "Veri Bağımlılığı Beklemesi (döngü)",
+    'stall_structural': "Yapısal Bekleme (döngü)",
+    'cache_accesses': "Önbellek Erişimi",
+    'cache_hits': "Önbellek İsabeti",
+    'cache_misses': "Önbellek Iskası",
+    'cache_hit_rate': "Önbellek İsabet Oranı",
+    'cache_miss_stall_cycles': "Önbellek Iska Beklemesi (döngü)",
+    'branches': "Dallanma Sayısı",
+    'branch_mispredictions': "Yanlış Tahmin",
+    'branch_accuracy': "Tahmin Doğruluğu",
+    'branch_flushed': "Hattan Atılan Araba",
+    'branch_flush_cycles': "Yanlış Tahmin Cezası (döngü)",
+    'pipelined_latency_mean': "Boru Hatlı Ortalama Gecikme (döngü)",
+    'pipelined_latency_std': "Boru Hatlı Gecikme Standart Sapması",
+    'pipelined_latency_min': "Boru Hatlı En Kısa Gecikme",
+    'pipelined_latency_max': "Boru Hatlı En Uzun Gecikme",
+    'pipelined_latency_p50': "Boru Hatlı Gecikme p50",
+    'pipelined_latency_p95': "Boru Hatlı Gecikme p95",
+    'pipelined_latency_p99': "Boru Hatlı Gecikme p99",
+    'single_cycle_latency_mean': "Tek Vuruşlu Ortalama Gecikme (döngü)",
+    'single_cycle_latency_std': "Tek Vuruşlu Gecikme Standart Sapması",
+    'single_cycle_latency_min': "Tek Vuruşlu En Kısa Gecikme",
+    'single_cycle_latency_max': "Tek Vuruşlu En Uzun Gecikme",
+    'single_cycle_latency_p50': "Tek Vuruşlu Gecikme p50",
+    'single_cycle_latency_p95': "Tek Vuruşlu Gecikme p95",
+    'single_cycle_latency_p99': "Tek Vuruşlu Gecikme p99",
+    'pipelined_window_throughput': "Boru Hatlı Son Pencere Verimliliği (son tamamlanmaya kadar, araç/döngü)",
+    'single_cycle_window_throughput': "Tek Vuruşlu Son Pencere Verimliliği (son tamamlanmaya kadar, araç/döngü)",
+    'pipelined_occupancy': "Boru Hatlı Ortalama Dolu Aşama Sayısı",
+    'pipelined_utilization': "Boru Hatlı Aşama Kullanımı",
+    'single_cycle_utilization': "Tek Vuruşlu Aşama Kullanımı",
+    'simulated_cycles': "Simüle Edilen Döngü",
+    'finished': "Tamamlandı",
+}
+
+
+def parse_list(text, cast=str):
+    # Virgülle ayrılmış değer listesi; boş öğeler atlanır
+    return [cast(x.strip()) for x in text.split(',') if x.strip()]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='app.py --headless',
+        description="Simülasyonu grafik arayüz olmadan çalıştırır ve performans özetini yazdırır.",
+        fromfile_prefix_chars='@',  # @dosya: argümanları dosyadan oku (satır başına bir argüman)
+    )
+    parser.add_argument('--chassis', default='', help='Virgülle ayrılmış şasi numaraları')
+    parser.add_argument('--chassis-file', help="Şasi numaralarını içeren dosya ('-' = standart girdi); dosya akış olarak okunur")
+    parser.add_argument('--count', type=int, help='Araba sayısı; dosyayla birlikte en fazla bu kadar araba okunur (varsayılan: tümü, şasi yoksa 5)')
+    parser.add_argument('--stages', type=int, default=len(STAGES), help=f'Aşama sayısı (varsayılan: {len(STAGES)})')
+    parser.add_argument('--width', type=int, default=1, help='Hat genişliği: aşama başına istasyon sayısı, döngüde hatta girip çıkabilen en fazla araba (varsayılan: 1)')
+    parser.add_argument('--latencies', default='', help='Aşama süreleri, ör. 1,1,3,2,1 (varsayılan: her aşama 1 döngü)')
+    parser.add_argument('--hazard-rate', type=float, default=0.0, help='Bağımlılık oranı, 0-1 arası (varsayılan: 0)')
+    parser.add_argument('--forwarding', action=argparse.BooleanOptionalAction, default=None, help='Yönlendirmeyi (forwarding) aç / kapat')
+    parser.add_argument('--seed', type=int, help='Bağımlılık ataması için rastgele tohum')
+    parser.add_argument('--cache-size', type=int, metavar='BAYT', help='MEM aşamasının arkasına bu boyda bir önbellek koy (varsayılan: önbellek yok)')
+    parser.add_argument('--cache-ways', type=int, default=2, help='Önbelleğin set başına yol sayısı (varsayılan: 2)')
+    parser.add_argument('--cache-line', type=int, default=64, help='Önbellek satır boyu, bayt (varsayılan: 64)')
+    parser.add_argument('--cache-policy', choices=POLICIES, default='lru', help='Çıkarma politikası (varsayılan: lru)')
+    parser.add_argument('--miss-penalty', type=int, default=10, help='Önbellek ıskasında MEM aşamasında fazladan beklenen döngü (varsayılan: 10)')
+    parser.add_argument('--working-set', type=int, default=1 << 16, metavar='BAYT', help='Erişilen adres alanının boyu (varsayılan: 65536)')
+    parser.add_argument('--locality', type=float, default=0.8, help='Bir erişimin öncekinin hemen ardındaki adrese gitme olasılığı (varsayılan: 0.8)')
+    parser.add_argument('--branch-rate', type=float, default=0.0, help='Arabanın dallanma olma olasılığı, 0-1 arası (varsayılan: 0)')
+    parser.add_argument('--predictor', choices=PREDICTORS, default='2bit', help='Dallanma tahmincisi (varsayılan: 2bit)')
+    parser.add_argument('--mispredict-penalty', type=int, default=2, help='Yanlış tahminden sonra hattın araba almadığı döngü (varsayılan: 2)')
+    parser.add_argument('--stats', action='store_true', help='Gecikme dağılımı, kayan pencere verimliliği ve aşama kullanımını da hesapla (simülasyonu yavaşlatır)')
+    parser.add_argument('--resume', metavar='DOSYA', help='Kaydedilmiş durumdan devam et (--latencies / --forwarding verilirse bu noktadan farklı ayarlarla dallanır)')
+    parser.add_argument('--stop-at', type=int, metavar='DÖNGÜ', help='Bu döngüye kadar simüle et ve dur (ör. --save ile kaydetmek için)')
+    parser.add_argument('--save', metavar='DOSYA', help='Çalıştırma sonundaki (veya --stop-at döngüsündeki) durumu kaydet')
+    parser.add_argument('--trace', metavar='DOSYA', help='Döngü döngü ikili iz dosyası yaz (arayüzde "İz Aç" ile görüntülenebilir)')
+    parser.add_argument('--profile', metavar='DOSYA', help='Motor aşamalarının sürelerini ölç, Chrome izleme biçiminde (chrome://tracing, Perfetto, speedscope) yaz ve dökümü standart hataya yazdır')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Çıktı biçimi')
+    parser.add_argument('-o', '--output', help='Özeti dosyaya yaz (varsayılan: standart çıktı)')
+    return parser
+
+
+def build_engine(args):
+    # Argümanlara göre yeni bir motor kur. Arabalar kaynaktan tembel olarak çekilir
+    # ve tamamlanınca bırakılır; bellek kullanımı araba sayısından bağımsızdır.
+    count = args.count
+    if count is not None and count < 1:
+        raise ValueError("Araba sayısı en az 1 olmalıdır.")
+    if args.chassis_file == '-':
+        source = chassis_lines(sys.stdin)
+    elif args.chassis_file:
+        source = ChassisFile(args.chassis_file)
+    elif args.chassis:
+        source = parse_list(args.chassis)
+        if count is not None and len(source) < count:
+            raise ValueError(f"Yetersiz şasi numarası girdiniz. En az {count} adet gerekli.")
+    else:
+        source = SyntheticChassis(5 if count is None else count)
+    if args.stages < 1:
+        raise ValueError("Aşama sayısı en az 1 olmalıdır.")
+    if args.width < 1:
+        raise ValueError("Hat genişliği en az 1 olmalıdır.")
+
+    cache = addresses = None
+    if args.cache_size is not None:
+        cache = SetAssociativeCache(args.cache_size, args.cache_ways, args.cache_line, args.cache_policy, args.miss_penalty, seed=args.seed)
+        addresses = AddressStream(args.working_set, args.locality, seed=args.seed)
+    predictor = branches = None
+    if args.branch_rate:
+        predictor = make_predictor(args.predictor, args.mispredict_penalty)
+        branches = BranchStream(args.branch_rate, seed=args.seed)
+
+    try:
+        latencies = parse_list(args.latencies, int) or None
+        engine = SimulationEngine(make_stages(args.stages), latencies, bool(args.forwarding), collect_stats=args.stats, issue_width=args.width, cache=cache, predictor=predictor)
+    except ValueError:
+        raise ValueError(f"Aşama süreleri {args.stages} adet, 1 veya daha büyük tam sayı olmalıdır.")
+    dependencies = DependencyStream(args.hazard_rate, seed=args.seed) if args.hazard_rate else None
+    engine.load_source(source, count, dependencies, keep_history=False, addresses=addresses, branches=branches)
+    return engine
+
+
+def resume_engine(args):
+    # Kaydedilmiş durumu yükle; verilen ayarlar bu noktadan sonrası için geçerli olur
+    engine = SimulationEngine()
+    try:
+        engine.restore_checkpoint(args.resume)
+    except Exception as e:  # Bozuk / uyumsuz dosya (pickle çok çeşitli hatalar üretebilir)
+        raise ValueError(f"Durum yüklenemedi: {e}")
+    if args.latencies:
+        try:
+            engine.set_stage_latencies(parse_list(args.latencies, int))
+        except ValueError:
+            raise ValueError(f"Aşama süreleri {len(engine.stages)} adet, 1 veya daha büyük tam sayı olmalıdır.")
+    if args.forwarding is not None:
+        engine.forwarding = args.forwarding
+    if args.cache_size is not None:
+        raise ValueError("Önbellek ayarları --resume ile değiştirilemez; kayıttaki önbellekle devam edilir.")
+    if args.branch_rate:
+        raise ValueError("Dallanma ayarları --resume ile değiştirilemez; kayıttaki tahminciyle devam edilir.")
+    if args.stats and engine.stats is None:
+        raise ValueError("Kayıt --stats olmadan alınmış; istatistikler yalnızca çalıştırmanın başından toplanabilir.")
+    return engine
+
+
+def run(args):
+    # Simülasyonu çalıştır ve özet ölçüleri döndür
+    if args.trace and args.resume:
+        raise ValueError("--trace, --resume ile birlikte kullanılamaz (iz simülasyonun başından yazılır).")
+    engine = resume_engine(args) if args.resume else build_engine(args)
+    writer = None
+    if args.trace:
+        # İz çalıştırma boyunca diske yazılır; bellek kullanımı çalıştırma uzunluğundan bağımsızdır
+        writer = TraceWriter(args.trace, engine.stages, engine.issue_width)
+        writer.attach(engine)
+    profiler = None
+    if args.profile:
+        profiler = Profiler()
+        profiler.instrument(engine, ENGINE_PHASES)
+    try:
+        if args.stop_at is not None:
+            engine.seek(args.stop_at)
+        else:
+            engine.run()
+    finally:
+        if writer is not None:
+            writer.close()
+        if profiler is not None:
+            profiler.detach()
+            sys.stderr.write(format_profile(profiler.breakdown()))
+            profiler.export_chrome_trace(args.profile)
+    if args.save:
+        engine.save_checkpoint(args.save)
+    if not engine.finished:
+        return {'simulated_cycles': engine.cycle - 1, 'finished': False}
+    if engine.summary.pipelined_count == 0:
+        raise ValueError("Kaynakta hiç şasi numarası yok.")
+
+    metrics = engine.summary.metrics(len(engine.stages))
+    for cause in STALL_CAUSES:
+        metrics[f'stall_{cause}'] = engine.stall_cycles[cause]
+    if engine.cache is not None:
+        metrics.update(engine.cache.metrics())
+    if engine.predictor is not None:
+        metrics.update(engine.predictor.metrics())
+    if args.stats:
+        metrics.update(engine.stats.metrics(engine.cycle - 1, final=True))
+    return metrics
+
+
+def format_value(value):
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    if isinstance(value, list):
+        return ', '.join(format_value(x) for x in value)
+    return str(value)
+
+
+def format_profile(rows):
+    lines = [f"{'Aşama':20} {'Çağrı':>10} {'Toplam (ms)':>12} {'Ortalama (µs)':>14} {'Oran':>7}"]
+    for name, calls, total, mean, share in rows:
+        lines.append(f"{name:20} {calls:10} {total / 1e6:12.2f} {mean / 1e3:14.2f} {share:7.1%}")
+    return '\n'.join(lines) + '\n'
+
+
+def format_text(metrics):
+    lines = []
+    for key, value in metrics.items():
+        label = SUMMARY_LABELS.get(key, key)
+        lines.append(f"{label}: {format_value(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        metrics = run(args)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    text = json.dumps(metrics) + '\n' if args.format == 'json' else format_text(metrics)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
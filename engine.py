@@ -0,0 +1,920 @@
+import bisect
+import copy
+import heapq
+import itertools
+import pickle
+import zlib
+from collections import deque
+
+from history import CycleHistory, EMPTY
+from stats import PipelineStats
+
+STAGES = ['Bellekten Getir (Şasi Montajı)', 'Buyrukları Çöz (Motor Yerleştirme)', 'İşlemi Yürüt (Boya Uygulama)', 'Bellek Erişimi (Cam ve Kapı Montajı)', 'Sonucu Yaz (Kalite Kontrol)']
+STAGE_SHORT = ['IF', 'ID', 'EX', 'MEM', 'WB']  # Kısa etiketler
+
+# Kaynak yazmaçların okunduğu (ID) ve sonucun hesaplandığı (EX) aşamalar
+DECODE_STAGE = 1
+EXECUTE_STAGE = 2
+# Veri bağımlılıklarının modellenebildiği en kısa hat: IF, ID, EX/MEM, WB
+MIN_HAZARD_STAGES = 4
+
+# Bekleme (stall) nedenleri
+STALL_CAUSES = ('data', 'structural')
+
+# Kontrol noktası (checkpoint) biçim sürümü; kayıtlı dosyalar farklı sürümle açılmaz
+CHECKPOINT_VERSION = 9
+
+# Renk paletindeki renk sayısı (renkler arayüzde, gui.COLORS içinde tanımlı)
+PALETTE_SIZE = 6
+
+
+class Instruction:
+    # __slots__ ile nesne başına __dict__ tutulmaz; milyonlarca arabada bellek ve
+    # oluşturma süresinin büyük kısmı buradan kazanılır. Aşama adları motorda,
+    # renk paleti arayüzde ortak tutulur; arabada yalnızca palet indeksi saklanır.
+    __slots__ = (
+        'chassis_no', 'index', 'color_index', 'pipelined_stage', 'latencies',
+        'src_mask', 'dst_mask', 'is_load', 'address', 'branch_pc', 'taken', 'predicted',
+        'stall_cycles',
+        'pipelined_start_cycle', 'pipelined_end_cycle',
+        'single_cycle_start_cycle', 'single_cycle_end_cycle',
+    )
+
+    def __init__(self, chassis_no, index=0):
+        self.chassis_no = chassis_no
+        self.index = index  # Tablolardaki sütun / satır numarası
+        self.color_index = color_index(chassis_no)
+        # Boru hattında bulunduğu aşama (yoksa None)
+        self.pipelined_stage = None
+        # Araba başına aşama süreleri (None ise motorun stage_latencies değeri kullanılır)
+        self.latencies = None
+        # Okunan / yazılan yazmaçlar (bit maskesi) ve bellekten yükleme komutu mu
+        self.src_mask = 0
+        self.dst_mask = 0
+        self.is_load = False
+        # MEM aşamasında erişilen parça tamponu adresi (None = erişim yok)
+        self.address = None
+        # Dallanmaysa dallanma adresi, gerçek sonucu ve IF'te yapılan tahmin (branch_pc None = dallanma değil)
+        self.branch_pc = None
+        self.taken = False
+        self.predicted = False
+        # Boru hattında ilerleyemeden beklenen döngü sayısı
+        self.stall_cycles = 0
+        # Tamamlanma zamanları
+        self.pipelined_start_cycle = None
+        self.pipelined_end_cycle = None
+        self.single_cycle_start_cycle = None
+        self.single_cycle_end_cycle = None
+
+    def get_stage_text(self, stage_index):
+        return f"🚗 {self.chassis_no}"
+
+    def get_state(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def set_state(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def reset_pipelined(self):
+        # Boru hatlı birime ait alanları hatta hiç girmemiş haline döndür
+        self.pipelined_stage = None
+        self.stall_cycles = 0
+        self.pipelined_start_cycle = None
+        self.pipelined_end_cycle = None
+
+    def reset_single_cycle(self):
+        self.single_cycle_start_cycle = None
+        self.single_cycle_end_cycle = None
+
+    @classmethod
+    def from_state(cls, state):
+        instr = cls.__new__(cls)
+        instr.set_state(state)
+        return instr
+
+
+def color_index(chassis_no):
+    # Şasi numarası rakamla bitiyorsa son rakama göre, değilse numaranın CRC32
+    # özetine göre renk seç (hash()'in aksine her çalıştırmada aynı renk)
+    last = chassis_no[-1:]
+    if last.isdecimal():
+        return int(last) % PALETTE_SIZE
+    return zlib.crc32(chassis_no.encode('utf-8')) % PALETTE_SIZE
+
+
+def hazard_stages(stage_count):
+    # Aşama sayısına göre skorbordun (ID, EX, MEM) aşama indeksleri. MEM, geri yazma
+    # (WB) aşamasından hemen önceki aşamadır; 4 aşamalı hatta EX ile birleşir. Daha
+    # kısa hatlarda yazmaç okuma ile geri yazma arasında sonucun bekleyebileceği bir
+    # aşama kalmadığından veri bağımlılığı modellenemez.
+    if stage_count < MIN_HAZARD_STAGES:
+        raise ValueError(f"Veri bağımlılıkları en az {MIN_HAZARD_STAGES} aşamalı hatlarda modellenebilir")
+    return DECODE_STAGE, EXECUTE_STAGE, max(EXECUTE_STAGE, stage_count - 2)
+
+
+def make_stages(stage_count):
+    # Varsayılan 5 aşama dışındaki hat uzunlukları için genel aşama adları
+    if stage_count == len(STAGES):
+        return STAGES
+    return [f"Aşama {i+1}" for i in range(stage_count)]
+
+
+class RunningSummary:
+    # Performans özeti için gereken toplamlar. Arabalar tamamlandıkça eklenir, böylece
+    # özet, tamamlanan arabaları bellekte tutmadan hesaplanabilir.
+    def __init__(self):
+        self.pipelined_count = 0
+        self.pipelined_end_sum = 0
+        self.pipelined_first_start = None
+        self.pipelined_last_end = None
+        self.single_cycle_count = 0
+        self.single_cycle_end_sum = 0
+        self.single_cycle_first_start = None
+        self.single_cycle_last_end = None
+
+    def add_pipelined(self, instr):
+        if self.pipelined_first_start is None:
+            self.pipelined_first_start = instr.pipelined_start_cycle
+        self.pipelined_count += 1
+        self.pipelined_end_sum += instr.pipelined_end_cycle
+        self.pipelined_last_end = instr.pipelined_end_cycle
+
+    def add_single_cycle(self, instr):
+        if self.single_cycle_first_start is None:
+            self.single_cycle_first_start = instr.single_cycle_start_cycle
+        self.single_cycle_count += 1
+        self.single_cycle_end_sum += instr.single_cycle_end_cycle
+        self.single_cycle_last_end = instr.single_cycle_end_cycle
+
+    def metrics(self, stage_count=len(STAGES)):
+        # update_performance_summary'de gösterilen değerler (tüm arabalar bitmiş olmalı)
+        count = self.pipelined_count
+        avg_pipelined = self.pipelined_end_sum / count
+        avg_single_cycle = self.single_cycle_end_sum / count
+        total_pipelined = self.pipelined_last_end
+        total_single_cycle = self.single_cycle_last_end
+        # Boru hatlıda hattın ilk dolma süresi (aşama sayısı - 1) düşülür
+        pipelined_cycles = total_pipelined - self.pipelined_first_start - (stage_count - 1)
+        return {
+            'count': count,
+            'total_pipelined': total_pipelined,
+            'total_single_cycle': total_single_cycle,
+            'avg_pipelined': avg_pipelined,
+            'avg_single_cycle': avg_single_cycle,
+            'avg_speedup': avg_single_cycle / avg_pipelined,
+            'pipelined_throughput': count / total_pipelined,
+            'single_cycle_throughput': count / total_single_cycle,
+            # Komut başına döngü ve döngü başına komut (çok yuvalı hatta IPC 1'i geçebilir)
+            'pipelined_cpi': pipelined_cycles / count,
+            'single_cycle_cpi': (total_single_cycle - self.single_cycle_first_start) / count,
+            'pipelined_ipc': count / pipelined_cycles,
+        }
+
+
+def summary_metrics(instructions, stage_count=len(STAGES)):
+    # Tamamlanmış komut listesinden performans özeti
+    summary = RunningSummary()
+    for instr in instructions:
+        summary.add_pipelined(instr)
+        summary.add_single_cycle(instr)
+    return summary.metrics(stage_count)
+
+
+class SimulationEngine:
+    # Qt'den bağımsız simülasyon motoru. Arayüz, subscribe() ile olaylara abone olur:
+    #   'pipelined_complete'    (instr, cycle)  boru hattından bir araba çıktı
+    #   'single_cycle_complete' (instr, cycle)  tek vuruşlu birimden bir araba çıktı
+    #   'finished'              ()              tüm arabalar tamamlandı
+    #   'cycle'                 (pipeline_row, single_cycle_row, count)
+    #                           döngü sonundaki aşama doluluğu; atlanan döngülerde
+    #                           aynı satır count kez geçerlidir (ör. trace.TraceWriter)
+    #
+    # Her aşamanın süresi (döngü) aşama başına stage_latencies ile, araba başına
+    # ise Instruction.latencies ile ayarlanır. Bir aşamaya c döngüsünde giren araba
+    # c + süre döngüsünde bir sonraki aşamaya geçmeye hazır olur; sonraki aşama
+    # doluysa hazır olduğu aşamada bekler. Hazır olma zamanları bir heapq olay
+    # kuyruğunda tutulur ve run() hiçbir şeyin değişmediği döngüleri tek tek
+    # simüle etmeden doğrudan bir sonraki olaya atlar.
+    #
+    # Veri bağımlılıkları: ID'deki bir araba, kaynak yazmaçlarından biri önündeki
+    # bir arabanın henüz kullanılamayan sonucu ise EX'e geçemez (pending_writes).
+    # forwarding=False iken sonuç WB'ye ulaşınca, True iken ALU sonucu EX'ten,
+    # yükleme (is_load) sonucu MEM'den çıkınca kullanılabilir. Arkada açılan
+    # boşluk bir bubble olarak ilerler. Her bekleme döngüsü nedenine göre
+    # stall_cycles'ta sayılır; tıkanan bir arabanın arkasındakiler aynı nedene yazılır.
+    # MIN_HAZARD_STAGES'ten kısa hatlarda load_source bağımlılık akışını reddeder.
+    #
+    # Arabalar load() ile önceden kuyruğa alınabilir ya da load_source() ile bir
+    # akış kaynağından (dosya, standart girdi, sentetik üreteç) tembel olarak
+    # çekilebilir: her birim kaynaktan ancak ilk aşaması boşaldığında bir araba alır.
+    # keep_history=False iken tamamlanan arabalar özet toplamlarına (summary)
+    # eklendikten sonra bırakılır ve döngü geçmişi tutulmaz; bellek kullanımı
+    # araba sayısından bağımsız kalır.
+    #
+    # Kontrol noktaları: checkpoint_interval verilirse motor her bu kadar döngüde
+    # bir durumunu snapshot() ile saklar. seek() herhangi bir döngüye, en yakın
+    # önceki kontrol noktasını geri yükleyip en fazla checkpoint_interval döngüyü
+    # yeniden oynatarak gider. save_checkpoint() / restore_checkpoint() durumu
+    # diske yazar ve okur; geri yüklenen durumdan farklı parametrelerle devam
+    # edilebilir (dallanma).
+    #
+    # collect_stats=True iken gecikme dağılımı, kayan pencere verimliliği ve aşama
+    # doluluğu (stats.PipelineStats) simülasyon sürerken sabit bellekle tutulur.
+    # Aşama doluluğu her döngünün satırına baktığından varsayılan olarak kapalıdır.
+    #
+    # cache (ör. cache.SetAssociativeCache) verilirse boru hatlı birimde MEM'e giren
+    # her araba kendi adresine (load_source'un addresses akışından) erişir; ıskada
+    # araba MEM'de miss_penalty döngü fazladan kalır ve arkasındaki arabalar bekler.
+    # Hızlanma oranı adil olsun diye tek vuruşlu birim de aynı ayarlarla kurulmuş
+    # kendi önbelleğine (single_cycle_cache) aynı adres sırasıyla erişir ve ıskada
+    # MEM adımında aynı cezayı öder; iki önbellek aynı isabet / ıskaları görür.
+    #
+    # Kontrol tehlikeleri: predictor (ör. branch.TwoBitPredictor) verilirse dallanma
+    # olarak işaretlenmiş arabalar (load_source'un branches akışı) hatta girerken
+    # tahmin edilir ve EX'ten çıkarken çözülür. Tahmin yanlışsa arkasındaki arabalar
+    # hattan atılıp kuyruğun önüne geri konur ve hat penalty döngü yeni araba almaz.
+    # Tek vuruşlu birim dallanmayı sıradaki arabayı almadan önce çözdüğünden etkilenmez.
+    EVENTS = ('pipelined_complete', 'single_cycle_complete', 'finished', 'cycle')
+
+    def __init__(self, stages=STAGES, stage_latencies=None, forwarding=False, checkpoint_interval=None, collect_stats=False, issue_width=1, cache=None, predictor=None):
+        self.stages = stages
+        self.set_stage_latencies(stage_latencies)
+        if issue_width < 1:
+            raise ValueError("Hat genişliği en az 1 olmalıdır")
+        self.issue_width = issue_width
+        self.forwarding = forwarding
+        self.checkpoint_interval = checkpoint_interval
+        self.collect_stats = collect_stats
+        self.cache = cache
+        self.predictor = predictor
+        self.handlers = {event: [] for event in self.EVENTS}
+        self.reset()
+
+    def set_stage_latencies(self, stage_latencies):
+        if stage_latencies is None:
+            stage_latencies = [1] * len(self.stages)
+        if len(stage_latencies) != len(self.stages) or min(stage_latencies) < 1:
+            raise ValueError("Her aşama için en az 1 döngülük bir süre verilmelidir")
+        self.stage_latencies = list(stage_latencies)
+
+    def set_issue_width(self, issue_width):
+        # Aşama başına yuva sayısı; yalnızca simülasyon başlamadan değiştirilebilir
+        # ve motoru sıfırlar (load / load_source bundan sonra çağrılmalıdır)
+        if issue_width < 1:
+            raise ValueError("Hat genişliği en az 1 olmalıdır")
+        if issue_width == self.issue_width:
+            return
+        if self.cycle != 1:
+            raise ValueError("Hat genişliği simülasyon sürerken değiştirilemez")
+        self.issue_width = issue_width
+        self.reset()
+
+    def reset(self):
+        # Pipelined için değişkenler: aşama başına issue_width yuva,
+        # yuva = aşama * issue_width + sıra (aşama içinde arabalar yaş sırasıyla)
+        slots = len(self.stages) * self.issue_width
+        self.pipeline = [None] * slots
+        # Yuvadaki arabanın bir sonraki aşamaya geçmeye hazır olacağı döngü
+        self.ready_cycle = [0] * slots
+        self.in_flight = 0
+        self.instruction_queue = deque()
+        self.cycle = 1
+        self.instruction_history = []
+        # Akış kaynağı (load_source). Geçmiş tutulurken okunan arabalar
+        # instruction_history'de iki birimce paylaşılır ve tek yineleyici
+        # (pipelined_source) kullanılır; tutulmazken birimler kaynağı ayrı ayrı okur.
+        self.source = None
+        self.source_count = None
+        self.source_resumable = True
+        self.pipelined_source = None
+        self.single_cycle_source = None
+        # Birimlerin şimdiye kadar aldığı araba sayısı (= sıradaki arabanın indeksi)
+        self.pipelined_pulled = 0
+        self.single_cycle_pulled = 0
+        self.dependencies = None
+        self.addresses = None
+        self.single_cycle_addresses = None
+        self.branches = None
+        self.keep_history = True
+        if self.cache is not None:
+            self.cache.reset()
+        self.single_cycle_cache = None
+        if self.predictor is not None:
+            self.predictor.reset()
+        # Yanlış tahminden sonra hattın yeniden araba alabileceği ilk döngü
+        self.fetch_resume_cycle = 0
+        # Tamamlanan arabaların özet toplamları ve (isteğe bağlı) canlı istatistikler
+        self.summary = RunningSummary()
+        self.stats = PipelineStats(len(self.stages), self.issue_width) if self.collect_stats else None
+        # Döngü x yuva -> komut indeksi (EMPTY = boş yuva)
+        self.pipeline_history = CycleHistory(slots)
+
+        # Single cycle için değişkenler
+        self.single_cycle_queue = deque()
+        self.single_cycle_current = None
+        self.single_cycle_stage = 0
+        self.single_cycle_ready_cycle = 0
+        # Döngü -> (komut indeksi, aşama); birim boşsa (EMPTY, EMPTY)
+        self.single_cycle_history = CycleHistory(2)
+
+        # Bir şeyin değişebileceği döngüler (min-heap)
+        self.events = []
+        self.finished = False
+
+        # Nedene göre bekleme döngüleri ve son döngüde bekleyen (neden, komut) çiftleri
+        self.stall_cycles = dict.fromkeys(STALL_CAUSES, 0)
+        self.current_stalls = []
+        # Son kaydedilen (pipeline, single-cycle) satırları; atlanan döngüler için
+        self.last_rows = None
+
+        # Kontrol noktaları (döngüye göre sıralı) ve bir sonrakinin alınacağı döngü
+        self.checkpoints = []
+        self.checkpoint_cycles = []
+        self.next_checkpoint = 1
+
+    def subscribe(self, event, handler):
+        self.handlers[event].append(handler)
+
+    def unsubscribe(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, *args):
+        for handler in self.handlers[event]:
+            handler(*args)
+
+    def load(self, chassis_numbers, latencies=None):
+        # Talimatları kuyruğa ekle; latencies verilirse araba başına aşama süreleridir
+        for i, chassis_no in enumerate(chassis_numbers):
+            instr = Instruction(chassis_no, len(self.instruction_history))
+            if latencies is not None and latencies[i] is not None:
+                if len(latencies[i]) != len(self.stages) or min(latencies[i]) < 1:
+                    raise ValueError(f"{chassis_no} için geçersiz aşama süreleri: {latencies[i]}")
+                instr.latencies = tuple(latencies[i])
+            self.instruction_history.append(instr)
+
+    def load_source(self, source, count=None, dependencies=None, keep_history=True, addresses=None, branches=None):
+        # Arabaları bir şasi numarası kaynağından tembel olarak çek. Tekrar okunabilen
+        # kaynaklar (liste, workload.ChassisFile, workload.SyntheticChassis) geçmiş
+        # tutulmadığında her birim için ayrıca okunur; tek seferlik yineleyiciler
+        # (ör. standart girdi) tee ile paylaşılır ve yalnızca iki birim arasındaki
+        # fark kadar arabayı tamponlar.
+        # dependencies: (src_mask, dst_mask, is_load) üçlüleri üreten yineleyici
+        # (ör. workload.DependencyStream); addresses: MEM aşamasındaki erişim adresleri
+        # (ör. workload.AddressStream); branches: dallanma değilse None, dallanmaysa
+        # (pc, taken) üreten yineleyici (ör. workload.BranchStream); count: en fazla
+        # kaç araba çekileceği.
+        if dependencies is not None:
+            hazard_stages(len(self.stages))  # Kısa hatlarda bağımlılıklar sessizce düşmesin
+        self.source = source
+        self.source_count = count
+        self.source_resumable = iter(source) is not source
+        self.dependencies = None if dependencies is None else iter(dependencies)
+        self.addresses = None if addresses is None else iter(addresses)
+        # Tek vuruşlu birimin önbelleği boru hatlı birimin önbelleğinin başlangıç
+        # durumundaki kopyasıdır; geçmiş tutulmazken adresleri de ayrı bir kopyadan okur
+        self.single_cycle_cache = None if self.cache is None else copy.deepcopy(self.cache)
+        self.single_cycle_addresses = None
+        if addresses is not None and not keep_history:
+            self.single_cycle_addresses = copy.deepcopy(self.addresses)
+        self.branches = None if branches is None else iter(branches)
+        self.keep_history = keep_history
+        if keep_history:
+            self.pipelined_source = self.open_source(len(self.instruction_history))
+        elif self.source_resumable:
+            self.pipelined_source = self.open_source(0)
+            self.single_cycle_source = self.open_source(0)
+        else:
+            self.pipelined_source, self.single_cycle_source = itertools.tee(self.open_source(0))
+
+    def open_source(self, start):
+        # Kaynağı start. arabadan itibaren okuyan yineleyici
+        return itertools.islice(iter(self.source), start, self.source_count)
+
+    def fetch(self, index, pipelined):
+        # Birimin sıradaki (index.) arabası; kaynak bittiyse None
+        if self.keep_history:
+            if index < len(self.instruction_history):
+                return self.instruction_history[index]
+            source = self.pipelined_source  # Geçmiş tutulurken ortak yineleyici
+        else:
+            source = self.pipelined_source if pipelined else self.single_cycle_source
+        if source is None:
+            return None
+        chassis_no = next(source, None)
+        if chassis_no is None:
+            if pipelined or self.keep_history:
+                self.pipelined_source = None
+            else:
+                self.single_cycle_source = None
+            return None
+        instr = Instruction(chassis_no, index)
+        # Bağımlılıklar ve dallanmalar yalnızca boru hatlı birimi etkiler; önbellek
+        # adresleri iki birimde de kullanılır
+        if pipelined or self.keep_history:
+            if self.dependencies is not None:
+                instr.src_mask, instr.dst_mask, instr.is_load = next(self.dependencies)
+            if self.addresses is not None:
+                instr.address = next(self.addresses)
+            if self.branches is not None:
+                branch = next(self.branches)
+                if branch is not None:
+                    instr.branch_pc, instr.taken = branch
+        elif self.single_cycle_addresses is not None:
+            instr.address = next(self.single_cycle_addresses)
+        if self.keep_history:
+            self.instruction_history.append(instr)
+        return instr
+
+    def pull_pipelined(self):
+        # Boru hattının ilk aşaması boşaldığında sıradaki arabayı kuyruğa al
+        instr = self.fetch(self.pipelined_pulled, True)
+        if instr is None:
+            return False
+        self.pipelined_pulled += 1
+        self.instruction_queue.append(instr)
+        return True
+
+    def pull_single_cycle(self):
+        instr = self.fetch(self.single_cycle_pulled, False)
+        if instr is None:
+            return False
+        self.single_cycle_pulled += 1
+        self.single_cycle_queue.append(instr)
+        return True
+
+    def snapshot(self, full=False):
+        # Motorun şu anki döngünün başındaki tam durumu. Geçmiş tutulurken yalnızca
+        # hattaki / kuyruktaki arabaların durumu saklanır (tamamlananlar değişmez);
+        # full=True diske yazmak içindir ve tüm arabaları, geçmişi ve kaynağı içerir.
+        if not self.keep_history or full:
+            if not self.source_resumable and (self.pipelined_source is not None or self.single_cycle_source is not None):
+                raise ValueError("Tek seferlik bir kaynaktan (ör. standart girdi) okunan çalıştırma kaydedilemez")
+        pipelined = [instr for instr in self.pipeline if instr is not None] + list(self.instruction_queue)
+        single_cycle = list(self.single_cycle_queue)
+        if self.single_cycle_current is not None:
+            single_cycle.append(self.single_cycle_current)
+        snapshot = {
+            'version': CHECKPOINT_VERSION,
+            'full': full,
+            'stages': self.stages,
+            'issue_width': self.issue_width,
+            'stage_latencies': list(self.stage_latencies),
+            'forwarding': self.forwarding,
+            'keep_history': self.keep_history,
+            'cycle': self.cycle,
+            'finished': self.finished,
+            'pipeline': [None if instr is None else instr.index for instr in self.pipeline],
+            'ready_cycle': list(self.ready_cycle),
+            'in_flight': self.in_flight,
+            'instruction_queue': [instr.index for instr in self.instruction_queue],
+            'single_cycle_queue': [instr.index for instr in self.single_cycle_queue],
+            'single_cycle_current': None if self.single_cycle_current is None else self.single_cycle_current.index,
+            'single_cycle_stage': self.single_cycle_stage,
+            'single_cycle_ready_cycle': self.single_cycle_ready_cycle,
+            'pipelined_pulled': self.pipelined_pulled,
+            'single_cycle_pulled': self.single_cycle_pulled,
+            'pipelined_states': {instr.index: instr.get_state() for instr in pipelined},
+            'single_cycle_states': {instr.index: instr.get_state() for instr in single_cycle},
+            'events': list(self.events),
+            'stall_cycles': dict(self.stall_cycles),
+            'current_stalls': [(cause, instr.index) for cause, instr in self.current_stalls],
+            'summary': copy.copy(self.summary),
+            'stats': copy.deepcopy(self.stats),
+            'cache': copy.deepcopy(self.cache),
+            'single_cycle_cache': copy.deepcopy(self.single_cycle_cache),
+            'predictor': copy.deepcopy(self.predictor),
+            'fetch_resume_cycle': self.fetch_resume_cycle,
+        }
+        if not self.keep_history or full:
+            # Kaynağı kaldığı yerden yeniden açabilmek için
+            snapshot['source'] = self.source if self.pipelined_source is not None or self.single_cycle_source is not None else None
+            snapshot['source_count'] = self.source_count
+            snapshot['dependencies'] = copy.deepcopy(self.dependencies)
+            snapshot['addresses'] = copy.deepcopy(self.addresses)
+            snapshot['single_cycle_addresses'] = copy.deepcopy(self.single_cycle_addresses)
+            snapshot['branches'] = copy.deepcopy(self.branches)
+        if full and self.keep_history:
+            snapshot['instructions'] = [instr.get_state() for instr in self.instruction_history]
+            snapshot['pipeline_history'] = copy.deepcopy(self.pipeline_history)
+            snapshot['single_cycle_history'] = copy.deepcopy(self.single_cycle_history)
+        return snapshot
+
+    def restore(self, snapshot):
+        # snapshot() ile alınmış bir duruma dön. Sonraki kontrol noktaları atılır;
+        # geçmiş tutuluyorsa döngü geçmişi de bu döngüye kadar kısaltılır.
+        if snapshot.get('version') != CHECKPOINT_VERSION:
+            raise ValueError("Kontrol noktası bu sürümle uyumlu değil")
+        full = snapshot['full']
+        if not full and snapshot['keep_history'] != self.keep_history:
+            raise ValueError("Kontrol noktası bu çalıştırmaya ait değil")
+        self.stages = snapshot['stages']
+        self.issue_width = snapshot['issue_width']
+        self.stage_latencies = list(snapshot['stage_latencies'])
+        self.forwarding = snapshot['forwarding']
+        self.keep_history = snapshot['keep_history']
+        cycle = snapshot['cycle']
+
+        pipelined_states = snapshot['pipelined_states']
+        single_cycle_states = snapshot['single_cycle_states']
+        if self.keep_history:
+            if 'instructions' in snapshot:
+                self.instruction_history = [Instruction.from_state(state) for state in snapshot['instructions']]
+                self.pipeline_history = copy.deepcopy(snapshot['pipeline_history'])
+                self.single_cycle_history = copy.deepcopy(snapshot['single_cycle_history'])
+            else:
+                # Kontrol noktasından sonra birimlere giren arabaları geri al
+                history = self.instruction_history
+                for instr in history[snapshot['pipelined_pulled']:self.pipelined_pulled]:
+                    instr.reset_pipelined()
+                for instr in history[snapshot['single_cycle_pulled']:self.single_cycle_pulled]:
+                    instr.reset_single_cycle()
+                for states in (pipelined_states, single_cycle_states):
+                    for index, state in states.items():
+                        history[index].set_state(state)
+                self.pipeline_history.truncate(cycle - 1)
+                self.single_cycle_history.truncate(cycle - 1)
+            history = self.instruction_history
+            pipelined_lookup = single_cycle_lookup = history.__getitem__
+        else:
+            # Geçmiş yokken iki birim arabaların ayrı kopyalarını taşır
+            pipelined_objects = {index: Instruction.from_state(state) for index, state in pipelined_states.items()}
+            single_cycle_objects = {index: Instruction.from_state(state) for index, state in single_cycle_states.items()}
+            pipelined_lookup = pipelined_objects.__getitem__
+            single_cycle_lookup = single_cycle_objects.__getitem__
+            self.instruction_history = []
+            self.pipeline_history = CycleHistory(len(self.stages) * self.issue_width)
+            self.single_cycle_history = CycleHistory(2)
+
+        self.cycle = cycle
+        self.finished = snapshot['finished']
+        self.pipeline = [None if index is None else pipelined_lookup(index) for index in snapshot['pipeline']]
+        self.ready_cycle = list(snapshot['ready_cycle'])
+        self.in_flight = snapshot['in_flight']
+        self.instruction_queue = deque(pipelined_lookup(index) for index in snapshot['instruction_queue'])
+        self.single_cycle_queue = deque(single_cycle_lookup(index) for index in snapshot['single_cycle_queue'])
+        current = snapshot['single_cycle_current']
+        self.single_cycle_current = None if current is None else single_cycle_lookup(current)
+        self.single_cycle_stage = snapshot['single_cycle_stage']
+        self.single_cycle_ready_cycle = snapshot['single_cycle_ready_cycle']
+        self.pipelined_pulled = snapshot['pipelined_pulled']
+        self.single_cycle_pulled = snapshot['single_cycle_pulled']
+        self.events = list(snapshot['events'])
+        self.stall_cycles = dict(snapshot['stall_cycles'])
+        self.current_stalls = [(cause, pipelined_lookup(index)) for cause, index in snapshot['current_stalls']]
+        self.summary = copy.copy(snapshot['summary'])
+        self.stats = copy.deepcopy(snapshot['stats'])
+        self.cache = copy.deepcopy(snapshot['cache'])
+        self.single_cycle_cache = copy.deepcopy(snapshot['single_cycle_cache'])
+        self.predictor = copy.deepcopy(snapshot['predictor'])
+        self.fetch_resume_cycle = snapshot['fetch_resume_cycle']
+        self.last_rows = None
+
+        if 'source' in snapshot:
+            self.source = snapshot['source']
+            self.source_count = snapshot['source_count']
+            self.source_resumable = True
+            self.dependencies = copy.deepcopy(snapshot['dependencies'])
+            self.addresses = copy.deepcopy(snapshot['addresses'])
+            self.single_cycle_addresses = copy.deepcopy(snapshot['single_cycle_addresses'])
+            self.branches = copy.deepcopy(snapshot['branches'])
+            self.pipelined_source = self.single_cycle_source = None
+            if self.source is not None:
+                if self.keep_history:
+                    self.pipelined_source = self.open_source(len(self.instruction_history))
+                else:
+                    self.pipelined_source = self.open_source(self.pipelined_pulled)
+                    self.single_cycle_source = self.open_source(self.single_cycle_pulled)
+
+        # Bu döngüden sonraki kontrol noktaları artık geçersiz
+        keep = bisect.bisect_right(self.checkpoint_cycles, cycle) if not full else 0
+        del self.checkpoints[keep:]
+        del self.checkpoint_cycles[keep:]
+        if self.checkpoint_interval and self.checkpoint_cycles:
+            self.next_checkpoint = self.checkpoint_cycles[-1] + self.checkpoint_interval
+        else:
+            self.next_checkpoint = cycle
+
+    def take_checkpoint(self):
+        self.checkpoints.append(self.snapshot())
+        self.checkpoint_cycles.append(self.cycle)
+        self.next_checkpoint = self.cycle + self.checkpoint_interval
+
+    def seek(self, cycle):
+        # İlk `cycle` döngünün simüle edildiği duruma git. Geri gidilirken en yakın
+        # önceki kontrol noktası geri yüklenir ve kalan döngüler yeniden oynatılır;
+        # ileri gidilirken simülasyon kaldığı yerden ilerletilir.
+        target = cycle + 1
+        if target < self.cycle:
+            i = bisect.bisect_right(self.checkpoint_cycles, target) - 1
+            if i < 0:
+                raise ValueError(f"{cycle}. döngüden önce kontrol noktası yok")
+            self.restore(self.checkpoints[i])
+        if target > self.cycle:
+            self.run(max_cycles=target - self.cycle)
+        # Son döngüye gelindiyse bitişi hemen fark et (yeni döngü simüle edilmez).
+        # İlk döngüden sonra iki birimin birden boş kalması ancak arabalar bitince olur.
+        if not self.finished and self.cycle > 1 and self.is_idle():
+            self.step()
+        return self.cycle - 1
+
+    def save_checkpoint(self, path):
+        # Şu anki durumu diske yaz. Dosya pickle biçimindedir; yalnızca güvenilen
+        # kaynaklardan gelen dosyalar açılmalıdır.
+        with open(path, 'wb') as f:
+            pickle.dump(self.snapshot(full=True), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_checkpoint(self, path):
+        with open(path, 'rb') as f:
+            self.restore(pickle.load(f))
+
+    def latency(self, instr, stage):
+        if instr.latencies is not None:
+            return instr.latencies[stage]
+        return self.stage_latencies[stage]
+
+    def schedule(self, cycle):
+        heapq.heappush(self.events, cycle)
+
+    def next_event_cycle(self):
+        # Şu anki döngüden itibaren ilk olay zamanı (yoksa None)
+        events = self.events
+        while events and events[0] < self.cycle:
+            heapq.heappop(events)
+        return events[0] if events else None
+
+    def pending_writes(self, cycle):
+        # Skorbord: ID'den EX'e geçecek arabanın henüz okuyamayacağı yazmaçların maskesi.
+        # Yalnızca EX..MEM aşamalarına bakılır, bu yüzden aşama başına maliyet sabittir.
+        # Bağımlılıkların modellenemediği kısa hatlarda (bkz. hazard_stages) hiçbir
+        # arabanın hedef yazmacı yoktur.
+        if len(self.stages) < MIN_HAZARD_STAGES:
+            return 0
+        _, execute_stage, memory_stage = hazard_stages(len(self.stages))
+        pipeline = self.pipeline
+        width = self.issue_width
+        mask = 0
+        for slot in range(execute_stage * width, (memory_stage + 1) * width):
+            instr = pipeline[slot]
+            if instr is None or not instr.dst_mask:
+                continue
+            if not self.forwarding:
+                mask |= instr.dst_mask
+                continue
+            stage = slot // width
+            available = memory_stage if instr.is_load else execute_stage
+            if stage < available or (stage == available and self.ready_cycle[slot] > cycle):
+                mask |= instr.dst_mask
+        return mask
+
+    def is_idle(self):
+        if self.in_flight or self.single_cycle_current is not None:
+            return False
+        # İki birim de boş: kaynakta araba kalıp kalmadığına bak
+        return (not (self.instruction_queue or self.pull_pipelined()) and
+                not (self.single_cycle_queue or self.pull_single_cycle()))
+
+    def step(self):
+        # Bir döngü simüle et; simülasyon bittiyse False döner
+        if self.finished:
+            return False
+        if self.checkpoint_interval and self.cycle >= self.next_checkpoint:
+            self.take_checkpoint()
+        if self.is_idle():
+            self.finished = True
+            self.emit('finished')
+            return False
+
+        self.step_pipelined()
+        self.step_single_cycle()
+        if self.keep_history or self.stats is not None or self.handlers['cycle']:
+            self.record_cycle()
+        self.cycle += 1
+        return True
+
+    def record_cycle(self):
+        # Döngü sonundaki aşama doluluğunu geçmişe yaz ve 'cycle' abonelerine bildir
+        pipeline_row = tuple([EMPTY if instr is None else instr.index for instr in self.pipeline])
+        current = self.single_cycle_current
+        single_cycle_row = (EMPTY, EMPTY) if current is None else (current.index, self.single_cycle_stage)
+        if self.keep_history:
+            self.pipeline_history.append(pipeline_row)
+            self.single_cycle_history.append(single_cycle_row)
+        self.last_rows = (pipeline_row, single_cycle_row)
+        if self.stats is not None:
+            self.stats.add_cycle(pipeline_row, single_cycle_row, 1)
+        if self.handlers['cycle']:
+            self.emit('cycle', pipeline_row, single_cycle_row, 1)
+
+    def skip_to(self, cycle):
+        # Hiçbir şeyin değişmediği döngüleri tek seferde geç; geçmişe aynı satır tekrarlanır
+        count = cycle - self.cycle
+        if count <= 0:
+            return
+        if self.keep_history:
+            self.pipeline_history.repeat_last(count)
+            self.single_cycle_history.repeat_last(count)
+        if self.stats is not None:
+            self.stats.add_cycle(*self.last_rows, count)
+        if self.handlers['cycle']:
+            self.emit('cycle', *self.last_rows, count)
+        # Atlanan döngülerde de aynı arabalar aynı nedenle beklemeye devam eder
+        for cause, instr in self.current_stalls:
+            self.stall_cycles[cause] += count
+            instr.stall_cycles += count
+        self.cycle = cycle
+
+    def run(self, max_cycles=None):
+        # Simülasyonu bitene kadar (veya max_cycles döngü boyunca) tam hızda çalıştır.
+        # Olay olmayan döngüler atlanır; dönen değer ilerlenen döngü sayısıdır.
+        start = self.cycle
+        limit = None if max_cycles is None else start + max_cycles
+        while (limit is None or self.cycle < limit) and self.step():
+            next_cycle = self.next_event_cycle()
+            if next_cycle is not None and next_cycle > self.cycle:
+                if limit is not None and next_cycle > limit:
+                    next_cycle = limit
+                self.skip_to(next_cycle)
+        return self.cycle - start
+
+    def step_pipelined(self):
+        pipeline = self.pipeline
+        ready_cycle = self.ready_cycle
+        width = self.issue_width
+        cycle = self.cycle
+        # Test Sürüşü (WB) aşamasındaki arabaları, işi bittiyse program sırasıyla üretimden çıkar
+        last = len(pipeline) - width
+        retired = 0
+        for slot in range(last, len(pipeline)):
+            completed_instr = pipeline[slot]
+            if completed_instr is None or ready_cycle[slot] > cycle:
+                break
+            completed_instr.pipelined_end_cycle = cycle
+            completed_instr.pipelined_stage = None
+            pipeline[slot] = None
+            retired += 1
+            self.in_flight -= 1
+            self.summary.add_pipelined(completed_instr)
+            if self.stats is not None:
+                self.stats.add_pipelined(completed_instr, cycle)
+            if self.handlers['pipelined_complete']:
+                self.emit('pipelined_complete', completed_instr, cycle)
+        if retired and retired < width:
+            self.shift_stage(last, retired)
+
+        # İşi biten arabaları, sonraki aşamada boş yuva varsa ilerlet (sondan başa doğru).
+        # Bir aşamadaki arabalar yaş sırasıyla dizilir; öndeki araba ilerleyemezse
+        # arkasındakiler de onu geçemez (sıralı yürütme).
+        hazard_mask = self.pending_writes(cycle)
+        stalls = []
+        blocked_by = [None] * len(self.stages)
+        memory_stage = len(self.stages) - 2 if self.cache is not None else None
+        # Dallanmaların çözüldüğü (EX'ten sonraki) aşama
+        resolve_stage = min(EXECUTE_STAGE + 1, len(self.stages) - 1) if self.predictor is not None else None
+        for i in range(len(self.stages) - 1, 0, -1):
+            source = (i - 1) * width
+            if pipeline[source] is None:
+                continue
+            target_end = (i + 1) * width
+            free = None  # Sonraki aşamadaki ilk boş yuva (gerektiğinde bulunur)
+            moved = 0
+            waiting = None
+            for slot in range(source, source + width):
+                instr = pipeline[slot]
+                if instr is None:
+                    break
+                if ready_cycle[slot] > cycle:
+                    # Hâlâ çalışıyor; arkasındaki hazır arabalar yapısal olarak bekler
+                    waiting = waiting or 'structural'
+                    continue
+                if free is None:
+                    free = i * width
+                    while free < target_end and pipeline[free] is not None:
+                        free += 1
+                if waiting is not None:
+                    cause = waiting
+                elif free == target_end:
+                    # Sonraki aşama dolu: öndeki araba bekliyorsa aynı nedenle, hâlâ çalışıyorsa yapısal
+                    cause = blocked_by[i] or 'structural'
+                elif i == EXECUTE_STAGE and instr.src_mask & hazard_mask:
+                    # Skorbord bir döngü önceki durumu yansıttığından sonraki döngüde tekrar bakılmalı
+                    cause = 'data'
+                    self.schedule(cycle + 1)
+                else:
+                    pipeline[free] = instr
+                    pipeline[slot] = None
+                    instr.pipelined_stage = i
+                    ready_cycle[free] = cycle + self.latency(instr, i)
+                    if i == memory_stage and instr.address is not None:
+                        # Önbellek ıskası arabayı MEM'de bekletir
+                        ready_cycle[free] += self.cache.access(instr.address)
+                    self.schedule(ready_cycle[free])
+                    free += 1
+                    moved += 1
+                    if i == EXECUTE_STAGE:
+                        # Aynı döngüde EX'e geçen arkadaki arabalar bu sonucu henüz okuyamaz
+                        hazard_mask |= instr.dst_mask
+                    if i == resolve_stage and instr.branch_pc is not None and \
+                            self.predictor.resolve(instr.branch_pc, instr.taken, instr.predicted):
+                        # Yanlış tahmin: arkadaki arabalar (aynı gruptakiler dahil) yanlış
+                        # yoldan alınmış sayılır; bu aşamada ilerletilecek araba kalmadı
+                        self.flush(slot)
+                        break
+                    continue
+                if waiting is None:
+                    blocked_by[i-1] = cause
+                waiting = cause
+                stalls.append((cause, instr))
+                self.stall_cycles[cause] += 1
+                instr.stall_cycles += 1
+            if moved and moved < width:
+                self.shift_stage(source, moved)
+        self.current_stalls = stalls
+
+        # İlk aşamadaki boş yuvalara yeni arabaları al (yanlış tahmin cezası sürerken alınmaz)
+        if cycle < self.fetch_resume_cycle:
+            return
+        predictor = self.predictor
+        free = 0
+        while free < width and pipeline[free] is not None:
+            free += 1
+        while free < width and (self.instruction_queue or self.pull_pipelined()):
+            new_instr = self.instruction_queue.popleft()
+            if new_instr.pipelined_start_cycle is None:
+                new_instr.pipelined_start_cycle = cycle
+            new_instr.pipelined_stage = 0
+            if predictor is not None and new_instr.branch_pc is not None:
+                new_instr.predicted = predictor.predict(new_instr.branch_pc)
+            pipeline[free] = new_instr
+            self.in_flight += 1
+            ready_cycle[free] = cycle + self.latency(new_instr, 0)
+            self.schedule(ready_cycle[free])
+            free += 1
+
+    def flush(self, branch_slot):
+        # branch_slot'taki dallanmadan genç arabaları (aşamasında arkasındakiler ve
+        # önceki aşamaların tümü) hattan at ve yaş sırasıyla kuyruğun önüne geri koy;
+        # hat ceza süresince yeni araba almaz
+        pipeline = self.pipeline
+        width = self.issue_width
+        stage_base = branch_slot - branch_slot % width
+        younger = [range(branch_slot + 1, stage_base + width)]
+        younger += [range(base, base + width) for base in range(stage_base - width, -1, -width)]
+        flushed = []
+        for slots in younger:
+            for slot in slots:
+                instr = pipeline[slot]
+                if instr is None:
+                    continue
+                instr.pipelined_stage = None
+                pipeline[slot] = None
+                flushed.append(instr)
+        self.in_flight -= len(flushed)
+        self.instruction_queue.extendleft(reversed(flushed))
+        self.predictor.flushed += len(flushed)
+        self.fetch_resume_cycle = self.cycle + self.predictor.penalty
+        self.schedule(self.fetch_resume_cycle)
+
+    def shift_stage(self, base, count):
+        # Aşamanın önündeki `count` yuva boşaldı; kalan arabaları yaş sırasını bozmadan öne kaydır
+        pipeline = self.pipeline
+        ready_cycle = self.ready_cycle
+        end = base + self.issue_width
+        for slot in range(base, end - count):
+            pipeline[slot] = pipeline[slot + count]
+            ready_cycle[slot] = ready_cycle[slot + count]
+        for slot in range(end - count, end):
+            pipeline[slot] = None
+
+    def step_single_cycle(self):
+        cycle = self.cycle
+        # Eğer mevcut aşamanın işi bittiyse
+        current = self.single_cycle_current
+        if current and self.single_cycle_ready_cycle <= cycle:
+            if self.single_cycle_stage >= len(self.stages) - 1:  # Tüm aşamaları tamamladı
+                current.single_cycle_end_cycle = cycle
+                self.summary.add_single_cycle(current)
+                if self.stats is not None:
+                    self.stats.add_single_cycle(current, cycle)
+                self.single_cycle_current = None
+                self.single_cycle_stage = 0
+                if self.handlers['single_cycle_complete']:
+                    self.emit('single_cycle_complete', current, cycle)
+            else:
+                # Bir sonraki aşamaya geç
+                self.single_cycle_stage += 1
+                self.single_cycle_ready_cycle = cycle + self.latency(current, self.single_cycle_stage)
+                if (self.single_cycle_cache is not None and current.address is not None and
+                        self.single_cycle_stage == len(self.stages) - 2):
+                    # Önbellek ıskası MEM adımını boru hatlı birimdeki kadar uzatır
+                    self.single_cycle_ready_cycle += self.single_cycle_cache.access(current.address)
+                self.schedule(self.single_cycle_ready_cycle)
+
+        # Eğer işlem yoksa ve kuyrukta işlem varsa, yeni işlemi başlat
+        if self.single_cycle_current is None and (self.single_cycle_queue or self.pull_single_cycle()):
+            current = self.single_cycle_current = self.single_cycle_queue.popleft()
+            if current.single_cycle_start_cycle is None:
+                current.single_cycle_start_cycle = cycle
+            self.single_cycle_stage = 0
+            self.single_cycle_ready_cycle = cycle + self.latency(current, 0)
+            self.schedule(self.single_cycle_ready_cycle)
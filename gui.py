@@ -0,0 +1,1361 @@
+import sys
+import threading
+import time
+from functools import lru_cache
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QTableWidget, QTableWidgetItem, QTableView, QListWidget,
+    QLineEdit, QPushButton, QSpinBox, QMessageBox, QHeaderView,
+    QTabWidget, QGridLayout, QFrame, QCheckBox, QFileDialog, QSlider, QComboBox, QStyle
+)
+from PySide6.QtCore import Qt, QThread, QObject, Signal, QAbstractTableModel, QModelIndex, QEvent, QRect, QSize
+from PySide6.QtGui import QColor, QBrush, QPainter
+from PySide6.QtCharts import QChart, QChartView, QLineSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
+from branch import make_predictor
+from cache import POLICIES, SetAssociativeCache
+from engine import SimulationEngine, STAGES, STAGE_SHORT, STALL_CAUSES
+from profiler import ENGINE_PHASES, Profiler
+from stats import QUANTILES, THROUGHPUT_WINDOW
+from tracefile import TraceReader, export_trace
+from workload import AddressStream, BranchStream, ChassisFile, DependencyStream, SyntheticChassis
+
+# Daha koyu renkler kullan (arabalar yalnızca bu listedeki indeksi tutar)
+COLORS = [
+    (65, 105, 225),   # Koyu mavi
+    (34, 139, 34),    # Koyu yeşil
+    (255, 140, 0),    # Koyu turuncu
+    (220, 20, 60),    # Koyu kırmızı
+    (148, 0, 211),    # Koyu mor
+    (139, 69, 19),    # Kahverengi
+]
+WHITE = QColor(255, 255, 255)
+ROW_HEIGHT = 56  # İki satırlık hücre metni için sabit satır yüksekliği
+COLUMN_WIDTH = 120  # Araba sütunlarının sabit genişliği
+# Döngü tablolarının başlık boyutlarını belirleyen en uzun örnek başlık metinleri
+HEADER_SAMPLES = {Qt.Vertical: "Döngü 9999999", Qt.Horizontal: "Komut #999999\nSH-999999"}
+FRAME_INTERVAL = 1 / 60  # Ekran en fazla saniyede 60 kez yenilenir
+TURBO_BATCH = 10000  # Sonuna kadar çalıştırırken iptal/duraklatma kontrolleri arasındaki döngü sayısı
+MAX_COUNT = 100000  # Araba sayısı üst sınırı (arabalar kaynaktan hat boşaldıkça çekilir)
+CHECKPOINT_INTERVAL = 256  # Zaman çizelgesinde atlarken en fazla yeniden oynatılan döngü sayısı
+CHART_POINTS = 600  # Verimlilik grafiğinde tutulan en fazla nokta (eski noktalar soldan atılır)
+UNITS = (('pipelined', "Boru Hatlı"), ('single_cycle', "Tek Vuruşlu"))
+# Dallanma tahmincisi seçenekleri: (branch.PREDICTORS adı, görünen ad)
+PREDICTOR_CHOICES = (
+    ('2bit', "2 Bitlik Sayaç"), ('gshare', "Gshare"), ('1bit', "1 Bitlik"),
+    ('taken', "Statik: Alınır"), ('not-taken', "Statik: Alınmaz"),
+)
+# Profil açıkken zamanlanan arayüz metotları (motor aşamaları profiler.ENGINE_PHASES).
+# Sinyal yuvası olan apply_progress sarmalanmaz, kendi içinde profiler.phase ile ölçülür.
+GUI_PHASES = (
+    'update_pipelined_table', 'update_single_cycle_table', 'update_comparison_rows',
+    'show_completions', 'update_live_stats', 'update_timeline', 'update_performance_summary', 'refresh_views',
+)
+MODEL_PHASES = ('sync', 'reload')
+SUMMARY_PLACEHOLDER = "Simülasyon Başladığında Performans Ölçüleri Burada Gösterilecek"
+
+
+@lru_cache(maxsize=None)
+def palette_brush(color_index):
+    # Paletteki rengin fırçası; ilk çizildiğinde bir kez oluşturulur ve tüm hücrelerce paylaşılır
+    return QBrush(QColor(*COLORS[color_index]))
+
+
+class FixedHintHeader(QHeaderView):
+    # Qt başlığın boyut önerisini (sizeHint) her satır / sütun eklenişinde ilk ve son
+    # yüz kadar bölümün headerData'sını rol başına sorarak yeniden hesaplar; döngü
+    # tablosunda bu, her döngüde yüzlerce Python çağrısı demektir. Başlık metinlerinin
+    # biçimi sabit olduğundan öneri en uzun örnek metinden bir kez hesaplanır.
+    def __init__(self, orientation, sample, parent=None):
+        super().__init__(orientation, parent)
+        self.sample = sample
+        self.hint = None
+        self.setSectionsClickable(True)
+        self.setHighlightSections(True)
+
+    def sizeHint(self):
+        if self.hint is None:
+            self.ensurePolished()
+            margin = 2 * self.style().pixelMetric(QStyle.PM_HeaderMargin, None, self) + 2
+            text = self.fontMetrics().boundingRect(QRect(), Qt.AlignCenter, self.sample)
+            if self.orientation() == Qt.Vertical:
+                self.hint = QSize(text.width() + margin, self.defaultSectionSize())
+            else:
+                self.hint = QSize(self.defaultSectionSize(), text.height() + margin)
+        return self.hint
+
+    def changeEvent(self, event):
+        # Yazı tipi veya stil değişince öneri yeniden hesaplanır
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self.hint = None
+        super().changeEvent(event)
+
+
+class SimulationTableModel(QAbstractTableModel):
+    # Döngü x araba tablosu. Hücreler saklanmaz; metin ve renk, görünüm
+    # istedikçe motorun geçmişinden hesaplanır. Motor yerine aynı alanları
+    # sunan bir iz dosyası (TraceReader) da gösterilebilir.
+    def __init__(self, engine, single_cycle=False, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.single_cycle = single_cycle
+        self.rows = 0
+        self.columns = 0
+        if single_cycle:
+            self.waiting_tooltip = "Bu araba henüz işleme alınmadı"
+        else:
+            self.waiting_tooltip = "Bu araba henüz üretim hattına girmedi"
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.columns
+
+    def set_engine(self, engine):
+        # Gösterilen kaynağı değiştir (motor veya iz dosyası)
+        self.engine = engine
+        self.reload()
+
+    def reload(self):
+        # Motor sıfırlandığında veya yeni komutlar yüklendiğinde çağrılır
+        self.beginResetModel()
+        self.rows = len(self.history())
+        self.columns = len(self.engine.instruction_history)
+        self.endResetModel()
+
+    def sync(self, total=None, columns=None):
+        # Motorun geçmişine eklenen yeni döngüleri satır, kaynaktan yeni çekilen
+        # arabaları sütun olarak bildir
+        if columns is None:
+            columns = len(self.engine.instruction_history)
+        if columns > self.columns:
+            self.beginInsertColumns(QModelIndex(), self.columns, columns - 1)
+            self.columns = columns
+            self.endInsertColumns()
+        if total is None:
+            total = len(self.history())
+        if total > self.rows:
+            self.beginInsertRows(QModelIndex(), self.rows, total - 1)
+            self.rows = total
+            self.endInsertRows()
+
+    def history(self):
+        if self.single_cycle:
+            return self.engine.single_cycle_history
+        return self.engine.pipeline_history
+
+    def cell_state(self, row, instruction):
+        # (aşama indeksi veya None, tamamlandı mı) döndürür
+        cycle = row + 1
+        if self.single_cycle:
+            current, stage = self.engine.single_cycle_history[row]
+            if current == instruction.index:
+                return stage, False
+            end_cycle = instruction.single_cycle_end_cycle
+        else:
+            # Satır yuva düzenindedir: aşama başına issue_width yuva
+            slots = self.engine.pipeline_history[row]
+            if instruction.index in slots:
+                return slots.index(instruction.index) // self.engine.issue_width, False
+            end_cycle = instruction.pipelined_end_cycle
+        return None, end_cycle is not None and end_cycle <= cycle
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        instruction = self.engine.instruction_history[index.column()]
+        stage_index, completed = self.cell_state(index.row(), instruction)
+        if stage_index is not None:
+            # Bu instruction bu döngüde işleniyor
+            if role == Qt.DisplayRole:
+                return f"{STAGE_SHORT[stage_index]}\n🚗 {instruction.chassis_no}"
+            if role == Qt.BackgroundRole:
+                return palette_brush(instruction.color_index)
+            if role == Qt.ForegroundRole:
+                return WHITE
+            if role == Qt.ToolTipRole:
+                return f"Şasi: {instruction.chassis_no}, Aşama: {STAGES[stage_index]}"
+        elif completed:
+            if role == Qt.DisplayRole:
+                return "✅"
+            if role == Qt.ToolTipRole:
+                return f"{instruction.chassis_no} üretim hattından çıktı"
+        else:
+            if role == Qt.DisplayRole:
+                return ""
+            if role == Qt.ToolTipRole:
+                return self.waiting_tooltip
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            instr = self.engine.instruction_history[section]
+            return f"Komut #{section+1}\n{instr.chassis_no}"
+        return f"Döngü {section+1}"
+
+
+class SimulationWorker(QObject):
+    # Motoru arayüzden ayrı bir QThread üzerinde çalıştırır. İlerleme, en fazla
+    # kare başına bir kez, yalnızca değişiklikleri taşıyan küçük bir sözlükle
+    # (delta) ana iş parçacığına bildirilir.
+    progress = Signal(object)
+    done = Signal(object)
+
+    def __init__(self, engine, delay_ms, cycles_per_batch, turbo=False):
+        super().__init__()
+        self.engine = engine
+        self.delay_ms = delay_ms
+        self.cycles_per_batch = cycles_per_batch
+        self.turbo = turbo
+        self.paused = False
+        self.cancelled = False
+        # Bekleme / duraklatma sırasında iş parçacığını hemen uyandırmak için
+        self.wake = threading.Event()
+        # Son bildirimden bu yana tamamlanan (komut indeksi, döngü) çiftleri
+        self.pending_pipelined = []
+        self.pending_single_cycle = []
+
+    def pause(self):
+        self.paused = True
+        self.wake.set()
+
+    def resume(self):
+        self.paused = False
+        self.wake.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self.wake.set()
+
+    def set_speed(self, delay_ms, cycles_per_batch):
+        self.delay_ms = delay_ms
+        self.cycles_per_batch = cycles_per_batch
+        self.wake.set()
+
+    def run_to_end(self):
+        self.turbo = True
+        self.paused = False
+        self.wake.set()
+
+    def on_pipelined_complete(self, instr, cycle):
+        self.pending_pipelined.append((instr.index, cycle))
+
+    def on_single_cycle_complete(self, instr, cycle):
+        self.pending_single_cycle.append((instr.index, cycle))
+
+    def flush(self):
+        engine = self.engine
+        delta = {
+            'worker': self,
+            'cycle': engine.cycle,
+            'rows': len(engine.pipeline_history),
+            'columns': len(engine.instruction_history),
+            'pipelined': self.pending_pipelined,
+            'single_cycle': self.pending_single_cycle,
+            # İstatistikler motorla aynı iş parçacığında okunur
+            'stats': None if engine.stats is None else engine.stats.metrics(engine.cycle - 1),
+        }
+        self.pending_pipelined = []
+        self.pending_single_cycle = []
+        self.progress.emit(delta)
+
+    def run(self):
+        engine = self.engine
+        engine.subscribe('pipelined_complete', self.on_pipelined_complete)
+        engine.subscribe('single_cycle_complete', self.on_single_cycle_complete)
+        last_flush = time.perf_counter()
+        try:
+            while not self.cancelled:
+                if self.paused:
+                    self.flush()
+                    self.wake.wait()
+                    self.wake.clear()
+                    continue
+
+                if self.turbo:
+                    # Ara durumları bildirmeden tam hızda ilerle
+                    engine.run(max_cycles=TURBO_BATCH)
+                else:
+                    engine.run(max_cycles=self.cycles_per_batch)
+                if engine.finished:
+                    break
+                if self.turbo:
+                    continue
+
+                now = time.perf_counter()
+                if now - last_flush >= FRAME_INTERVAL:
+                    self.flush()
+                    last_flush = now
+                if self.delay_ms:
+                    self.wake.wait(self.delay_ms / 1000)
+                    self.wake.clear()
+        finally:
+            engine.unsubscribe('pipelined_complete', self.on_pipelined_complete)
+            engine.unsubscribe('single_cycle_complete', self.on_single_cycle_complete)
+            if not self.cancelled:
+                self.flush()
+            self.done.emit(self)
+
+
+class ThroughputChart(QChart):
+    # Kayan pencere verimliliği; her kare yeni bir nokta eklenir
+    def __init__(self):
+        super().__init__()
+        self.setTitle(f"Verimlilik (son {THROUGHPUT_WINDOW} döngü, araç/döngü)")
+        self.axis_x = QValueAxis()
+        self.axis_x.setLabelFormat("%d")
+        self.axis_x.setTitleText("Döngü")
+        self.axis_y = QValueAxis()
+        self.addAxis(self.axis_x, Qt.AlignBottom)
+        self.addAxis(self.axis_y, Qt.AlignLeft)
+        self.series = {}
+        for key, name in UNITS:
+            series = QLineSeries()
+            series.setName(name)
+            self.addSeries(series)
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y)
+            self.series[key] = series
+        self.clear()
+
+    def clear(self):
+        for series in self.series.values():
+            series.clear()
+        self.peak = 1.0
+        self.axis_x.setRange(0, 1)
+        self.axis_y.setRange(0, self.peak)
+
+    def add_point(self, cycle, stats):
+        for key, series in self.series.items():
+            if series.count() and series.at(series.count() - 1).x() >= cycle:
+                continue  # Duraklatılmışken aynı döngü tekrar bildirilebilir
+            value = stats[f'{key}_window_throughput']
+            series.append(cycle, value)
+            if series.count() > CHART_POINTS:
+                series.removePoints(0, series.count() - CHART_POINTS)
+            self.peak = max(self.peak, value)
+        self.update_range(cycle)
+
+    def truncate(self, cycle):
+        # Zaman çizelgesinde geri gidildiğinde sonraki noktaları sil
+        for series in self.series.values():
+            count = series.count()
+            while count and series.at(count - 1).x() > cycle:
+                count -= 1
+            series.removePoints(count, series.count() - count)
+        self.update_range(cycle)
+
+    def update_range(self, cycle):
+        series = self.series['pipelined']
+        first = series.at(0).x() if series.count() else 0
+        self.axis_x.setRange(first, max(cycle, first + 1))
+        self.axis_y.setRange(0, self.peak)
+
+
+class UnitBarChart(QChart):
+    # İki birimin değerlerini kategori başına yan yana gösteren çubuk grafik;
+    # maximum None ise eksen en büyük değere göre büyür
+    def __init__(self, title, categories, maximum=None):
+        super().__init__()
+        self.setTitle(title)
+        self.maximum = maximum
+        series = QBarSeries()
+        self.sets = {}
+        for key, name in UNITS:
+            bar_set = QBarSet(name)
+            bar_set.append([0.0] * len(categories))
+            series.append(bar_set)
+            self.sets[key] = bar_set
+        self.addSeries(series)
+        axis_x = QBarCategoryAxis()
+        axis_x.append(list(categories))
+        self.axis_y = QValueAxis()
+        self.addAxis(axis_x, Qt.AlignBottom)
+        self.addAxis(self.axis_y, Qt.AlignLeft)
+        series.attachAxis(axis_x)
+        series.attachAxis(self.axis_y)
+        self.axis_y.setRange(0, maximum or 1)
+
+    def set_values(self, key, values):
+        bar_set = self.sets[key]
+        for i, value in enumerate(values):
+            bar_set.replace(i, value or 0.0)
+        if self.maximum is None:
+            peak = max(bar_set.at(i) for bar_set in self.sets.values() for i in range(bar_set.count()))
+            self.axis_y.setRange(0, max(1.0, peak * 1.1))
+
+    def clear(self):
+        for key, bar_set in self.sets.items():
+            self.set_values(key, [0.0] * bar_set.count())
+
+
+class PipelineSimulator(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("İşlemci Simülatörü - Karşılaştırma Görünümü")
+        self.setMinimumSize(1200, 700)
+
+        # Simülasyon durumu Qt'den bağımsız motorda tutulur
+        self.engine = SimulationEngine(STAGES, checkpoint_interval=CHECKPOINT_INTERVAL, collect_stats=True)
+        self.pipeline_model = SimulationTableModel(self.engine)
+        self.single_cycle_model = SimulationTableModel(self.engine, single_cycle=True)
+
+        # Şasi numaralarının okunacağı dosya (None ise giriş alanı veya otomatik)
+        self.chassis_file = None
+        # Zaman çizelgesinde ulaşılan en ileri döngü
+        self.timeline_max = 0
+        # Görüntülenen iz dosyası (None ise tablolar motoru gösterir)
+        self.trace = None
+
+        # Simülasyonu çalıştıran arka plan iş parçacığı
+        self.worker = None
+        self.worker_thread = None
+
+        # Aşama zamanlaması (None = kapalı; kapalıyken hiçbir metot sarmalanmaz)
+        self.profiler = None
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        main_layout = QVBoxLayout(main_widget)
+        
+        # Genel font stilini artır
+        app_font = QApplication.font()
+        app_font.setPointSize(12)  # Temel font boyutu
+        QApplication.setFont(app_font)
+
+        # Giriş alanı
+        input_layout = QHBoxLayout()
+        self.chassis_input = QLineEdit()
+        self.chassis_input.setPlaceholderText("Şasi numaraları (virgülle ayır)")
+        self.chassis_input.setStyleSheet("font-size: 17px;")
+        
+        chassis_label = QLabel("Şasi No Gir (Opsiyonel):")
+        chassis_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        input_layout.addWidget(chassis_label)
+        input_layout.addWidget(self.chassis_input)
+
+        self.chassis_file_button = QPushButton("Dosyadan Oku")
+        self.chassis_file_button.setToolTip("Şasi numaralarını bir dosyadan, simülasyon ilerledikçe oku")
+        self.chassis_file_button.clicked.connect(self.choose_chassis_file)
+        self.chassis_file_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        input_layout.addWidget(self.chassis_file_button)
+
+        self.count_input = QSpinBox()
+        self.count_input.setMinimum(1)
+        self.count_input.setMaximum(MAX_COUNT)
+        self.count_input.setValue(5)
+        self.count_input.setStyleSheet("font-size: 17px;")
+        
+        count_label = QLabel("Araba Sayısı:")
+        count_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        input_layout.addWidget(count_label)
+        input_layout.addWidget(self.count_input)
+
+        self.latency_input = QLineEdit()
+        self.latency_input.setPlaceholderText(",".join("1" for _ in STAGES))
+        self.latency_input.setToolTip("Her aşamanın kaç döngü sürdüğü (" + ", ".join(STAGE_SHORT) + ")")
+        self.latency_input.setStyleSheet("font-size: 17px;")
+        
+
+        self.start_button = QPushButton("Başlat")
+        self.start_button.clicked.connect(self.start_simulation)
+        self.start_button.setStyleSheet("font-size: 17px; font-weight: bold; padding: 5px 10px;")
+        input_layout.addWidget(self.start_button)
+
+        self.reset_button = QPushButton("Sıfırla")
+        self.reset_button.clicked.connect(self.reset_simulation)
+        self.reset_button.setStyleSheet("font-size: 17px; font-weight: bold; padding: 5px 10px;")
+        input_layout.addWidget(self.reset_button)
+
+        self.pause_button = QPushButton("Duraklat")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        self.pause_button.setStyleSheet("font-size: 17px; font-weight: bold; padding: 5px 10px;")
+        input_layout.addWidget(self.pause_button)
+
+        self.turbo_button = QPushButton("Sonuna Kadar Çalıştır")
+        self.turbo_button.clicked.connect(self.run_to_end)
+        self.turbo_button.setStyleSheet("font-size: 17px; font-weight: bold; padding: 5px 10px;")
+        input_layout.addWidget(self.turbo_button)
+
+        speed_layout = QHBoxLayout()
+        speed_label = QLabel("Hız:")
+        speed_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        speed_layout.addWidget(speed_label)
+        
+        self.speed_slider = QSpinBox()
+        self.speed_slider.setMinimum(0)
+        self.speed_slider.setMaximum(2000)
+        self.speed_slider.setValue(1000)
+        self.speed_slider.setSingleStep(100)
+        self.speed_slider.setSuffix(" ms")
+        self.speed_slider.setStyleSheet("font-size: 17px;")
+        self.speed_slider.valueChanged.connect(self.update_worker_speed)
+        speed_layout.addWidget(self.speed_slider)
+
+        # Zamanlayıcının her tetiklenişinde simüle edilecek döngü sayısı
+        self.cycles_per_tick = QSpinBox()
+        self.cycles_per_tick.setMinimum(1)
+        self.cycles_per_tick.setMaximum(100000)
+        self.cycles_per_tick.setValue(1)
+        self.cycles_per_tick.setSuffix(" döngü/adım")
+        self.cycles_per_tick.setStyleSheet("font-size: 17px;")
+        self.cycles_per_tick.valueChanged.connect(self.update_worker_speed)
+        speed_layout.addWidget(self.cycles_per_tick)
+        input_layout.addLayout(speed_layout)
+
+        main_layout.addLayout(input_layout)
+
+        # Hat ayarları: aşama süreleri ve veri bağımlılıkları
+        config_layout = QHBoxLayout()
+        latency_label = QLabel("Aşama Süreleri:")
+        latency_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(latency_label)
+        config_layout.addWidget(self.latency_input)
+
+        self.hazard_input = QSpinBox()
+        self.hazard_input.setMinimum(0)
+        self.hazard_input.setMaximum(100)
+        self.hazard_input.setValue(0)
+        self.hazard_input.setSuffix(" %")
+        self.hazard_input.setToolTip("Bir arabanın hemen önündeki arabalardan birinin sonucuna bağımlı olma olasılığı")
+        self.hazard_input.setStyleSheet("font-size: 17px;")
+
+        hazard_label = QLabel("Bağımlılık Oranı:")
+        hazard_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(hazard_label)
+        config_layout.addWidget(self.hazard_input)
+
+        self.width_input = QSpinBox()
+        self.width_input.setMinimum(1)
+        self.width_input.setMaximum(4)
+        self.width_input.setValue(1)
+        self.width_input.setToolTip("Her aşamadaki istasyon sayısı; bir döngüde hatta en fazla bu kadar araba girer ve çıkar")
+        self.width_input.setStyleSheet("font-size: 17px;")
+
+        width_label = QLabel("Genişlik (W):")
+        width_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(width_label)
+        config_layout.addWidget(self.width_input)
+
+        self.branch_input = QSpinBox()
+        self.branch_input.setMinimum(0)
+        self.branch_input.setMaximum(100)
+        self.branch_input.setValue(0)
+        self.branch_input.setSuffix(" %")
+        self.branch_input.setToolTip("Bir arabanın dallanma olma olasılığı; yanlış tahmin edilen dallanmanın arkasındaki arabalar hattan atılır")
+        self.branch_input.setStyleSheet("font-size: 17px;")
+
+        branch_label = QLabel("Dallanma Oranı:")
+        branch_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(branch_label)
+        config_layout.addWidget(self.branch_input)
+
+        self.predictor_input = QComboBox()
+        for name, label in PREDICTOR_CHOICES:
+            self.predictor_input.addItem(label, name)
+        self.predictor_input.setToolTip("IF aşamasında dallanmaların sonucunu tahmin eden yöntem")
+        self.predictor_input.setStyleSheet("font-size: 17px;")
+        config_layout.addWidget(self.predictor_input)
+
+        self.cache_input = QSpinBox()
+        self.cache_input.setMinimum(0)
+        self.cache_input.setMaximum(1 << 20)
+        self.cache_input.setSingleStep(256)
+        self.cache_input.setValue(0)
+        self.cache_input.setSuffix(" B")
+        self.cache_input.setSpecialValueText("Kapalı")
+        self.cache_input.setToolTip("MEM aşamasının arkasındaki önbelleğin boyu (bayt, 2'nin kuvveti); ıskada araba MEM'de fazladan bekler")
+        self.cache_input.setStyleSheet("font-size: 17px;")
+
+        cache_label = QLabel("Önbellek:")
+        cache_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(cache_label)
+        config_layout.addWidget(self.cache_input)
+
+        self.cache_ways_input = QSpinBox()
+        self.cache_ways_input.setMinimum(1)
+        self.cache_ways_input.setMaximum(16)
+        self.cache_ways_input.setValue(2)
+        self.cache_ways_input.setSuffix(" yol")
+        self.cache_ways_input.setToolTip("Önbelleğin set başına yol sayısı (2'nin kuvveti)")
+        self.cache_ways_input.setStyleSheet("font-size: 17px;")
+        config_layout.addWidget(self.cache_ways_input)
+
+        self.cache_policy_input = QComboBox()
+        for policy in POLICIES:
+            self.cache_policy_input.addItem(policy.upper(), policy)
+        self.cache_policy_input.setToolTip("Set dolduğunda hangi satırın çıkarılacağı")
+        self.cache_policy_input.setStyleSheet("font-size: 17px;")
+        config_layout.addWidget(self.cache_policy_input)
+
+        self.forwarding_input = QCheckBox("Yönlendirme (Forwarding)")
+        self.forwarding_input.setStyleSheet("font-size: 17px; font-weight: bold;")
+        config_layout.addWidget(self.forwarding_input)
+        config_layout.addStretch()
+
+        main_layout.addLayout(config_layout)
+
+        # Ana simülasyon alanı
+        tab_widget = QTabWidget()
+        tab_widget.setStyleSheet("QTabBar::tab { font-size: 18px; font-weight: bold; height: 30px; }")
+        
+        # Tab 1: Pipeline Görünümü
+        pipeline_tab = QWidget()
+        pipeline_layout = QVBoxLayout(pipeline_tab)
+        
+        # İki simülasyonun yan yana görünümü
+        simulation_layout = QHBoxLayout()
+        
+        # Sol taraf: Pipelined işlemci
+        pipelined_layout = QVBoxLayout()
+        pipelined_title = QLabel("Boru Hatlı (Pipelined) İşlemci Simülasyonu")
+        pipelined_title.setAlignment(Qt.AlignCenter)
+        pipelined_title.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px;")
+        pipelined_layout.addWidget(pipelined_title)
+        
+        self.pipeline_table = self.make_cycle_table(self.pipeline_model)
+        pipelined_layout.addWidget(self.pipeline_table)
+        
+        # Pipelined çıktı listesi
+        pipelined_out_layout = QVBoxLayout()
+        pipelined_out_label = QLabel("Üretilen Arabalar 🚘")
+        pipelined_out_label.setAlignment(Qt.AlignCenter)
+        pipelined_out_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        pipelined_out_layout.addWidget(pipelined_out_label)
+        
+        self.pipelined_output_list = QListWidget()
+        self.pipelined_output_list.setStyleSheet("font-size: 17px;")
+        pipelined_out_layout.addWidget(self.pipelined_output_list)
+        pipelined_layout.addLayout(pipelined_out_layout)
+        
+        simulation_layout.addLayout(pipelined_layout, 1)
+        
+        # Ayırıcı çizgi
+        line = QFrame()
+        line.setFrameShape(QFrame.VLine)
+        line.setFrameShadow(QFrame.Sunken)
+        simulation_layout.addWidget(line)
+        
+        # Sağ taraf: Tek vuruşlu işlemci
+        single_cycle_layout = QVBoxLayout()
+        single_cycle_title = QLabel("Tek Vuruşlu (Single-Cycle) İşlemci Simülasyonu")
+        single_cycle_title.setAlignment(Qt.AlignCenter)
+        single_cycle_title.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px;")
+        single_cycle_layout.addWidget(single_cycle_title)
+        
+        self.single_cycle_table = self.make_cycle_table(self.single_cycle_model)
+        single_cycle_layout.addWidget(self.single_cycle_table)
+        
+        # Tek vuruşlu çıktı listesi
+        single_cycle_out_layout = QVBoxLayout()
+        single_cycle_out_label = QLabel("Üretilen Arabalar 🚘")
+        single_cycle_out_label.setAlignment(Qt.AlignCenter)
+        single_cycle_out_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        single_cycle_out_layout.addWidget(single_cycle_out_label)
+        
+        self.single_cycle_output_list = QListWidget()
+        self.single_cycle_output_list.setStyleSheet("font-size: 17px;")
+        single_cycle_out_layout.addWidget(self.single_cycle_output_list)
+        single_cycle_layout.addLayout(single_cycle_out_layout)
+        
+        simulation_layout.addLayout(single_cycle_layout, 1)
+        
+        pipeline_layout.addLayout(simulation_layout)
+        
+        # Tab 2: Performans Karşılaştırması
+        comparison_tab = QWidget()
+        comparison_layout = QVBoxLayout(comparison_tab)
+        
+        performance_title = QLabel("İşlemci Mimarileri Performans Karşılaştırması")
+        performance_title.setAlignment(Qt.AlignCenter)
+        performance_title.setStyleSheet("font-size: 18px; font-weight: bold; margin: 18px;")
+        comparison_layout.addWidget(performance_title)
+
+        # Canlı grafikler: simülasyon sürerken her karede güncellenir
+        charts_layout = QHBoxLayout()
+        self.throughput_chart = ThroughputChart()
+        self.latency_chart = UnitBarChart("Gecikme Dağılımı (döngü)", ["Ortalama"] + [f"p{round(p * 100)}" for p in QUANTILES])
+        self.utilization_chart = UnitBarChart("Aşama Kullanımı (%)", STAGE_SHORT, maximum=100)
+        for chart in (self.throughput_chart, self.latency_chart, self.utilization_chart):
+            chart_view = QChartView(chart)
+            chart_view.setRenderHint(QPainter.Antialiasing)
+            chart_view.setMinimumHeight(260)
+            charts_layout.addWidget(chart_view)
+        comparison_layout.addLayout(charts_layout)
+
+        table_layout = QHBoxLayout()
+        self.comparison_table = QTableWidget()
+        self.comparison_table.setColumnCount(5)
+        self.comparison_table.setHorizontalHeaderLabels(["Araç", "Boru Hatlı Tamamlanma", "Tek Vuruşlu Tamamlanma", "Hızlanma Oranı", "Boru Hatlı Bekleme"])
+        header = self.comparison_table.horizontalHeader()
+        for i in range(5):
+            header.setSectionResizeMode(i, QHeaderView.Stretch)
+        self.comparison_table.setStyleSheet("QTableWidget { font-size: 17px; } QHeaderView::section { font-size: 18px; font-weight: bold; }")
+        table_layout.addWidget(self.comparison_table, 3)
+        
+        # Performans özeti alanı (simülasyon sürerken güncellenir)
+        self.summary_label = QLabel(SUMMARY_PLACEHOLDER)
+        self.summary_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.summary_label.setWordWrap(True)
+        self.summary_label.setStyleSheet("font-size: 16px; margin: 10px;")
+        table_layout.addWidget(self.summary_label, 2)
+        comparison_layout.addLayout(table_layout)
+
+        theory_label = QLabel(
+            f"<b>Teorik Açıklama:</b> "
+            f"Boru hatlı (pipelined) işlemci, komutları (araç üretim aşamalarını) bir montaj hattı gibi düşünerek, farklı aşamalardaki komutları eş zamanlı olarak işler. "
+            f"Bu sayede, tek bir komutun tamamlanma süresi (gecikme/latency) azalmasa da, birim zamanda tamamlanan komut sayısı (verim/throughput) önemli ölçüde artar.<br>"
+            f"<b>- Gecikme (Latency):</b> Bir aracın üretim hattına girmesinden çıkmasına kadar geçen toplam süredir.<br>"
+            f"<b>- Verim (Throughput):</b> Birim zamanda üretim hattından çıkan araç sayısıdır; grafikte son {THROUGHPUT_WINDOW} döngü için gösterilir.<br>"
+            f"<b>- Komut Başına Döngü (CPI):</b> Tek vuruşlu işlemcide her komut tüm {len(STAGES)} aşamayı tamamlayana kadar işlemciyi meşgul eder (CPI = {len(STAGES)}). "
+            f"Boru hatlı işlemcide ilk komut {len(STAGES)} döngüde tamamlandıktan sonra (boru hattının dolması), ideal durumda her döngüde bir yeni komut tamamlanır ve CPI 1'e yaklaşır.<br>"
+            f"<b>Not:</b> Veri bağımlılıkları (data hazards), dolu aşamalardan kaynaklanan yapısal tehlikeler (structural hazards) ve "
+            f"dallanmalardan kaynaklanan kontrol tehlikeleri (control hazards) modellenmektedir; bekleme döngüleri ve yanlış tahmin cezaları CPI değerine yansır. "
+            f"Boru hatlı CPI, hattın ilk dolma süresi ({len(STAGES) - 1} döngü) düşülerek hesaplanır. "
+            f"Yanlış tahmin edilen bir dallanma EX aşamasından çıktığında arkasındaki arabalar hattan atılır ve yeniden alınır."
+        )
+        theory_label.setWordWrap(True)
+        theory_label.setStyleSheet("font-size: 14px; margin: 10px;")
+        comparison_layout.addWidget(theory_label)
+        
+        # Tabları ekle
+        tab_widget.addTab(pipeline_tab, "Simülasyon Görünümü")
+        tab_widget.addTab(comparison_tab, "Performans Karşılaştırması")
+
+        # Tab 3: Profil (hata ayıklama). Süreler yalnızca "Profil" açıkken toplanır.
+        profile_tab = QWidget()
+        profile_layout = QVBoxLayout(profile_tab)
+        self.profile_table = QTableWidget()
+        self.profile_table.setColumnCount(5)
+        self.profile_table.setHorizontalHeaderLabels(["Aşama", "Çağrı", "Toplam (ms)", "Ortalama (µs)", "Süre Oranı"])
+        header = self.profile_table.horizontalHeader()
+        for i in range(5):
+            header.setSectionResizeMode(i, QHeaderView.Stretch)
+        self.profile_table.setStyleSheet("QTableWidget { font-size: 15px; } QHeaderView::section { font-size: 16px; font-weight: bold; }")
+        profile_layout.addWidget(self.profile_table)
+        profile_note = QLabel(
+            "İç içe aşamalar (ör. engine.step içindeki engine.step_pipelined) ayrı ayrı sayılır; oranlar profilin açıldığı andan "
+            "bu yana geçen süreye göredir. Motor aşamaları simülasyon iş parçacığında, gui. ile başlayanlar arayüzde ölçülür."
+        )
+        profile_note.setWordWrap(True)
+        profile_note.setStyleSheet("font-size: 14px; margin: 10px;")
+        profile_layout.addWidget(profile_note)
+        tab_widget.addTab(profile_tab, "Profil")
+        
+        main_layout.addWidget(tab_widget)
+
+        # Zaman çizelgesi: herhangi bir döngüye git, kaydet / yükle
+        timeline_layout = QHBoxLayout()
+        timeline_label = QLabel("Zaman Çizelgesi:")
+        timeline_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        timeline_layout.addWidget(timeline_label)
+
+        self.timeline_slider = QSlider(Qt.Horizontal)
+        self.timeline_slider.setMinimum(0)
+        self.timeline_slider.setMaximum(0)
+        self.timeline_slider.setToolTip("Simülasyonu seçilen döngüye götürür; oradan farklı ayarlarla devam edilebilir")
+        self.timeline_slider.valueChanged.connect(self.on_timeline_changed)
+        self.timeline_slider.sliderReleased.connect(self.seek_timeline)
+        timeline_layout.addWidget(self.timeline_slider, 1)
+
+        self.timeline_position = QLabel("Döngü 0 / 0")
+        self.timeline_position.setStyleSheet("font-size: 17px;")
+        timeline_layout.addWidget(self.timeline_position)
+
+        self.save_button = QPushButton("Kaydet")
+        self.save_button.setToolTip("Simülasyonun şu anki durumunu dosyaya kaydet")
+        self.save_button.clicked.connect(self.save_checkpoint)
+        self.save_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        timeline_layout.addWidget(self.save_button)
+
+        self.load_button = QPushButton("Yükle")
+        self.load_button.setToolTip("Kaydedilmiş bir durumu yükle ve oradan devam et")
+        self.load_button.clicked.connect(self.load_checkpoint)
+        self.load_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        timeline_layout.addWidget(self.load_button)
+
+        self.export_trace_button = QPushButton("İz Kaydet")
+        self.export_trace_button.setToolTip("Döngü döngü hat doluluğunu ikili iz dosyasına yaz")
+        self.export_trace_button.clicked.connect(self.export_trace)
+        self.export_trace_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        timeline_layout.addWidget(self.export_trace_button)
+
+        self.open_trace_button = QPushButton("İz Aç")
+        self.open_trace_button.setToolTip("Bir iz dosyasını belleğe yüklemeden (mmap) görüntüle")
+        self.open_trace_button.clicked.connect(self.open_trace)
+        self.open_trace_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        timeline_layout.addWidget(self.open_trace_button)
+
+        self.profile_input = QCheckBox("Profil")
+        self.profile_input.setToolTip("Motor adımlarının ve arayüz güncellemelerinin sürelerini ölç (Profil sekmesi)")
+        self.profile_input.setStyleSheet("font-size: 17px; font-weight: bold;")
+        self.profile_input.toggled.connect(self.toggle_profiling)
+        timeline_layout.addWidget(self.profile_input)
+
+        self.export_profile_button = QPushButton("Profili Dışa Aktar")
+        self.export_profile_button.setToolTip("Ölçülen çağrıları Chrome izleme biçiminde (chrome://tracing, Perfetto, speedscope) kaydet")
+        self.export_profile_button.clicked.connect(self.export_profile)
+        self.export_profile_button.setStyleSheet("font-size: 17px; padding: 5px 10px;")
+        self.export_profile_button.setEnabled(False)
+        timeline_layout.addWidget(self.export_profile_button)
+
+        main_layout.addLayout(timeline_layout)
+
+        # Durum etiketi
+        self.status_label = QLabel("Simülasyon Bekliyor...")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px; padding: 5px; background-color: #000; border-radius: 5px;")
+        main_layout.addWidget(self.status_label)
+
+        # Renk açıklamaları
+        legend_layout = QHBoxLayout()
+        legend_label = QLabel("Aşama Kısaltmaları:")
+        legend_label.setStyleSheet("font-size: 17px; font-weight: bold;")
+        legend_layout.addWidget(legend_label)
+        
+        for stage, short in zip(STAGES, STAGE_SHORT):
+            label = QLabel(f"{short}: {stage}")
+            label.setStyleSheet("font-size: 17px;")
+            legend_layout.addWidget(label)
+            legend_layout.addSpacing(10)
+        
+        main_layout.addLayout(legend_layout)
+
+    def choose_chassis_file(self):
+        # İptal edilirse dosya seçimi kaldırılır
+        path, _ = QFileDialog.getOpenFileName(self, "Şasi Numarası Dosyası", "", "Metin Dosyaları (*.txt *.csv);;Tüm Dosyalar (*)")
+        self.chassis_file = path or None
+        if self.chassis_file:
+            self.chassis_input.clear()
+            self.chassis_input.setPlaceholderText(f"Dosya: {path}")
+        else:
+            self.chassis_input.setPlaceholderText("Şasi numaraları (virgülle ayır)")
+
+    def reset_simulation(self):
+        # Çalışan simülasyonu hemen iptal et
+        self.stop_worker()
+        self.status_label.setText("Simülasyon Sıfırlandı")
+        
+        # İlgili değişkenleri sıfırla
+        self.engine.reset()
+        self.close_trace()
+        
+        # Arayüzü temizle
+        self.pipeline_model.reload()
+        self.single_cycle_model.reload()
+        self.pipelined_output_list.clear()
+        self.single_cycle_output_list.clear()
+        self.comparison_table.setRowCount(0)
+        self.clear_live_stats()
+        self.timeline_max = 0
+        self.update_timeline(0)
+
+    def start_simulation(self):
+        # Tüm değişkenleri sıfırla
+        self.reset_simulation()
+        
+        # Kullanıcı girdilerini al
+        user_input = self.chassis_input.text().strip()
+        chassis_numbers = [x.strip() for x in user_input.split(',') if x.strip()]
+        count = self.count_input.value()
+
+        # Şasi numarası kaynağını seç: giriş alanı, dosya veya otomatik numaralar.
+        # Arabalar kaynaktan ancak hattın ilk aşaması boşaldıkça çekilir.
+        if chassis_numbers:
+            if len(chassis_numbers) < count:
+                QMessageBox.warning(self, "Hata", f"Yetersiz şasi numarası girdiniz. En az {count} adet gerekli.")
+                return
+            source = chassis_numbers
+        elif self.chassis_file:
+            source = ChassisFile(self.chassis_file)
+        else:
+            source = SyntheticChassis(count)
+
+        # Aşama sürelerini (boşsa her aşama bir döngü) ve yönlendirmeyi ayarla;
+        # hat genişliği yalnızca başlarken değiştirilebilir
+        self.engine.set_issue_width(self.width_input.value())
+        if not self.apply_config():
+            return
+
+        # Kaynağı, veri bağımlılıklarını ve dallanmaları motora bağla
+        dependencies = DependencyStream(self.hazard_input.value() / 100) if self.hazard_input.value() else None
+        branches = None
+        self.engine.predictor = None
+        if self.branch_input.value():
+            branches = BranchStream(self.branch_input.value() / 100)
+            self.engine.predictor = make_predictor(self.predictor_input.currentData())
+        addresses = None
+        self.engine.cache = None
+        if self.cache_input.value():
+            try:
+                self.engine.cache = SetAssociativeCache(self.cache_input.value(), self.cache_ways_input.value(),
+                                                        policy=self.cache_policy_input.currentData())
+            except ValueError as e:
+                QMessageBox.warning(self, "Hata", str(e))
+                return
+            addresses = AddressStream()
+        self.engine.load_source(source, count, dependencies, addresses=addresses, branches=branches)
+
+        # Döngü tablolarını hazırla (sütunlar arabalar hatta girdikçe eklenir)
+        self.pipeline_model.reload()
+        self.single_cycle_model.reload()
+        
+        self.status_label.setText("🚗 Simülasyon Başladı...")
+        
+        # Simülasyonu arka planda başlat
+        self.start_worker()
+
+    def start_worker(self, turbo=False):
+        self.worker = SimulationWorker(self.engine, self.speed_slider.value(), self.cycles_per_tick.value(), turbo)
+        self.worker_thread = QThread(self)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        if self.profiler is not None:
+            self.profiler.instrument(self.worker, ('flush',), 'worker.')
+        self.worker.progress.connect(self.apply_progress)
+        self.worker.done.connect(self.on_worker_done)
+        self.pause_button.setText("Duraklat")
+        self.pause_button.setEnabled(True)
+        self.worker_thread.start()
+
+    def stop_worker(self):
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        if self.profiler is not None:
+            self.profiler.detach(self.worker)
+        self.worker = None
+        self.worker_thread = None
+        self.pause_button.setEnabled(False)
+
+    def toggle_pause(self):
+        if self.worker is None:
+            # Zaman çizelgesinde gidilen veya yüklenen durumdan devam et
+            self.continue_simulation()
+            return
+        if self.worker.paused:
+            self.worker.resume()
+            self.pause_button.setText("Duraklat")
+        else:
+            self.worker.pause()
+            self.pause_button.setText("Devam Et")
+            self.status_label.setText(f"⏸ Duraklatıldı (Döngü: {self.engine.cycle})")
+
+    def apply_config(self):
+        # Aşama süreleri ve yönlendirme ayarlarını motora uygula (devam ederken
+        # değiştirilmişlerse simülasyon bu noktadan farklı ayarlarla dallanır)
+        latency_text = self.latency_input.text().strip()
+        try:
+            latencies = [int(x) for x in latency_text.split(',')] if latency_text else None
+            self.engine.set_stage_latencies(latencies)
+        except ValueError:
+            QMessageBox.warning(self, "Hata", f"Aşama süreleri {len(STAGES)} adet, 1 veya daha büyük tam sayı olmalıdır.")
+            return False
+        self.engine.forwarding = self.forwarding_input.isChecked()
+        return True
+
+    def continue_simulation(self):
+        if self.engine.finished or self.timeline_max == 0 or not self.apply_config():
+            return
+        self.status_label.setText(f"🔄 Döngü {self.engine.cycle}'den devam ediliyor...")
+        self.start_worker()
+
+    def update_timeline(self, cycle):
+        # Kaydırıcıyı sinyal üretmeden güncelle
+        self.timeline_max = max(self.timeline_max, cycle)
+        self.timeline_slider.blockSignals(True)
+        self.timeline_slider.setMaximum(self.timeline_max)
+        self.timeline_slider.setValue(cycle)
+        self.timeline_slider.blockSignals(False)
+        self.timeline_position.setText(f"Döngü {cycle} / {self.timeline_max}")
+
+    def on_timeline_changed(self, value):
+        self.timeline_position.setText(f"Döngü {value} / {self.timeline_max}")
+        # Sürüklerken yalnızca etiket güncellenir; klavye / tıklama hemen gider
+        if not self.timeline_slider.isSliderDown():
+            self.seek_timeline()
+
+    def seek_timeline(self):
+        # Seçilen döngüye git: en yakın kontrol noktası geri yüklenir ve kalan
+        # döngüler yeniden oynatılır
+        if self.timeline_max == 0:
+            return
+        self.stop_worker()
+        cycle = self.engine.seek(self.timeline_slider.value())
+        self.refresh_views()
+        self.update_timeline(cycle)
+        if self.engine.finished:
+            self.status_label.setText(f"⏪ Döngü {cycle} (simülasyonun sonu)")
+        else:
+            self.status_label.setText(f"⏪ Döngü {cycle} (devam etmek için \"Devam Et\")")
+
+    def save_checkpoint(self):
+        if self.timeline_max == 0:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Durumu Kaydet", "simulasyon.ckpt", "Kontrol Noktası (*.ckpt)")
+        if not path:
+            return
+        # Çalışan iş parçacığı durdurulur; "Devam Et" ile kalınan yerden sürdürülebilir
+        self.stop_worker()
+        try:
+            self.engine.save_checkpoint(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Hata", f"Durum kaydedilemedi: {e}")
+            return
+        self.refresh_views()
+        self.status_label.setText(f"💾 Döngü {self.engine.cycle - 1} kaydedildi")
+
+    def load_checkpoint(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Durumu Yükle", "", "Kontrol Noktası (*.ckpt);;Tüm Dosyalar (*)")
+        if not path:
+            return
+        self.reset_simulation()
+        try:
+            self.engine.restore_checkpoint(path)
+        except Exception as e:  # Bozuk / uyumsuz dosya (pickle çok çeşitli hatalar üretebilir)
+            self.engine.reset()
+            QMessageBox.warning(self, "Hata", f"Durum yüklenemedi: {e}")
+            return
+        if len(self.engine.stages) != len(STAGES):
+            self.engine.reset()
+            QMessageBox.warning(self, "Hata", f"Arayüz yalnızca {len(STAGES)} aşamalı hatları gösterebilir.")
+            return
+        # Kaydedilen ayarları göster; değiştirilip devam edilirse simülasyon dallanır
+        self.latency_input.setText(",".join(str(x) for x in self.engine.stage_latencies))
+        self.forwarding_input.setChecked(self.engine.forwarding)
+        self.width_input.setValue(self.engine.issue_width)
+        self.refresh_views()
+        self.update_timeline(self.engine.cycle - 1)
+        self.status_label.setText(f"📂 Döngü {self.engine.cycle - 1} yüklendi (devam etmek için \"Devam Et\")")
+
+    def export_trace(self):
+        if self.timeline_max == 0:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "İz Kaydet", "simulasyon.trace", "İz Dosyası (*.trace)")
+        if not path:
+            return
+        # Çalışan iş parçacığı durdurulur; "Devam Et" ile kalınan yerden sürdürülebilir
+        self.stop_worker()
+        try:
+            export_trace(self.engine, path)
+        except OSError as e:
+            QMessageBox.warning(self, "Hata", f"İz kaydedilemedi: {e}")
+            return
+        self.refresh_views()
+        self.status_label.setText(f"💾 {self.engine.cycle - 1} döngülük iz kaydedildi")
+
+    def open_trace(self):
+        # İz dosyası mmap ile açılır; tablolar yalnızca görünen satırları diskten okur
+        path, _ = QFileDialog.getOpenFileName(self, "İz Aç", "", "İz Dosyası (*.trace);;Tüm Dosyalar (*)")
+        if not path:
+            return
+        self.reset_simulation()
+        try:
+            trace = TraceReader(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Hata", f"İz açılamadı: {e}")
+            return
+        if len(trace.stages) != len(STAGES):
+            trace.close()
+            QMessageBox.warning(self, "Hata", f"Arayüz yalnızca {len(STAGES)} aşamalı hatları gösterebilir.")
+            return
+        self.trace = trace
+        self.set_table_source(trace)
+        self.status_label.setText(f"📂 İz: {trace.cycle_count} döngü, {trace.instruction_count} araba")
+
+    def close_trace(self):
+        if self.trace is None:
+            return
+        # Modeller iz dosyasını bırakmadan mmap kapatılamaz
+        self.set_table_source(self.engine)
+        self.trace.close()
+        self.trace = None
+
+    def make_cycle_table(self, model):
+        # Döngü x araba tablosu: satır ve sütunlar sabit boyutlu, başlık boyutları
+        # FixedHintHeader ile bir kez hesaplanır
+        table = QTableView()
+        table.setVerticalHeader(FixedHintHeader(Qt.Vertical, HEADER_SAMPLES[Qt.Vertical], table))
+        table.setHorizontalHeader(FixedHintHeader(Qt.Horizontal, HEADER_SAMPLES[Qt.Horizontal], table))
+        table.setModel(model)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.horizontalHeader().setDefaultSectionSize(COLUMN_WIDTH)
+        table.setStyleSheet("QTableView { font-size: 17px; } QHeaderView::section { font-size: 17px; font-weight: bold; }")
+        return table
+
+    def set_table_source(self, source):
+        # Sütunlar her iki kaynakta da sabit varsayılan genişlikte (Interactive) gösterilir:
+        # Stretch her columnsInserted'da tüm sütunların genişliğini yeniden hesaplardı
+        for model in (self.pipeline_model, self.single_cycle_model):
+            model.set_engine(source)
+
+    def refresh_views(self):
+        # Tabloları ve listeleri motorun şu anki durumundan yeniden oluştur
+        self.pipeline_model.reload()
+        self.single_cycle_model.reload()
+        self.pipelined_output_list.clear()
+        self.single_cycle_output_list.clear()
+        self.comparison_table.setRowCount(0)
+        instruction_history = self.engine.instruction_history
+        self.update_comparison_rows(len(instruction_history))
+        pipelined = sorted((instr for instr in instruction_history if instr.pipelined_end_cycle is not None), key=lambda instr: instr.pipelined_end_cycle)
+        single_cycle = sorted((instr for instr in instruction_history if instr.single_cycle_end_cycle is not None), key=lambda instr: instr.single_cycle_end_cycle)
+        self.show_completions([(instr.index, instr.pipelined_end_cycle) for instr in pipelined],
+                              [(instr.index, instr.single_cycle_end_cycle) for instr in single_cycle])
+        # Geri gidildiyse verimlilik grafiğindeki sonraki noktalar silinir
+        cycle = self.engine.cycle - 1
+        self.throughput_chart.truncate(cycle)
+        if self.engine.stats is None:
+            self.clear_live_stats()
+        if self.engine.finished:
+            self.update_performance_summary()
+            self.pause_button.setEnabled(False)
+        else:
+            if self.engine.stats is not None:
+                self.update_live_stats(cycle, self.engine.stats.metrics(cycle))
+            self.pause_button.setText("Devam Et")
+            self.pause_button.setEnabled(True)
+
+    def update_worker_speed(self):
+        if self.worker is not None:
+            self.worker.set_speed(self.speed_slider.value(), self.cycles_per_tick.value())
+
+    def run_to_end(self):
+        # Ara durumları çizmeden simülasyonu sonuna kadar çalıştır
+        if self.worker is not None:
+            self.worker.run_to_end()
+            self.pause_button.setText("Duraklat")
+            return
+        if self.timeline_max and not self.engine.finished:
+            # Zaman çizelgesinde gidilen veya yüklenen durumdan sıfırlamadan devam et
+            self.continue_simulation()
+        else:
+            self.start_simulation()
+        if self.worker is not None:
+            self.worker.run_to_end()
+
+    def on_worker_done(self, worker):
+        # İptal edilmiş eski iş parçacıklarından gelen bildirimleri yok say
+        if worker is not self.worker:
+            return
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        if self.profiler is not None:
+            self.profiler.detach(worker)
+        self.worker = None
+        self.worker_thread = None
+        self.pause_button.setEnabled(False)
+        if self.engine.finished:
+            self.finish_simulation()
+
+    def finish_simulation(self):
+        self.status_label.setText("✅ Tüm arabalar üretim hattından çıktı!")
+        self.update_performance_summary()
+
+    def apply_progress(self, delta):
+        # İş parçacığından gelen değişiklikleri tek seferde ekrana yansıt. Bu bir sinyal
+        # yuvası olduğundan profil için sarmalanmaz (sarmalayıcı işçi iş parçacığında
+        # çalışırdı); süresi burada ölçülür.
+        if delta['worker'] is not self.worker:
+            return
+        if self.profiler is None:
+            self.show_progress(delta)
+            return
+        with self.profiler.phase('gui.apply_progress'):
+            self.show_progress(delta)
+        self.update_profile_table()
+
+    def show_progress(self, delta):
+        self.update_pipelined_table(delta['rows'], delta['columns'])
+        self.update_single_cycle_table(delta['rows'], delta['columns'])
+        self.update_comparison_rows(delta['columns'])
+        self.show_completions(delta['pipelined'], delta['single_cycle'])
+        self.update_timeline(delta['rows'])
+        self.update_live_stats(delta['rows'], delta['stats'])
+
+        # Durumu güncelle
+        if not self.worker.paused:
+            self.status_label.setText(f"🔄 Üretim Döngüsü: {delta['cycle']}")
+
+    def show_completions(self, pipelined, single_cycle):
+        # (komut indeksi, döngü) çiftlerini çıktı listelerine ve karşılaştırma tablosuna ekle
+        instruction_history = self.engine.instruction_history
+        if pipelined:
+            self.pipelined_output_list.addItems([f"🚘 {instruction_history[index].chassis_no} (Döngü: {cycle})" for index, cycle in pipelined])
+            for index, cycle in pipelined:
+                self.comparison_table.setItem(index, 1, QTableWidgetItem(f"Döngü {cycle}"))
+                self.comparison_table.setItem(index, 4, QTableWidgetItem(f"{instruction_history[index].stall_cycles} döngü"))
+                self.update_speedup(instruction_history[index])
+        if single_cycle:
+            self.single_cycle_output_list.addItems([f"🚘 {instruction_history[index].chassis_no} (Döngü: {cycle})" for index, cycle in single_cycle])
+            for index, cycle in single_cycle:
+                self.comparison_table.setItem(index, 2, QTableWidgetItem(f"Döngü {cycle}"))
+                self.update_speedup(instruction_history[index])
+
+    def update_speedup(self, instr):
+        # İki işlemci de tamamladıysa hızlanma oranını hesapla (satır = komut sırası)
+        if instr.pipelined_end_cycle and instr.single_cycle_end_cycle:
+            speedup = instr.single_cycle_end_cycle / instr.pipelined_end_cycle
+            self.comparison_table.setItem(instr.index, 3, QTableWidgetItem(f"{speedup:.2f}x"))
+
+    def update_comparison_rows(self, count):
+        # Kaynaktan yeni çekilen arabalar için karşılaştırma satırı ekle
+        start = self.comparison_table.rowCount()
+        if count <= start:
+            return
+        instruction_history = self.engine.instruction_history
+        self.comparison_table.setRowCount(count)
+        for i in range(start, count):
+            self.comparison_table.setItem(i, 0, QTableWidgetItem(instruction_history[i].chassis_no))
+            for col in range(1, 5):
+                self.comparison_table.setItem(i, col, QTableWidgetItem("-"))
+
+    def update_pipelined_table(self, rows, columns):
+        # Yeni döngü satırlarını modele toplu bildir; hücreler görünür oldukça hesaplanır
+        self.pipeline_model.sync(rows, columns)
+        self.pipeline_table.scrollToBottom()  # En alttaki satırı göster
+
+    def update_single_cycle_table(self, rows, columns):
+        self.single_cycle_model.sync(rows, columns)
+        self.single_cycle_table.scrollToBottom()  # En alttaki satırı göster
+
+    def toggle_profiling(self, enabled):
+        # Açılınca motorun, arayüzün ve tablo modellerinin sıcak yollarını zamanlayan
+        # sarmalayıcılar yerleştirilir; kapatılınca kaldırılır ve ek maliyet kalmaz
+        if enabled:
+            self.profiler = Profiler()
+            self.profiler.instrument(self.engine, ENGINE_PHASES, 'engine.')
+            self.profiler.instrument(self, GUI_PHASES, 'gui.')
+            self.profiler.instrument(self.pipeline_model, MODEL_PHASES, 'pipeline_model.')
+            self.profiler.instrument(self.single_cycle_model, MODEL_PHASES, 'single_cycle_model.')
+            if self.worker is not None:
+                self.profiler.instrument(self.worker, ('flush',), 'worker.')
+        elif self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+        self.export_profile_button.setEnabled(enabled)
+
+    def update_profile_table(self):
+        rows = self.profiler.breakdown()
+        self.profile_table.setRowCount(len(rows))
+        for i, (name, calls, total, mean, share) in enumerate(rows):
+            values = (name, str(calls), f"{total / 1e6:.2f}", f"{mean / 1e3:.1f}", f"{share:.1%}")
+            for col, value in enumerate(values):
+                self.profile_table.setItem(i, col, QTableWidgetItem(value))
+
+    def export_profile(self):
+        if self.profiler is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Profili Dışa Aktar", "profil.json", "Chrome İzleme (*.json)")
+        if not path:
+            return
+        try:
+            self.profiler.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Hata", f"Profil kaydedilemedi: {e}")
+            return
+        self.update_profile_table()
+        self.status_label.setText(f"⏱ Profil kaydedildi: {path}")
+
+    def update_live_stats(self, cycle, stats):
+        # Grafikleri ve özet alanını simülasyon sürerken güncelle
+        if stats is None:
+            return
+        self.throughput_chart.add_point(cycle, stats)
+        for key, _ in UNITS:
+            latencies = [stats[f'{key}_latency_mean']] + [stats[f'{key}_latency_p{round(p * 100)}'] for p in QUANTILES]
+            self.latency_chart.set_values(key, latencies)
+            self.utilization_chart.set_values(key, [x * 100 for x in stats[f'{key}_utilization']])
+        self.summary_label.setText(self.stats_text(stats))
+
+    def clear_live_stats(self):
+        self.throughput_chart.clear()
+        self.latency_chart.clear()
+        self.utilization_chart.clear()
+        self.summary_label.setText(SUMMARY_PLACEHOLDER)
+
+    def stats_text(self, stats, final=False):
+        # final=True iken verimlilik her birimin kendi son tamamlanmasında biten penceredir
+        lines = ["<b>Canlı Ölçüler:</b>"]
+        for key, name in UNITS:
+            if stats[f'{key}_latency_min'] is None:
+                lines.append(f"<b>{name}:</b> henüz tamamlanan araba yok")
+                continue
+            quantiles = ", ".join(f"p{round(p * 100)}: {stats[f'{key}_latency_p{round(p * 100)}']:g}" for p in QUANTILES)
+            lines.append(f"<b>{name} Gecikme:</b> {stats[f'{key}_latency_mean']:.2f} ± {stats[f'{key}_latency_std']:.2f} döngü ({quantiles})")
+            window = f"son tamamlanmaya kadarki son {THROUGHPUT_WINDOW} döngü" if final else f"son {THROUGHPUT_WINDOW} döngü"
+            lines.append(f"<b>{name} Verimlilik:</b> {stats[f'{key}_window_throughput']:.4f} araç/döngü ({window})")
+        lines.append(f"<b>Boru Hatlı Ortalama Dolu Yuva:</b> {stats['pipelined_occupancy']:.2f} / {len(STAGES) * self.engine.issue_width}")
+        return "<br>".join(lines)
+
+    def update_performance_summary(self):
+        # Tüm komutların bitmesi sonrasında toplamlar; canlı ölçüler altında kalır
+        instruction_history = self.engine.instruction_history
+        if len(instruction_history) == 0:
+            return
+            
+        metrics = self.engine.summary.metrics(len(STAGES))
+        stall_cycles = self.engine.stall_cycles
+        stall_names = {'data': "Veri Bağımlılığı", 'structural': "Yapısal (Dolu Aşama)"}
+        stall_text = ", ".join(f"{stall_names[cause]}: {stall_cycles[cause]}" for cause in STALL_CAUSES)
+        
+        branch_text = ""
+        if self.engine.predictor is not None:
+            branch = self.engine.predictor.metrics()
+            branch_text = (
+                f"<b>Dallanma Tahmini:</b> Doğruluk {branch['branch_accuracy']:.2%} "
+                f"({branch['branches'] - branch['branch_mispredictions']} / {branch['branches']}), "
+                f"Hattan Atılan {branch['branch_flushed']} araba, Ceza {branch['branch_flush_cycles']} döngü<br>"
+            )
+
+        # Özet metni
+        summary = (
+            f"<b>Performans Özeti:</b><br>"
+            f"<b>Toplam Araç Sayısı:</b> {len(instruction_history)}<br>"
+            f"<b>Toplam Süre:</b> Boru Hatlı {metrics['total_pipelined']}, Tek Vuruşlu {metrics['total_single_cycle']} döngü<br>"
+            f"<b>Ortalama Hızlanma Oranı:</b> {metrics['avg_speedup']:.2f}x<br>"
+            f"{branch_text}"
+            f"<b>Verimlilik (Throughput):</b> Boru Hatlı {metrics['pipelined_throughput']:.4f}, Tek Vuruşlu {metrics['single_cycle_throughput']:.4f} araç/döngü<br>"
+            f"<b>CPI:</b> Boru Hatlı {metrics['pipelined_cpi']:.2f}, Tek Vuruşlu {metrics['single_cycle_cpi']:.2f}<br>"
+            f"<b>IPC:</b> Boru Hatlı {metrics['pipelined_ipc']:.2f} (genişlik {self.engine.issue_width})<br>"
+            f"<b>Boru Hatlı Bekleme Döngüleri:</b> {stall_text}"
+        )
+        if self.engine.cache is not None:
+            cache = self.engine.cache.metrics()
+            summary += (
+                f"<br><b>Önbellek (MEM):</b> İsabet Oranı {cache['cache_hit_rate']:.2%} "
+                f"({cache['cache_hits']} / {cache['cache_accesses']}), Iska Beklemesi {cache['cache_miss_stall_cycles']} döngü"
+            )
+        if self.engine.stats is not None:
+            cycle = self.engine.cycle - 1
+            self.update_live_stats(cycle, self.engine.stats.metrics(cycle))
+            summary += "<br><br>" + self.stats_text(self.engine.stats.metrics(cycle, final=True), final=True)
+        
+        self.summary_label.setText(summary)
+
+    def closeEvent(self, event):
+        self.stop_worker()
+        self.close_trace()
+        super().closeEvent(event)
+
+def main():
+    app = QApplication(sys.argv)
+    window = PipelineSimulator()
+    window.show()
+    return app.exec()
+
+if __name__ == "__main__":
+    sys.exit(main())
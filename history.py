@@ -0,0 +1,101 @@
+from array import array
+from bisect import bisect_left
+
+# Boş aşama (bubble) için kullanılan değer
+EMPTY = -1
+
+
+# Blok dizininde kaç döngüde bir koşu işaretçisi tutulduğu
+BLOCK_SIZE = 64
+
+
+class CycleHistory:
+    # Döngü x sütun tamsayı matrisi (ör. döngü x aşama -> komut indeksi), art arda
+    # aynı kalan satırlar (bekleme / boşta kalma) tek bir koşu (run) olarak tutulur:
+    # her koşu için satır bir kez ve koşunun ilk döngü indeksi saklanır. Bellek
+    # döngü sayısıyla değil, satırın değiştiği döngü sayısıyla büyür.
+    # Seyrek blok dizini (blocks) her BLOCK_SIZE döngünün ilk döngüsünü içeren koşuyu
+    # gösterir; bir döngüye erişim bu koşudan en fazla BLOCK_SIZE koşu ileri tarayarak
+    # O(1) olur. Dizin döngü başına 4 / BLOCK_SIZE bayt tutar.
+    def __init__(self, width):
+        self.width = width
+        self.rows = array('i')    # Koşu başına satır, düz olarak
+        self.starts = array('q')  # Koşu başına ilk döngü indeksi (artan)
+        self.blocks = array('i')  # Blok başına, bloğun ilk döngüsünü içeren koşu
+        self.length = 0           # Toplam döngü sayısı
+        self.last = None
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, cycle_index):
+        if cycle_index < 0:
+            cycle_index += self.length
+        if not 0 <= cycle_index < self.length:
+            raise IndexError("döngü indeksi geçmişin dışında")
+        starts = self.starts
+        run = self.blocks[cycle_index // BLOCK_SIZE]
+        last_run = len(starts) - 1
+        while run < last_run and starts[run + 1] <= cycle_index:
+            run += 1
+        start = run * self.width
+        return self.rows[start:start + self.width]
+
+    def append(self, values):
+        # values: width uzunluğunda tamsayı demeti
+        self.append_run(values, 1)
+
+    def append_run(self, values, count):
+        # Aynı satırı count döngü boyunca kaydet
+        if count <= 0:
+            return
+        if values != self.last:
+            self.rows.extend(values)
+            self.starts.append(self.length)
+            self.last = values
+        self.extend(count)
+
+    def repeat_last(self, count):
+        # Son satırı count döngü daha tekrarla
+        if not self.length:
+            raise IndexError("tekrarlanacak satır yok")
+        self.extend(max(count, 0))
+
+    def extend(self, count):
+        # Son koşuyu count döngü uzat. Yeni eklenen döngülerde başlayan bloklar
+        # son koşuya düşer.
+        self.length += count
+        new_blocks = -(-self.length // BLOCK_SIZE) - len(self.blocks)
+        if new_blocks > 0:
+            self.blocks.extend(array('i', [len(self.starts) - 1]) * new_blocks)
+
+    def runs(self):
+        # (satır, ilk döngü indeksi, uzunluk) üçlülerini sırayla üret
+        starts = self.starts
+        width = self.width
+        for run, start in enumerate(starts):
+            end = starts[run + 1] if run + 1 < len(starts) else self.length
+            yield self.rows[run * width:(run + 1) * width], start, end - start
+
+    def truncate(self, length):
+        # Yalnızca ilk length döngüyü bırak
+        if length >= self.length:
+            return
+        length = max(length, 0)
+        kept = bisect_left(self.starts, length)  # length'ten önce başlayan koşular
+        del self.starts[kept:]
+        del self.rows[kept * self.width:]
+        del self.blocks[-(-length // BLOCK_SIZE):]
+        self.length = length
+        self.last = tuple(self.rows[-self.width:]) if kept else None
+
+    def clear(self):
+        del self.rows[:]
+        del self.starts[:]
+        del self.blocks[:]
+        self.length = 0
+        self.last = None
+
+    def nbytes(self):
+        return (len(self.rows) * self.rows.itemsize + len(self.starts) * self.starts.itemsize +
+                len(self.blocks) * self.blocks.itemsize)
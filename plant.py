@@ -0,0 +1,249 @@
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cli import SUMMARY_LABELS, format_value, parse_list
+from engine import STAGES, STALL_CAUSES, SimulationEngine, make_stages
+from workload import ChassisFile, DependencyStream, SyntheticChassis, chassis_model
+
+# Çok hatlı fabrika: ortak sipariş kuyruğundaki şasiler bir dağıtıcıyla (dispatcher)
+# hatlara atanır ve her hat ayrı bir süreçte simüle edilir. Süreçler arasında araba
+# listesi gönderilmez: dağıtıcılar belirlenimci olduğundan her süreç sipariş akışını
+# baştan okuyup yalnızca kendi hattına düşen şasileri alır (LineSource).
+
+LINE_DEFAULTS = {
+    'stage_latencies': None,  # None = her aşama 1 döngü
+    'forwarding': False,
+    'hazard_rate': 0.0,
+    'seed': None,
+    'issue_width': 1,
+}
+
+
+class RoundRobinDispatcher:
+    # Şasileri hatlara sırayla dağıtır
+    def __init__(self, lines):
+        self.line_count = len(lines)
+        self.next_line = 0
+
+    def assign(self, chassis_no):
+        line = self.next_line
+        self.next_line = (line + 1) % self.line_count
+        return line
+
+
+class ShortestQueueDispatcher:
+    # Şasiyi tahmini kuyruğu (bekleyen iş, döngü) en kısa hatta verir. Hatlar ayrı
+    # süreçlerde çalıştığından kuyruklar canlı izlenmez; bir hat ideal durumda her
+    # darboğaz süresinde (en uzun aşama) genişliği kadar araba çıkarır ve tahmin buna
+    # göre yapılır.
+    def __init__(self, lines):
+        self.service = [max(spec['stage_latencies'] or [1]) / spec['issue_width'] for spec in lines]
+        self.backlog = [0] * len(lines)
+
+    def assign(self, chassis_no):
+        backlog = self.backlog
+        service = self.service
+        line = min(range(len(backlog)), key=lambda i: (backlog[i] + service[i], i))
+        backlog[line] += service[line]
+        return line
+
+
+class ModelDispatcher:
+    # Aynı modelin (SH-001 -> SH) tüm şasileri aynı hatta gider; modeller ilk
+    # göründükleri sırayla hatlara dağıtılır
+    def __init__(self, lines):
+        self.line_count = len(lines)
+        self.model_lines = {}
+
+    def assign(self, chassis_no):
+        model = chassis_model(chassis_no)
+        line = self.model_lines.get(model)
+        if line is None:
+            line = self.model_lines[model] = len(self.model_lines) % self.line_count
+        return line
+
+
+DISPATCHERS = {
+    'round-robin': RoundRobinDispatcher,
+    'shortest-queue': ShortestQueueDispatcher,
+    'model': ModelDispatcher,
+}
+
+
+class LineSource:
+    # Sipariş akışının `line` numaralı hatta düşen kısmı. Her for döngüsünde dağıtıcı
+    # baştan kurulur, bu yüzden tekrar okunabilir ve load_source'a verilebilir.
+    def __init__(self, source, count, dispatch, lines, line):
+        self.source = source
+        self.count = count
+        self.dispatch = dispatch
+        self.lines = lines
+        self.line = line
+
+    def __iter__(self):
+        dispatcher = DISPATCHERS[self.dispatch](self.lines)
+        line = self.line
+        for chassis_no in itertools.islice(self.source, self.count):
+            if dispatcher.assign(chassis_no) == line:
+                yield chassis_no
+
+
+def line_specs(line_count, **overrides):
+    # Aynı ayarlara sahip line_count hat
+    spec = dict(LINE_DEFAULTS)
+    spec.update(overrides)
+    return [dict(spec) for _ in range(line_count)]
+
+
+def run_line(line, lines, source, count, dispatch, stage_count):
+    # Tek bir hattı simüle et (işçi süreçte çalışır)
+    spec = lines[line]
+    engine = SimulationEngine(make_stages(stage_count), spec['stage_latencies'], spec['forwarding'],
+                              issue_width=spec['issue_width'])
+    dependencies = None
+    if spec['hazard_rate']:
+        # Her hattın bağımlılık akışı ayrı, ama tohum verildiyse tekrarlanabilir
+        seed = None if spec['seed'] is None else f"{spec['seed']}-{line}"
+        dependencies = DependencyStream(spec['hazard_rate'], seed=seed)
+    engine.load_source(LineSource(source, count, dispatch, lines, line), dependencies=dependencies, keep_history=False)
+
+    start = time.perf_counter()
+    engine.run()
+    elapsed = time.perf_counter() - start
+
+    result = {'line': line, 'count': engine.summary.pipelined_count}
+    if engine.summary.pipelined_count:
+        result.update(engine.summary.metrics(stage_count))
+    for cause in STALL_CAUSES:
+        result[f'stall_{cause}'] = engine.stall_cycles[cause]
+    result['simulated_cycles'] = engine.cycle - 1
+    result['elapsed_s'] = elapsed
+    return result
+
+
+def merge_results(results):
+    # Hat sonuçlarını fabrika toplamlarına birleştir. Tüm hatlar 1. döngüde başlar;
+    # fabrikanın toplam süresi en geç biten hattınkidir.
+    busy = [result for result in results if result['count']]
+    count = sum(result['count'] for result in busy)
+    if not count:
+        raise ValueError("Kaynakta hiç şasi numarası yok.")
+    total_pipelined = max(result['total_pipelined'] for result in busy)
+    total_single_cycle = max(result['total_single_cycle'] for result in busy)
+    avg_pipelined = sum(result['avg_pipelined'] * result['count'] for result in busy) / count
+    avg_single_cycle = sum(result['avg_single_cycle'] * result['count'] for result in busy) / count
+    plant = {
+        'lines': len(results),
+        'count': count,
+        'total_pipelined': total_pipelined,
+        'total_single_cycle': total_single_cycle,
+        'avg_pipelined': avg_pipelined,
+        'avg_single_cycle': avg_single_cycle,
+        'avg_speedup': avg_single_cycle / avg_pipelined,
+        'pipelined_throughput': count / total_pipelined,
+        'single_cycle_throughput': count / total_single_cycle,
+        'line_counts': [result['count'] for result in results],
+        'line_throughputs': [result.get('pipelined_throughput', 0.0) for result in results],
+    }
+    for cause in STALL_CAUSES:
+        plant[f'stall_{cause}'] = sum(result[f'stall_{cause}'] for result in results)
+    return plant
+
+
+def run_plant(lines, source, count=None, dispatch='round-robin', stage_count=len(STAGES), workers=None, progress=None):
+    # Her hattı süreç havuzunda ayrı bir süreçte çalıştır; sonuçlar hat sırasıyla
+    # ve birleştirilmiş fabrika özetiyle döner
+    if dispatch not in DISPATCHERS:
+        raise ValueError(f"Bilinmeyen dağıtıcı: {dispatch}")
+    for spec in lines:
+        latencies = spec['stage_latencies']
+        if latencies is not None and (len(latencies) != stage_count or min(latencies) < 1):
+            raise ValueError(f"Aşama süreleri {stage_count} adet, 1 veya daha büyük tam sayı olmalıdır.")
+        if spec['issue_width'] < 1:
+            raise ValueError("Hat genişliği en az 1 olmalıdır.")
+    workers = workers or min(len(lines), os.cpu_count() or 1)
+    results = [None] * len(lines)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_line, line, lines, source, count, dispatch, stage_count) for line in range(len(lines))]
+        for finished, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[result['line']] = result
+            if progress is not None:
+                progress(finished, len(lines))
+    return {'lines': results, 'plant': merge_results(results)}
+
+
+PLANT_LABELS = {
+    'lines': "Hat Sayısı",
+    'line_counts': "Hat Başına Araç Sayısı",
+    'line_throughputs': "Hat Başına Verimlilik (araç/döngü)",
+    'elapsed_s': "Süre (saniye)",
+}
+
+
+def format_text(report):
+    labels = dict(SUMMARY_LABELS, **PLANT_LABELS)
+    blocks = []
+    for result in report['lines']:
+        lines = [f"Hat {result['line'] + 1}"]
+        lines += [f"  {labels.get(key, key)}: {format_value(value)}" for key, value in result.items() if key != 'line']
+        blocks.append('\n'.join(lines))
+    lines = ["Fabrika"]
+    lines += [f"  {labels.get(key, key)}: {format_value(value)}" for key, value in report['plant'].items()]
+    blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çok hatlı fabrika: şasileri hatlara dağıtır ve her hattı ayrı bir süreçte simüle eder.")
+    parser.add_argument('--lines', type=int, default=os.cpu_count() or 1, help='Hat sayısı (varsayılan: çekirdek sayısı)')
+    parser.add_argument('--dispatch', choices=sorted(DISPATCHERS), default='round-robin', help='Şasilerin hatlara dağıtılma biçimi')
+    parser.add_argument('--chassis-file', help='Sipariş kuyruğu: şasi numaralarını içeren dosya (akış olarak okunur)')
+    parser.add_argument('--count', type=int, help='Toplam araba sayısı (dosya verilmezse varsayılan 1000)')
+    parser.add_argument('--models', default='SH', help='Dosya verilmezse üretilecek şasilerin modelleri, ör. SH,SD,HB')
+    parser.add_argument('--stages', type=int, default=len(STAGES), help=f'Aşama sayısı (varsayılan: {len(STAGES)})')
+    parser.add_argument('--latencies', default='', help='Tüm hatların aşama süreleri, ör. 1,1,3,2,1')
+    parser.add_argument('--line-latencies', action='append', default=[], metavar='SÜRELER', help='Tek bir hattın aşama süreleri; her hat için bir kez verilir (--lines yerine geçer)')
+    parser.add_argument('--width', type=int, default=1, help='Tüm hatların genişliği: aşama başına istasyon sayısı')
+    parser.add_argument('--hazard-rate', type=float, default=0.0, help='Bağımlılık oranı, 0-1 arası')
+    parser.add_argument('--forwarding', action='store_true', help='Yönlendirmeyi (forwarding) aç')
+    parser.add_argument('--seed', type=int, help='Bağımlılık ataması için rastgele tohum')
+    parser.add_argument('--workers', type=int, help='İşçi süreç sayısı (varsayılan: hat ve çekirdek sayısından küçük olanı)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Çıktı biçimi')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.line_latencies:
+            lines = [dict(LINE_DEFAULTS, stage_latencies=parse_list(text, int)) for text in args.line_latencies]
+        else:
+            if args.lines < 1:
+                raise ValueError("Hat sayısı en az 1 olmalıdır.")
+            lines = line_specs(args.lines, stage_latencies=parse_list(args.latencies, int) or None)
+        for spec in lines:
+            spec.update(forwarding=args.forwarding, hazard_rate=args.hazard_rate, seed=args.seed, issue_width=args.width)
+        if args.chassis_file:
+            source = ChassisFile(args.chassis_file)
+        else:
+            source = SyntheticChassis(args.count or 1000, parse_list(args.models) or 'SH')
+
+        def progress(finished, total):
+            print(f"\r{finished}/{total} hat tamamlandı", end='', file=sys.stderr, flush=True)
+
+        start = time.perf_counter()
+        report = run_plant(lines, source, args.count, args.dispatch, args.stages, args.workers, progress)
+        report['plant']['elapsed_s'] = time.perf_counter() - start
+        print(file=sys.stderr)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    sys.stdout.write(json.dumps(report) + '\n' if args.format == 'json' else format_text(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from array import array
+
+# İsteğe bağlı aşama (phase) zamanlaması. Profiler kapalıyken hiçbir kod yolunda
+# ek iş yapılmaz: instrument() ölçülecek metotları yalnızca açıkken nesnenin
+# üzerine zamanlayan sarmalayıcılarla (wrapper) yerleştirir, detach() bunları
+# kaldırır ve sınıftaki özgün metotlar yeniden doğrudan çağrılır.
+#
+# Her çağrı perf_counter_ns ile ölçülür ve iş parçacığı başına sabit boyutlu bir
+# halka tamponuna (ring buffer) yazılır; tampon dolunca en eski olayların üzerine
+# yazılır, bu yüzden bellek kullanımı çalıştırma uzunluğundan bağımsızdır. Aşama
+# başına toplam süre ve çağrı sayısı ayrıca tutulur (canlı döküm bunlardan hesaplanır).
+# Qt sinyallerine bağlanan yuvalar (slot) sarmalanmamalıdır: bağlı metodun yerine
+# düz bir fonksiyon konursa sinyal, yuvayı alıcının değil gönderenin iş parçacığında
+# çalıştırır. Bunlar phase() bağlamıyla kendi içlerinden ölçülür.
+# export_chrome_trace() tampondaki olayları Chrome izleme biçiminde (chrome://tracing,
+# Perfetto ve speedscope tarafından açılır) yazar.
+
+# Motorda ölçülen aşamalar
+ENGINE_PHASES = ('run', 'step', 'step_pipelined', 'step_single_cycle', 'record_cycle', 'skip_to', 'take_checkpoint')
+
+# İş parçacığı başına tutulan en fazla olay sayısı
+RING_SIZE = 1 << 16
+
+
+class PhaseRing:
+    # Tek bir iş parçacığının olayları: aşama numarası, başlangıç ve süre (ns) düz
+    # dizilerde. Olay başına nesne oluşturulmaz.
+    def __init__(self, size):
+        self.size = size
+        self.phase = array('H', [0]) * size
+        self.start = array('q', [0]) * size
+        self.duration = array('q', [0]) * size
+        self.count = 0  # Şimdiye kadar yazılan olay sayısı (size'ı geçebilir)
+
+    def append(self, phase, start, duration):
+        i = self.count % self.size
+        self.phase[i] = phase
+        self.start[i] = start
+        self.duration[i] = duration
+        self.count += 1
+
+    def events(self):
+        # Tampondaki olaylar, eskiden yeniye (aşama, başlangıç, süre)
+        count = min(self.count, self.size)
+        first = self.count - count
+        for n in range(first, self.count):
+            i = n % self.size
+            yield self.phase[i], self.start[i], self.duration[i]
+
+
+class Profiler:
+    def __init__(self, ring_size=RING_SIZE):
+        self.ring_size = ring_size
+        self.names = []         # Aşama numarası -> ad
+        self.ids = {}           # Aşama adı -> numara
+        self.rings = {}         # İş parçacığı kimliği -> PhaseRing
+        self.thread_names = {}  # İş parçacığı kimliği -> ad
+        self.attached = []      # (nesne, metot adı) sarmalanmış metotlar
+        # Toplamlar birden çok iş parçacığından (motor ve arayüz) güncellenir
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # Toplanan ölçümleri sil (sarmalanmış metotlar yerinde kalır)
+        with self.lock:
+            self.totals = [0] * len(self.names)
+            self.calls = [0] * len(self.names)
+            self.rings.clear()
+            self.thread_names.clear()
+            self.started = time.perf_counter_ns()
+
+    def phase_id(self, name):
+        with self.lock:
+            phase = self.ids.get(name)
+            if phase is None:
+                phase = self.ids[name] = len(self.names)
+                self.names.append(name)
+                self.totals.append(0)
+                self.calls.append(0)
+        return phase
+
+    def ring(self):
+        # Çağıran iş parçacığının tamponu (ilk çağrıda oluşturulur)
+        ident = threading.get_ident()
+        ring = self.rings.get(ident)
+        if ring is None:
+            ring = self.rings[ident] = PhaseRing(self.ring_size)
+            self.thread_names[ident] = threading.current_thread().name
+        return ring
+
+    def record(self, phase, start, duration):
+        # Tampon çağıran iş parçacığına aittir; yalnızca ortak toplamlar kilitlenir
+        self.ring().append(phase, start, duration)
+        with self.lock:
+            self.totals[phase] += duration
+            self.calls[phase] += 1
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        # `with profiler.phase('ad'):` bloğunun süresini ölç (sarmalanamayan yuvalar için)
+        phase = self.phase_id(name)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(phase, start, time.perf_counter_ns() - start)
+
+    def wrap(self, func, name):
+        # func'ı çağrı başına süresini `name` aşamasına yazan bir sarmalayıcıyla sar
+        phase = self.phase_id(name)
+        record = self.record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(phase, start, clock() - start)
+        return timed
+
+    def instrument(self, obj, methods, prefix=''):
+        # obj'nin metotlarını zamanlanan sarmalayıcılarla değiştir. Sarmalayıcı
+        # örnek özniteliği olarak konur; detach() ile silinince sınıftaki metot
+        # yeniden görünür. Nesnenin kendi içinden yaptığı çağrılar da ölçülür.
+        for method in methods:
+            if method in vars(obj):
+                continue  # Zaten sarmalanmış
+            setattr(obj, method, self.wrap(getattr(obj, method), prefix + method))
+            self.attached.append((obj, method))
+
+    def detach(self, obj=None):
+        # Sarmalayıcıları kaldır (obj verilirse yalnızca onunkileri)
+        kept = []
+        for target, method in self.attached:
+            if obj is None or target is obj:
+                delattr(target, method)
+            else:
+                kept.append((target, method))
+        self.attached = kept
+
+    def breakdown(self):
+        # Aşama başına (ad, çağrı, toplam ns, ortalama ns, duvar saatine oranı),
+        # toplam süreye göre azalan sırada. İç içe aşamalar (ör. step içindeki
+        # step_pipelined) ayrı ayrı sayıldığından oranların toplamı 1'i geçebilir.
+        elapsed = max(1, time.perf_counter_ns() - self.started)
+        with self.lock:
+            phases = list(zip(self.names, self.calls, self.totals))
+        rows = []
+        for name, calls, total in phases:
+            if calls:
+                rows.append((name, calls, total, total / calls, total / elapsed))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def chrome_trace(self):
+        # Chrome izleme biçimi: her çağrı bir 'X' (tam süreli) olayı; zamanlar mikrosaniye
+        pid = os.getpid()
+        events = []
+        for ident, ring in list(self.rings.items()):
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': ident,
+                           'args': {'name': self.thread_names.get(ident, str(ident))}})
+            # Olaylar çağrı bitince yazılır; izleyiciler için başlangıca göre sırala
+            for phase, start, duration in sorted(ring.events(), key=lambda event: (event[1], -event[2])):
+                events.append({
+                    'name': self.names[phase], 'ph': 'X', 'pid': pid, 'tid': ident,
+                    'ts': (start - self.started) / 1000, 'dur': duration / 1000,
+                })
+        return {'traceEvents': events, 'displayTimeUnit': 'ns'}
+
+    def export_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
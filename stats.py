@@ -0,0 +1,231 @@
+from array import array
+
+from history import EMPTY
+
+# Simülasyon sürerken sabit bellekle tutulan istatistikler. Değerler arabalar
+# tamamlandıkça (gecikme, verim) veya döngü satırı kaydedildikçe (aşama doluluğu)
+# güncellenir; hiçbiri tamamlanan arabaların listesine ihtiyaç duymaz.
+
+QUANTILES = (0.5, 0.95, 0.99)
+THROUGHPUT_WINDOW = 100  # Kayan pencere verimliliğinin hesaplandığı döngü sayısı
+
+
+class RunningStats:
+    # Welford yöntemiyle ortalama ve varyans (tek geçiş, sayısal olarak kararlı)
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.minimum is None or x < self.minimum:
+            self.minimum = x
+        if self.maximum is None or x > self.maximum:
+            self.maximum = x
+
+    def variance(self):
+        # Örneklem varyansı
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stddev(self):
+        return self.variance() ** 0.5
+
+
+class LatencyHistogram:
+    # Gecikmeler tam sayı döngü olduğundan yüzdelikler sabit boyutlu bir histogramla
+    # izlenir: LINEAR_LIMIT'e kadar her değerin kendi kovası vardır (tam sonuç),
+    # üstünde her ikinin kuvveti SUB_BUCKETS eşit kovaya bölünür (göreli hata
+    # en fazla 1 / (2 * SUB_BUCKETS)). Ekleme O(1), sorgu kova sayısıyla sınırlıdır.
+    LINEAR_LIMIT = 256
+    SUB_BUCKETS = 16
+
+    def __init__(self):
+        self.linear_bits = self.LINEAR_LIMIT.bit_length() - 1
+        self.sub_bits = self.SUB_BUCKETS.bit_length() - 1
+        self.counts = array('q', [0]) * (self.LINEAR_LIMIT + (64 - self.linear_bits) * self.SUB_BUCKETS)
+        self.count = 0
+
+    def bucket(self, x):
+        if x < self.LINEAR_LIMIT:
+            return x
+        exponent = x.bit_length() - 1
+        sub = (x >> (exponent - self.sub_bits)) - self.SUB_BUCKETS
+        return self.LINEAR_LIMIT + (exponent - self.linear_bits) * self.SUB_BUCKETS + sub
+
+    def bucket_value(self, bucket):
+        # Kovanın temsil ettiği değer (logaritmik kovalarda orta nokta)
+        if bucket < self.LINEAR_LIMIT:
+            return bucket
+        exponent, sub = divmod(bucket - self.LINEAR_LIMIT, self.SUB_BUCKETS)
+        shift = exponent + self.linear_bits - self.sub_bits
+        return ((self.SUB_BUCKETS + sub) << shift) + ((1 << shift) - 1) / 2
+
+    def add(self, x):
+        self.counts[x if x < self.LINEAR_LIMIT else self.bucket(x)] += 1
+        self.count += 1
+
+    def quantiles(self, ps):
+        # Artan sırada verilen yüzdelikler için tek geçişte değerler
+        values = []
+        if not self.count:
+            return [None] * len(ps)
+        ranks = iter([max(1, -(-p * self.count // 1)) for p in ps])
+        rank = next(ranks)
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            while seen >= rank:
+                values.append(self.bucket_value(bucket))
+                rank = next(ranks, None)
+                if rank is None:
+                    return values
+        return values
+
+
+class LatencyStats:
+    # Gecikme dağılımı: ortalama, standart sapma ve yüzdelikler
+    def __init__(self, quantiles=QUANTILES):
+        self.moments = RunningStats()
+        self.histogram = LatencyHistogram()
+        self.quantiles = quantiles
+
+    def add(self, latency):
+        self.moments.add(latency)
+        self.histogram.add(latency)
+
+    def metrics(self, prefix):
+        moments = self.moments
+        metrics = {
+            f'{prefix}_latency_mean': moments.mean,
+            f'{prefix}_latency_std': moments.stddev(),
+            f'{prefix}_latency_min': moments.minimum,
+            f'{prefix}_latency_max': moments.maximum,
+        }
+        for p, value in zip(self.quantiles, self.histogram.quantiles(self.quantiles)):
+            metrics[f'{prefix}_latency_p{round(p * 100)}'] = value
+        return metrics
+
+
+class WindowThroughput:
+    # Son `window` döngüde tamamlanan araba sayısı. Döngü başına bir kova tutan
+    # halka tampon kullanılır; atlanan döngülerde en fazla `window` kova temizlenir.
+    # Son tamamlanmada biten penceredeki oran (completion_rate) ayrıca tutulur:
+    # birim işini bitirdikten sonra pencere boşalsa da çalıştırma sonu özetinde
+    # birimin kendi son penceresi gösterilebilir.
+    def __init__(self, window=THROUGHPUT_WINDOW):
+        self.window = window
+        self.buckets = array('i', [0]) * window
+        self.total = 0
+        self.last_cycle = 0
+        self.completion_rate = 0.0
+
+    def advance(self, cycle):
+        # (last_cycle, cycle] aralığındaki kovaları pencereden çıkar
+        if cycle <= self.last_cycle:
+            return
+        buckets = self.buckets
+        window = self.window
+        if cycle - self.last_cycle >= window:
+            buckets[:] = array('i', [0]) * window
+            self.total = 0
+        else:
+            for c in range(self.last_cycle + 1, cycle + 1):
+                self.total -= buckets[c % window]
+                buckets[c % window] = 0
+        self.last_cycle = cycle
+
+    def add(self, cycle):
+        self.advance(cycle)
+        self.buckets[cycle % self.window] += 1
+        self.total += 1
+        self.completion_rate = self.total / min(self.window, cycle)
+
+    def rate(self, cycle):
+        # cycle. döngüde biten pencerede döngü başına tamamlanan araba
+        if cycle < 1:
+            return 0.0
+        self.advance(cycle)
+        return self.total / min(self.window, cycle)
+
+
+class StageOccupancy:
+    # Aşama başına dolu geçen yuva-döngü sayısı; her aşamada `width` yuva vardır
+    def __init__(self, stage_count, width=1):
+        self.busy = [0] * stage_count
+        self.width = width
+        self.cycles = 0
+
+    def add_pipeline(self, row, count):
+        # Boru hattı satırı yuva düzenindedir (yuva = aşama * width + sıra)
+        busy = self.busy
+        width = self.width
+        for slot, index in enumerate(row):
+            if index != EMPTY:
+                busy[slot // width] += count
+        self.cycles += count
+
+    def add_single_cycle(self, row, count):
+        # Tek vuruşlu satır (komut indeksi, aşama); aynı anda yalnızca bir aşama doludur
+        index, stage = row
+        if index != EMPTY:
+            self.busy[stage] += count
+        self.cycles += count
+
+    def utilization(self):
+        # Aşama başına dolu yuvaların oranı (0-1)
+        if not self.cycles:
+            return [0.0] * len(self.busy)
+        return [busy / (self.cycles * self.width) for busy in self.busy]
+
+    def mean_occupancy(self):
+        # Bir döngüde ortalama kaç yuvanın dolu olduğu
+        return sum(self.busy) / self.cycles if self.cycles else 0.0
+
+
+class PipelineStats:
+    # Boru hatlı ve tek vuruşlu birimlerin canlı istatistikleri. Motor
+    # (SimulationEngine(collect_stats=True)) tarafından güncellenir ve kontrol
+    # noktalarıyla birlikte saklanır.
+    def __init__(self, stage_count, width=1, window=THROUGHPUT_WINDOW):
+        self.pipelined_latency = LatencyStats()
+        self.single_cycle_latency = LatencyStats()
+        self.pipelined_throughput = WindowThroughput(window)
+        self.single_cycle_throughput = WindowThroughput(window)
+        self.pipelined_occupancy = StageOccupancy(stage_count, width)
+        self.single_cycle_occupancy = StageOccupancy(stage_count)
+
+    def add_pipelined(self, instr, cycle):
+        self.pipelined_latency.add(cycle - instr.pipelined_start_cycle)
+        self.pipelined_throughput.add(cycle)
+
+    def add_single_cycle(self, instr, cycle):
+        self.single_cycle_latency.add(cycle - instr.single_cycle_start_cycle)
+        self.single_cycle_throughput.add(cycle)
+
+    def add_cycle(self, pipeline_row, single_cycle_row, count):
+        self.pipelined_occupancy.add_pipeline(pipeline_row, count)
+        self.single_cycle_occupancy.add_single_cycle(single_cycle_row, count)
+
+    def metrics(self, cycle, final=False):
+        # cycle: son simüle edilen döngü (kayan pencerenin sonu). final=True iken
+        # (çalıştırma sonu özeti) her birimin penceresi kendi son tamamlanmasında
+        # biter; yoksa erken biten boru hatlı birimin penceresi hep boş görünürdü.
+        metrics = {}
+        metrics.update(self.pipelined_latency.metrics('pipelined'))
+        metrics.update(self.single_cycle_latency.metrics('single_cycle'))
+        if final:
+            metrics['pipelined_window_throughput'] = self.pipelined_throughput.completion_rate
+            metrics['single_cycle_window_throughput'] = self.single_cycle_throughput.completion_rate
+        else:
+            metrics['pipelined_window_throughput'] = self.pipelined_throughput.rate(cycle)
+            metrics['single_cycle_window_throughput'] = self.single_cycle_throughput.rate(cycle)
+        metrics['pipelined_occupancy'] = self.pipelined_occupancy.mean_occupancy()
+        metrics['pipelined_utilization'] = self.pipelined_occupancy.utilization()
+        metrics['single_cycle_utilization'] = self.single_cycle_occupancy.utilization()
+        return metrics
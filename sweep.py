@@ -0,0 +1,159 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import MIN_HAZARD_STAGES, STAGES, STALL_CAUSES, SimulationEngine, make_stages
+from workload import DependencyStream, SyntheticChassis
+
+# Izgarada verilmeyen parametrelerin varsayılan değerleri
+DEFAULTS = {
+    'stage_count': len(STAGES),
+    'count': 100,
+    'stage_latencies': None,  # None = her aşama 1 döngü
+    'hazard_rate': 0.0,
+    'forwarding': False,
+    'seed': 0,
+    'issue_width': 1,
+}
+
+
+def point_id(params):
+    # Bir ızgara noktasının kararlı kimliği; kaldığı yerden devam ederken kullanılır
+    return json.dumps(params, sort_keys=True)
+
+
+def expand_grid(grid):
+    # {'parametre': [değerler]} ızgarasını tüm kombinasyonlara aç. Aşama sayısıyla
+    # uyuşmayan stage_latencies içeren kombinasyonlar ve bağımlılıkların modellenemediği
+    # kısa hatlarda (MIN_HAZARD_STAGES'ten az aşama) hazard_rate > 0 olanlar atlanır.
+    unknown = set(grid) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametre(ler): {', '.join(sorted(unknown))}")
+    keys = list(DEFAULTS)
+    values = [grid.get(key, [DEFAULTS[key]]) for key in keys]
+    points = []
+    for combo in itertools.product(*values):
+        params = dict(zip(keys, combo))
+        latencies = params['stage_latencies']
+        if latencies is not None and len(latencies) != params['stage_count']:
+            continue
+        if params['hazard_rate'] and params['stage_count'] < MIN_HAZARD_STAGES:
+            continue
+        points.append(params)
+    return points
+
+
+def run_point(params):
+    # Tek bir ızgara noktasını simüle et ve özet ölçüleri döndür (işçi süreçte çalışır)
+    engine = SimulationEngine(make_stages(params['stage_count']), params['stage_latencies'], params['forwarding'],
+                              issue_width=params['issue_width'])
+    dependencies = DependencyStream(params['hazard_rate'], seed=params['seed']) if params['hazard_rate'] else None
+    engine.load_source(SyntheticChassis(params['count']), dependencies=dependencies, keep_history=False)
+
+    start = time.perf_counter()
+    engine.run()
+    elapsed = time.perf_counter() - start
+
+    result = {'point_id': point_id(params)}
+    result.update(params)
+    result.update(engine.summary.metrics(params['stage_count']))
+    for cause in STALL_CAUSES:
+        result[f'stall_{cause}'] = engine.stall_cycles[cause]
+    result['simulated_cycles'] = engine.cycle - 1
+    result['elapsed_s'] = elapsed
+    return result
+
+
+def completed_points(path):
+    # Çıktı dosyasında zaten bulunan noktaların kimlikleri
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.csv'):
+            return {row['point_id'] for row in csv.DictReader(f) if row.get('point_id')}
+        done = set()
+        for line in f:
+            try:
+                done.add(json.loads(line)['point_id'])
+            except (ValueError, KeyError):
+                pass  # Kesintiyle yarım kalmış satır; nokta yeniden çalıştırılır
+        return done
+
+
+class ResultWriter:
+    # Sonuçları tamamlandıkça JSONL veya CSV dosyasının sonuna ekler
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.endswith('.csv')
+        write_header = self.is_csv and (not os.path.exists(path) or os.path.getsize(path) == 0)
+        self.file = open(path, 'a+', newline='', encoding='utf-8')
+        # Yarım kalmış son satırın devamına yazmamak için satır sonu ekle
+        if self.file.tell() > 0:
+            self.file.seek(self.file.tell() - 1)
+            if self.file.read(1) != '\n':
+                self.file.write('\n')
+        self.writer = None
+        self.write_header = write_header
+
+    def write(self, result):
+        if self.is_csv:
+            row = dict(result)
+            if row['stage_latencies'] is not None:
+                row['stage_latencies'] = ','.join(str(x) for x in row['stage_latencies'])
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.file, fieldnames=list(row))
+                if self.write_header:
+                    self.writer.writeheader()
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_sweep(grid, output_path, workers=None, progress=None):
+    # Izgaradaki noktaları süreç havuzunda paralel çalıştır; sonuçlar tamamlandıkça
+    # dosyaya yazılır. Dosyada zaten bulunan noktalar yeniden çalıştırılmaz.
+    done = completed_points(output_path)
+    points = [params for params in expand_grid(grid) if point_id(params) not in done]
+    writer = ResultWriter(output_path)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_point, params) for params in points]
+            for finished, future in enumerate(as_completed(futures), 1):
+                writer.write(future.result())
+                if progress is not None:
+                    progress(finished, len(points))
+    finally:
+        writer.close()
+    return len(points)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parametre taraması: her ızgara noktasını ayrı bir süreçte simüle eder.")
+    parser.add_argument('grid', help='Parametre ızgarası (JSON dosyası), ör. {"stage_count": [3, 5, 8], "count": [100, 1000]}')
+    parser.add_argument('output', help='Sonuç dosyası (.jsonl veya .csv); varsa kaldığı yerden devam edilir')
+    parser.add_argument('--workers', type=int, default=None, help='İşçi süreç sayısı (varsayılan: çekirdek sayısı)')
+    args = parser.parse_args(argv)
+
+    with open(args.grid, encoding='utf-8') as f:
+        grid = json.load(f)
+
+    def progress(finished, total):
+        print(f"\r{finished}/{total} nokta tamamlandı", end='', file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    total = run_sweep(grid, args.output, args.workers, progress)
+    print(f"\n{total} nokta {time.perf_counter() - start:.2f} saniyede çalıştırıldı -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
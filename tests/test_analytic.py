@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from analytic import analytic_run, analytic_summary
+from engine import STAGES, SimulationEngine, make_stages, summary_metrics
+
+FIELDS = ('pipelined_start_cycle', 'pipelined_end_cycle', 'single_cycle_start_cycle', 'single_cycle_end_cycle')
+
+
+def stepped(count, stage_count):
+    engine = SimulationEngine(make_stages(stage_count))
+    engine.load([f"SH-{i+1:03}" for i in range(count)])
+    engine.run()
+    return engine.instruction_history
+
+
+@pytest.mark.parametrize('count, stage_count', [(1000, len(STAGES)), (37, 3), (5, 8), (1, 1)])
+def test_closed_form_matches_engine(count, stage_count):
+    # Analitik sonuç adım adım çalışan motorla birebir aynı olmalı
+    instructions = stepped(count, stage_count)
+    result = analytic_run(count, stage_count)
+    for field in FIELDS:
+        engine_values = np.fromiter((getattr(instr, field) for instr in instructions), dtype=np.int64, count=count)
+        assert np.array_equal(engine_values, result[field]), field
+    speedup = np.fromiter((instr.single_cycle_end_cycle / instr.pipelined_end_cycle for instr in instructions),
+                          dtype=np.float64, count=count)
+    assert np.array_equal(speedup, result['speedup'])
+
+    summary = analytic_summary(count, stage_count)
+    for key, value in summary_metrics(instructions, stage_count).items():
+        assert summary[key].item() == value, key
+
+
+def test_summary_broadcasts_over_configurations():
+    summary = analytic_summary([10, 100, 1000], [[3], [5]])
+    assert summary['avg_speedup'].shape == (2, 3)
+    for i, stage_count in enumerate((3, 5)):
+        for j, count in enumerate((10, 100, 1000)):
+            single = analytic_summary(count, stage_count)
+            assert all(summary[key][i, j] == single[key] for key in single)
@@ -0,0 +1,29 @@
+from bench import compare
+
+
+BASELINE = {
+    'engine/a': {'cycles_per_s': 100.0, 'peak_bytes': 1000.0},
+    'gui/update': {'update_pipelined_table_us': 10.0},
+}
+
+
+def test_compare_flags_regressions_by_direction():
+    results = {
+        'engine/a': {'cycles_per_s': 80.0, 'peak_bytes': 1050.0},
+        'gui/update': {'update_pipelined_table_us': 10.0},
+    }
+    regressed = {(name, metric) for name, metric, *_, bad in compare(BASELINE, results, 0.10) if bad}
+    assert regressed == {('engine/a', 'cycles_per_s')}
+
+
+def test_compare_reports_missing_benchmarks_and_metrics():
+    results = {'engine/a': {'cycles_per_s': 100.0}}
+    rows = compare(BASELINE, results, 0.10)
+    missing = {(name, metric) for name, metric, old, new, change, bad in rows if new is None}
+    assert missing == {('engine/a', 'peak_bytes'), ('gui/update', 'update_pipelined_table_us')}
+    assert all(row[5] for row in rows if row[3] is None)
+
+
+def test_compare_ignores_skipped_benchmarks():
+    results = {'engine/a': {'cycles_per_s': 100.0, 'peak_bytes': 1000.0}}
+    assert not any(row[5] for row in compare(BASELINE, results, 0.10, skipped=('gui/',)))
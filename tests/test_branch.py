@@ -0,0 +1,83 @@
+import pytest
+
+from branch import PREDICTORS, GsharePredictor, StaticPredictor, TwoBitPredictor, make_predictor
+from engine import EXECUTE_STAGE, SimulationEngine
+from workload import BranchStream, SyntheticChassis
+
+
+@pytest.mark.parametrize('issue_width', [1, 2, 3])
+def test_mispredict_flushes_younger_cars_in_same_group(issue_width):
+    # Yanlış tahmin edilen dallanmanın arkasındaki arabalar, dallanmayla aynı grupta
+    # (aşamada) olanlar dahil, hattan atılıp ceza bittikten sonra yeniden alınır
+    engine = SimulationEngine(issue_width=issue_width, predictor=StaticPredictor(False, penalty=2))
+    engine.load([f"SH-{i+1:03}" for i in range(3 * issue_width)])
+    branch = engine.instruction_history[0]
+    branch.branch_pc = 0
+    branch.taken = True  # "Alınmaz" tahmini yanlış çıkar
+    engine.run()
+
+    younger = engine.instruction_history[1:]
+    assert engine.predictor.flushed >= len(younger)
+    refetch = branch.pipelined_start_cycle + EXECUTE_STAGE + 1 + engine.predictor.penalty
+    for instr in younger:
+        assert instr.pipelined_end_cycle > branch.pipelined_end_cycle, instr.chassis_no
+        assert instr.pipelined_end_cycle >= refetch + len(engine.stages), instr.chassis_no
+
+
+def test_correct_prediction_does_not_flush():
+    engine = SimulationEngine(predictor=StaticPredictor(True, penalty=2))
+    engine.load([f"SH-{i+1:03}" for i in range(6)])
+    engine.instruction_history[0].branch_pc = 0
+    engine.instruction_history[0].taken = True
+    engine.run()
+    assert engine.predictor.metrics()['branch_mispredictions'] == 0
+    assert engine.predictor.flushed == 0
+    assert [instr.pipelined_end_cycle for instr in engine.instruction_history] == list(range(6, 12))
+
+
+def run_branches(predictor, count=5000, issue_width=1):
+    engine = SimulationEngine(issue_width=issue_width, predictor=predictor)
+    engine.load_source(SyntheticChassis(count), branches=BranchStream(0.3, seed=0), keep_history=False)
+    engine.run()
+    return engine
+
+
+@pytest.mark.parametrize('name', PREDICTORS)
+@pytest.mark.parametrize('issue_width', [1, 2])
+def test_every_predictor_completes_all_cars(name, issue_width):
+    engine = run_branches(make_predictor(name), count=2000, issue_width=issue_width)
+    metrics = engine.predictor.metrics()
+    assert engine.summary.pipelined_count == 2000
+    assert engine.summary.single_cycle_count == 2000
+    assert metrics['branches'] > 0
+    assert metrics['branch_flush_cycles'] == metrics['branch_mispredictions'] * engine.predictor.penalty
+
+
+def test_dynamic_predictors_beat_static():
+    accuracy = {name: run_branches(make_predictor(name)).predictor.metrics()['branch_accuracy']
+                for name in ('not-taken', '2bit', 'gshare')}
+    assert accuracy['2bit'] > accuracy['not-taken']
+    assert accuracy['gshare'] > accuracy['not-taken']
+
+
+def test_two_bit_counter_tolerates_single_deviation():
+    predictor = TwoBitPredictor()
+    for _ in range(3):
+        predictor.resolve(8, True, predictor.predict(8))
+    predictor.resolve(8, False, predictor.predict(8))
+    assert predictor.predict(8)
+
+
+def test_gshare_rolls_back_speculative_history():
+    predictor = GsharePredictor()
+    predicted = predictor.predict(4)
+    predictor.predict(8)  # Genç dallanma, yanlış tahminde hattan atılır
+    predictor.resolve(4, not predicted, predicted)
+    assert predictor.history == predictor.resolved_history
+
+
+def test_invalid_arguments_rejected():
+    with pytest.raises(ValueError):
+        StaticPredictor(penalty=-1)
+    with pytest.raises(ValueError):
+        make_predictor('perfect')
@@ -0,0 +1,50 @@
+import pytest
+
+from cache import SetAssociativeCache
+from engine import SimulationEngine
+from workload import AddressStream, SyntheticChassis
+
+COUNT = 2000
+
+
+def run_cached(policy='lru', miss_penalty=10, keep_history=False):
+    cache = SetAssociativeCache(512, 2, policy=policy, miss_penalty=miss_penalty, seed=1)
+    engine = SimulationEngine(cache=cache)
+    engine.load_source(SyntheticChassis(COUNT), addresses=AddressStream(seed=3), keep_history=keep_history)
+    engine.run()
+    return engine
+
+
+def test_hits_and_misses_add_up():
+    metrics = run_cached().cache.metrics()
+    assert metrics['cache_accesses'] == COUNT
+    assert metrics['cache_hits'] + metrics['cache_misses'] == COUNT
+    assert 0 < metrics['cache_hit_rate'] < 1
+
+
+@pytest.mark.parametrize('policy', ['lru', 'fifo', 'random'])
+@pytest.mark.parametrize('keep_history', [True, False])
+def test_both_units_pay_the_same_misses(policy, keep_history):
+    # Hızlanma oranı iki birimin aynı ıska cezasını ödediği bir karşılaştırma olmalı
+    engine = run_cached(policy, keep_history=keep_history)
+    misses = engine.cache.metrics()['cache_misses']
+    assert engine.single_cycle_cache.metrics()['cache_misses'] == misses
+    summary = engine.summary.metrics(len(engine.stages))
+    assert summary['total_single_cycle'] == COUNT * len(engine.stages) + 1 + misses * 10
+
+
+def test_zero_penalty_matches_no_cache():
+    plain = SimulationEngine()
+    plain.load_source(SyntheticChassis(COUNT), keep_history=False)
+    plain.run()
+    cached = run_cached(miss_penalty=0)
+    assert cached.summary.metrics(5) == plain.summary.metrics(5)
+
+
+def test_invalid_geometry_rejected():
+    with pytest.raises(ValueError):
+        SetAssociativeCache(1000)
+    with pytest.raises(ValueError):
+        SetAssociativeCache(64, associativity=4, line_size=64)
+    with pytest.raises(ValueError):
+        SetAssociativeCache(policy='mru')
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+import cli
+from branch import make_predictor
+from cache import SetAssociativeCache
+from engine import SimulationEngine
+from workload import AddressStream, BranchStream, DependencyStream, SyntheticChassis
+
+
+def make_engine(keep_history=True, checkpoint_interval=16):
+    engine = SimulationEngine(stage_latencies=[1, 1, 2, 1, 1], checkpoint_interval=checkpoint_interval, issue_width=2,
+                              cache=SetAssociativeCache(256, 2, miss_penalty=3, seed=0), predictor=make_predictor('2bit'))
+    engine.load_source(SyntheticChassis(150), dependencies=DependencyStream(0.4, seed=1), keep_history=keep_history,
+                       addresses=AddressStream(seed=2), branches=BranchStream(0.2, seed=3))
+    return engine
+
+
+def state(engine):
+    # Karşılaştırılacak gözlemlenebilir durum
+    return {
+        'cycle': engine.cycle,
+        'summary': engine.summary.metrics(len(engine.stages)) if engine.finished else None,
+        'stalls': dict(engine.stall_cycles),
+        'cache': engine.cache.metrics(),
+        'predictor': engine.predictor.metrics(),
+    }
+
+
+def history_rows(engine):
+    return [tuple(engine.pipeline_history[i]) for i in range(len(engine.pipeline_history))]
+
+
+def test_seek_replays_identically():
+    reference = make_engine()
+    reference.run()
+    expected_rows = history_rows(reference)
+    ends = [(i.pipelined_end_cycle, i.single_cycle_end_cycle) for i in reference.instruction_history]
+
+    engine = make_engine()
+    engine.run()
+    for target in (5, 200, 37, 1, 120, 16, 17):
+        engine.seek(target)
+        assert engine.cycle == target + 1
+        assert history_rows(engine) == expected_rows[:target]
+    engine.run()
+    assert history_rows(engine) == expected_rows
+    assert [(i.pipelined_end_cycle, i.single_cycle_end_cycle) for i in engine.instruction_history] == ends
+    assert state(engine) == state(reference)
+
+
+@pytest.mark.parametrize('keep_history', [True, False])
+def test_save_and_restore_continue_identically(tmp_path, keep_history):
+    reference = make_engine(keep_history)
+    reference.run()
+
+    first = make_engine(keep_history)
+    first.run(max_cycles=90)
+    path = tmp_path / 'yarim.ckpt'
+    first.save_checkpoint(path)
+
+    resumed = SimulationEngine()
+    resumed.restore_checkpoint(path)
+    resumed.run()
+    assert state(resumed) == state(reference)
+
+
+def test_restore_rejects_other_version(tmp_path):
+    engine = make_engine()
+    snapshot = engine.snapshot(full=True)
+    snapshot['version'] = -1
+    with pytest.raises(ValueError):
+        SimulationEngine().restore(snapshot)
+
+
+def run_cli(tmp_path, name, *args):
+    output = tmp_path / name
+    assert cli.main(['--format', 'json', '-o', str(output), *args]) == 0
+    return json.loads(output.read_text(encoding='utf-8'))
+
+
+def test_cli_save_and_resume_match_single_run(tmp_path):
+    options = ['--count', '500', '--hazard-rate', '0.3', '--forwarding', '--seed', '4', '--width', '2']
+    whole = run_cli(tmp_path, 'whole.json', *options)
+    checkpoint = tmp_path / 'yarim.ckpt'
+    partial = run_cli(tmp_path, 'partial.json', *options, '--stop-at', '200', '--save', str(checkpoint))
+    assert partial == {'simulated_cycles': 200, 'finished': False}
+    resumed = run_cli(tmp_path, 'resumed.json', '--resume', str(checkpoint))
+    assert resumed == whole
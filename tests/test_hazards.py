@@ -0,0 +1,47 @@
+import pytest
+
+from engine import MIN_HAZARD_STAGES, SimulationEngine, hazard_stages, make_stages
+from workload import DependencyStream, SyntheticChassis
+
+
+def run_with_hazards(stage_count, hazard_rate=0.9, forwarding=False, issue_width=1, count=200):
+    engine = SimulationEngine(make_stages(stage_count), forwarding=forwarding, issue_width=issue_width)
+    engine.load_source(SyntheticChassis(count), dependencies=DependencyStream(hazard_rate, seed=0), keep_history=False)
+    engine.run()
+    return engine
+
+
+@pytest.mark.parametrize('stage_count', [1, 2, 3])
+def test_short_pipelines_reject_dependencies(stage_count):
+    # Bağımlılıklar modellenemiyorsa sessizce düşürülmez
+    with pytest.raises(ValueError):
+        run_with_hazards(stage_count)
+
+
+@pytest.mark.parametrize('stage_count', [2, 3])
+def test_short_pipelines_run_without_dependencies(stage_count):
+    engine = SimulationEngine(make_stages(stage_count))
+    engine.load_source(SyntheticChassis(20))
+    engine.run()
+    assert engine.summary.pipelined_count == 20
+    assert engine.stall_cycles['data'] == 0
+
+
+@pytest.mark.parametrize('stage_count', [MIN_HAZARD_STAGES, 5, 8, 12])
+@pytest.mark.parametrize('issue_width', [1, 2])
+def test_hazards_stall_for_every_supported_stage_count(stage_count, issue_width):
+    assert run_with_hazards(stage_count, issue_width=issue_width).stall_cycles['data'] > 0
+
+
+@pytest.mark.parametrize('stage_count', [MIN_HAZARD_STAGES, 5, 8])
+def test_forwarding_never_stalls_more(stage_count):
+    plain = run_with_hazards(stage_count).stall_cycles['data']
+    forwarded = run_with_hazards(stage_count, forwarding=True).stall_cycles['data']
+    assert forwarded <= plain
+
+
+def test_hazard_stage_indices():
+    # 4 aşamalı hatta EX ile MEM aynı aşamadır
+    assert hazard_stages(4) == (1, 2, 2)
+    assert hazard_stages(5) == (1, 2, 3)
+    assert hazard_stages(8) == (1, 2, 6)
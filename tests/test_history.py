@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from history import BLOCK_SIZE, CycleHistory
+
+
+def rows_of(history):
+    return [tuple(history[i]) for i in range(len(history))]
+
+
+def test_random_operations_match_plain_list():
+    rng = random.Random(1)
+    for _ in range(200):
+        history = CycleHistory(2)
+        expected = []
+        for _ in range(80):
+            op = rng.random()
+            values = (rng.randint(0, 2), rng.randint(0, 1))
+            if op < 0.4:
+                history.append(values)
+                expected.append(values)
+            elif op < 0.6:
+                count = rng.randint(0, 3 * BLOCK_SIZE)
+                history.append_run(values, count)
+                expected += [values] * count
+            elif op < 0.75 and expected:
+                count = rng.randint(0, 2 * BLOCK_SIZE)
+                history.repeat_last(count)
+                expected += [expected[-1]] * count
+            elif op < 0.85:
+                length = rng.randint(0, len(expected) + 2)
+                history.truncate(length)
+                del expected[length:]
+            assert len(history) == len(expected)
+        assert rows_of(history) == expected
+        if expected:
+            assert tuple(history[-1]) == expected[-1]
+        flattened = []
+        for row, start, count in history.runs():
+            assert start == len(flattened)
+            flattened += [tuple(row)] * count
+        assert flattened == expected
+
+
+def test_out_of_range_raises():
+    history = CycleHistory(1)
+    history.append((1,))
+    with pytest.raises(IndexError):
+        history[1]
+    with pytest.raises(IndexError):
+        history[-2]
+
+
+def test_memory_grows_with_runs_not_cycles():
+    history = CycleHistory(5)
+    history.append((1, 2, 3, 4, 5))
+    history.repeat_last(1_000_000)
+    # Tek koşu: satır + başlangıç + döngü başına 4 / BLOCK_SIZE bayt blok dizini
+    assert history.nbytes() <= 5 * 4 + 8 + 4 * (1_000_001 // BLOCK_SIZE + 1)
@@ -0,0 +1,15 @@
+from engine import MIN_HAZARD_STAGES
+from sweep import expand_grid, run_point
+
+
+def test_short_pipelines_skip_hazard_points():
+    points = expand_grid({'stage_count': [2, 3, 5], 'hazard_rate': [0.0, 0.5]})
+    combos = {(p['stage_count'], p['hazard_rate']) for p in points}
+    assert combos == {(2, 0.0), (3, 0.0), (5, 0.0), (5, 0.5)}
+
+
+def test_hazard_points_report_data_stalls():
+    # Bağımlılık oranı yüksekken her noktada veri beklemesi görülmeli
+    for params in expand_grid({'stage_count': [MIN_HAZARD_STAGES, 5, 8], 'hazard_rate': [0.9], 'issue_width': [1, 2]}):
+        result = run_point(params)
+        assert result['stall_data'] > 0, params
@@ -0,0 +1,291 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from engine import Instruction
+from history import EMPTY
+
+# İkili iz (trace) dosyası. Tüm sayılar little-endian'dır.
+#
+#   başlık   : HEADER (sihirli sözcük, sürüm, aşama sayısı, hat genişliği, başlık
+#              boyu) ve aşama adları (uint32 uzunluk + UTF-8), 8 baytlık sınıra tamamlanmış
+#   matris   : döngü başına (aşama sayısı * genişlik + 2) int32: her yuvadaki komut
+#              indeksi (yuva = aşama * genişlik + sıra), ardından tek vuruşlu birimin
+#              (komut indeksi, aşama) ikilisi; boş = -1.
+#              Simülasyon sürerken satır satır yazılır.
+#   dipnot   : komut başına sütunlar (int32): boru hatlı başlangıç / bitiş, tek
+#              vuruşlu başlangıç / bitiş, bekleme döngüsü; ardından 8 baytlık sınıra
+#              tamamlanıp int64 şasi numarası ofsetleri (komut sayısı + 1) ve UTF-8 metin
+#   son ek   : TRAILER (dipnot ofseti, döngü sayısı, komut sayısı, sihirli sözcük)
+#
+# Okuyucu dosyayı mmap ile açar; yalnızca görüntülenen satırlar diskten okunur.
+
+MAGIC = b'PIPETRC1'
+END_MAGIC = b'PIPEEND1'
+VERSION = 2
+HEADER = struct.Struct('<8sIIII')
+TRAILER = struct.Struct('<QQQ8s')
+INSTRUCTION_COLUMNS = ('pipelined_start_cycle', 'pipelined_end_cycle',
+                       'single_cycle_start_cycle', 'single_cycle_end_cycle', 'stall_cycles')
+FLUSH_ITEMS = 1 << 16  # Bu kadar tamsayı biriktiğinde diske yazılır
+
+
+def write_array(f, values):
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(f)
+
+
+def pad_to(f, alignment=8):
+    padding = -f.tell() % alignment
+    if padding:
+        f.write(b'\0' * padding)
+
+
+class TraceWriter:
+    # Motorun olaylarına abone olup izi çalışma sırasında diske yazar. Döngü
+    # matrisi doğrudan dosyaya, komut sütunları geçici dosyalara eklenir; bellek
+    # kullanımı çalıştırmanın uzunluğundan bağımsızdır.
+    def __init__(self, path, stages, issue_width=1):
+        self.stage_count = len(stages)
+        self.file = open(path, 'wb')
+        names = [name.encode('utf-8') for name in stages]
+        header_size = HEADER.size + sum(4 + len(name) for name in names)
+        header_size += -header_size % 8
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.stage_count, issue_width, header_size))
+        for name in names:
+            self.file.write(struct.pack('<I', len(name)))
+            self.file.write(name)
+        pad_to(self.file)
+
+        self.cycles = 0
+        self.rows = array('i')
+        # Komut sütunları ve şasi numaraları için geçici dosyalar
+        self.columns = {name: array('i') for name in INSTRUCTION_COLUMNS}
+        self.column_files = {name: tempfile.TemporaryFile() for name in INSTRUCTION_COLUMNS}
+        self.column_counts = dict.fromkeys(INSTRUCTION_COLUMNS, 0)
+        self.offsets = array('q', [0])
+        self.chassis_size = 0
+        self.offsets_file = tempfile.TemporaryFile()
+        self.chassis_file = tempfile.TemporaryFile()
+        self.engine = None
+
+    def attach(self, engine):
+        if engine.cycle != 1:
+            raise ValueError("İz kaydı simülasyonun başında başlatılmalıdır")
+        self.engine = engine
+        engine.subscribe('cycle', self.on_cycle)
+        engine.subscribe('pipelined_complete', self.on_pipelined_complete)
+        engine.subscribe('single_cycle_complete', self.on_single_cycle_complete)
+
+    def detach(self):
+        if self.engine is None:
+            return
+        self.engine.unsubscribe('cycle', self.on_cycle)
+        self.engine.unsubscribe('pipelined_complete', self.on_pipelined_complete)
+        self.engine.unsubscribe('single_cycle_complete', self.on_single_cycle_complete)
+        self.engine = None
+
+    def on_cycle(self, pipeline_row, single_cycle_row, count):
+        row = array('i', pipeline_row + single_cycle_row)
+        self.cycles += count
+        # Uzun atlamalar parça parça yazılır
+        chunk = max(1, FLUSH_ITEMS // len(row))
+        while count:
+            n = min(count, chunk)
+            self.rows.extend(row * n)
+            count -= n
+            if len(self.rows) >= FLUSH_ITEMS:
+                self.flush_rows()
+
+    def on_pipelined_complete(self, instr, cycle):
+        self.add_values(('pipelined_start_cycle', 'pipelined_end_cycle', 'stall_cycles'),
+                        (instr.pipelined_start_cycle, cycle, instr.stall_cycles))
+        chassis_no = instr.chassis_no.encode('utf-8')
+        self.chassis_file.write(chassis_no)
+        self.chassis_size += len(chassis_no)
+        self.offsets.append(self.chassis_size)
+        if len(self.offsets) >= FLUSH_ITEMS:
+            write_array(self.offsets_file, self.offsets)
+            del self.offsets[:]
+
+    def on_single_cycle_complete(self, instr, cycle):
+        self.add_values(('single_cycle_start_cycle', 'single_cycle_end_cycle'),
+                        (instr.single_cycle_start_cycle, cycle))
+
+    def add_values(self, names, values):
+        for name, value in zip(names, values):
+            column = self.columns[name]
+            column.append(value)
+            self.column_counts[name] += 1
+            if len(column) >= FLUSH_ITEMS:
+                write_array(self.column_files[name], column)
+                del column[:]
+
+    def flush_rows(self):
+        write_array(self.file, self.rows)
+        del self.rows[:]
+
+    def close(self):
+        # Dipnotu ve son eki yaz. Komut sayısı boru hattından çıkan araba sayısıdır;
+        # tek vuruşlu sütunlar eksikse -1 ile tamamlanır.
+        self.detach()
+        self.flush_rows()
+        footer_offset = self.file.tell()
+        count = self.column_counts['pipelined_end_cycle']
+        for name in INSTRUCTION_COLUMNS:
+            missing = count - self.column_counts[name]
+            if missing > 0:
+                self.columns[name].extend(array('i', [EMPTY]) * missing)
+            write_array(self.column_files[name], self.columns[name])
+            self.copy_temp(self.column_files[name], count * 4)
+        pad_to(self.file)
+        write_array(self.offsets_file, self.offsets)
+        self.copy_temp(self.offsets_file, (count + 1) * 8)
+        self.copy_temp(self.chassis_file, self.chassis_size)
+        self.file.write(TRAILER.pack(footer_offset, self.cycles, count, END_MAGIC))
+        self.file.close()
+
+    def copy_temp(self, temp, size):
+        # Geçici dosyanın ilk size baytını iz dosyasına ekle ve kapat
+        temp.seek(0)
+        while size > 0:
+            data = temp.read(min(size, 1 << 20))
+            if not data:
+                break
+            self.file.write(data)
+            size -= len(data)
+        temp.close()
+
+
+def export_trace(engine, path):
+    # Geçmişi tutulmuş (keep_history) bir çalıştırmayı sonradan iz dosyasına yaz
+    writer = TraceWriter(path, engine.stages, engine.issue_width)
+    pipeline_history = engine.pipeline_history
+    single_cycle_history = engine.single_cycle_history
+    for cycle_index in range(len(pipeline_history)):
+        writer.on_cycle(tuple(pipeline_history[cycle_index]), tuple(single_cycle_history[cycle_index]), 1)
+    for instr in engine.instruction_history:
+        if instr.pipelined_end_cycle is not None:
+            writer.on_pipelined_complete(instr, instr.pipelined_end_cycle)
+    for instr in engine.instruction_history:
+        if instr.single_cycle_end_cycle is not None:
+            writer.on_single_cycle_complete(instr, instr.single_cycle_end_cycle)
+    writer.close()
+
+
+class TraceHistory:
+    # Matristeki bir sütun aralığı; CycleHistory gibi döngü indeksiyle okunur
+    def __init__(self, matrix, row_width, start, width, cycles):
+        self.matrix = matrix
+        self.row_width = row_width
+        self.start = start
+        self.width = width
+        self.cycles = cycles
+
+    def __len__(self):
+        return self.cycles
+
+    def __getitem__(self, cycle_index):
+        if not 0 <= cycle_index < self.cycles:
+            raise IndexError(cycle_index)
+        offset = cycle_index * self.row_width + self.start
+        return self.matrix[offset:offset + self.width].tolist()
+
+
+class TraceInstructions:
+    # Komut sütunlarından istendikçe Instruction nesnesi oluşturan dizi
+    def __init__(self, reader):
+        self.reader = reader
+
+    def __len__(self):
+        return self.reader.instruction_count
+
+    def __getitem__(self, index):
+        reader = self.reader
+        if not 0 <= index < reader.instruction_count:
+            raise IndexError(index)
+        chassis_no = bytes(reader.chassis[reader.offsets[index]:reader.offsets[index + 1]]).decode('utf-8')
+        instr = Instruction(chassis_no, index)
+        for name in INSTRUCTION_COLUMNS:
+            value = reader.columns[name][index]
+            setattr(instr, name, None if value == EMPTY and name != 'stall_cycles' else value)
+        return instr
+
+
+class TraceReader:
+    # İz dosyasını mmap ile açar. pipeline_history, single_cycle_history ve
+    # instruction_history motordaki karşılıklarıyla aynı biçimde okunur, böylece
+    # tablo modeli bir motor yerine bir iz dosyasını da gösterebilir.
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise ValueError("İz dosyaları yalnızca little-endian sistemlerde mmap ile açılabilir")
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        if size < HEADER.size + TRAILER.size:
+            self.file.close()
+            raise ValueError("Geçerli bir iz dosyası değil")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.parse(size)
+        except (ValueError, struct.error, UnicodeDecodeError):
+            self.close()
+            raise ValueError("Geçerli bir iz dosyası değil")
+
+    def parse(self, size):
+        mm = self.mm
+        magic, version, stage_count, issue_width, header_size = HEADER.unpack_from(mm, 0)
+        footer_offset, cycles, count, end_magic = TRAILER.unpack_from(mm, size - TRAILER.size)
+        if magic != MAGIC or end_magic != END_MAGIC or version != VERSION or issue_width < 1:
+            raise ValueError
+        offset = HEADER.size
+        stages = []
+        for _ in range(stage_count):
+            (length,) = struct.unpack_from('<I', mm, offset)
+            stages.append(mm[offset + 4:offset + 4 + length].decode('utf-8'))
+            offset += 4 + length
+        self.stages = stages
+        self.issue_width = issue_width
+        self.cycle_count = cycles
+        self.instruction_count = count
+
+        view = memoryview(mm)
+        self.views = [view]
+        slots = stage_count * issue_width
+        row_width = slots + 2
+        self.matrix = self.cast(view, header_size, cycles * row_width * 4, 'i')
+        offset = footer_offset
+        self.columns = {}
+        for name in INSTRUCTION_COLUMNS:
+            self.columns[name] = self.cast(view, offset, count * 4, 'i')
+            offset += count * 4
+        offset += -offset % 8
+        self.offsets = self.cast(view, offset, (count + 1) * 8, 'q')
+        offset += (count + 1) * 8
+        self.chassis = self.cast(view, offset, self.offsets[count], 'B')
+        if offset + self.offsets[count] != size - TRAILER.size:
+            raise ValueError
+
+        self.pipeline_history = TraceHistory(self.matrix, row_width, 0, slots, cycles)
+        self.single_cycle_history = TraceHistory(self.matrix, row_width, slots, 2, cycles)
+        self.instruction_history = TraceInstructions(self)
+
+    def cast(self, view, offset, size, typecode):
+        if offset + size > len(view):
+            raise ValueError
+        part = view[offset:offset + size]
+        cast = part.cast(typecode)
+        self.views += [part, cast]
+        return cast
+
+    def close(self):
+        # mmap kapatılmadan önce tüm memoryview'lar bırakılmalıdır
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        self.mm.close()
+        self.file.close()
@@ -0,0 +1,155 @@
+import itertools
+import random
+from collections import deque
+
+# Modeldeki yazmaç sayısı; bağımlılıklar bu kadar bitlik maskelerle tutulur
+REGISTER_COUNT = 32
+
+
+class DependencyStream:
+    # Sonsuz (src_mask, dst_mask, is_load) üçlüleri. hazard_rate olasılıkla
+    # kaynak yazmaç son `window` arabadan birinin hedefi seçilir (veri bağımlılığı);
+    # aksi halde son yazılan yazmaçlar dışında bir yazmaç okunur. Üreteç yerine
+    # sınıf olduğundan kopyalanabilir ve kontrol noktalarıyla birlikte kaydedilebilir.
+    def __init__(self, hazard_rate, load_rate=0.25, window=3, seed=None):
+        self.hazard_rate = hazard_rate
+        self.load_rate = load_rate
+        self.rng = random.Random(seed)
+        self.recent = deque(maxlen=window)  # Son arabaların hedef yazmaçları
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rng = self.rng
+        recent = self.recent
+        if recent and rng.random() < self.hazard_rate:
+            src = rng.choice(recent)
+        else:
+            src = rng.randrange(REGISTER_COUNT)
+            while src in recent:
+                src = rng.randrange(REGISTER_COUNT)
+        dst = rng.randrange(REGISTER_COUNT)
+        is_load = rng.random() < self.load_rate
+        recent.append(dst)
+        return 1 << src, 1 << dst, is_load
+
+
+class AddressStream:
+    # Sonsuz bellek adresleri (MEM aşamasındaki parça tamponu erişimleri için).
+    # locality olasılıkla bir önceki adresten `stride` bayt ileri gidilir (ardışık
+    # erişim); aksi halde working_set baytlık alanda rastgele bir adrese atlanır.
+    # DependencyStream gibi kopyalanabilir ve kontrol noktalarıyla saklanabilir.
+    def __init__(self, working_set=1 << 16, locality=0.8, stride=8, seed=None):
+        if working_set < 1:
+            raise ValueError("Çalışma kümesi en az 1 bayt olmalıdır")
+        self.working_set = working_set
+        self.locality = locality
+        self.stride = stride
+        self.rng = random.Random(seed)
+        self.address = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rng = self.rng
+        if rng.random() < self.locality:
+            self.address = (self.address + self.stride) % self.working_set
+        else:
+            self.address = rng.randrange(self.working_set)
+        return self.address
+
+
+class BranchStream:
+    # Sonsuz dallanma bilgisi: araba dallanma değilse None, dallanmaysa (pc, taken).
+    # Dallanmalar program sırasıyla `sites` adet sabit dallanma adresini dolaşır.
+    # Adreslerin yarısı döngü dallanmasıdır (trip - 1 kez alınır, sonra bir kez
+    # alınmaz; trip adrese göre 2-16 arası), diğer yarısı sabit bir olasılıkla alınan
+    # koşullu dallanmalardır. DependencyStream gibi kopyalanabilir ve kontrol
+    # noktalarıyla saklanabilir.
+    def __init__(self, branch_rate, sites=16, seed=None):
+        if sites < 1:
+            raise ValueError("En az bir dallanma adresi olmalıdır")
+        self.branch_rate = branch_rate
+        self.rng = random.Random(seed)
+        # Adres başına (pc, döngü boyu veya 0, alınma olasılığı); adresler komut
+        # boyu (4 bayt) hizalı ve tahmin tablolarında dağılsın diye rastgele seçilir
+        self.sites = []
+        for i in range(sites):
+            pc = self.rng.randrange(1 << 16) * 4
+            if i % 2 == 0:
+                self.sites.append((pc, self.rng.randint(2, 16), 1.0))
+            else:
+                self.sites.append((pc, 0, self.rng.choice((0.05, 0.2, 0.8, 0.95))))
+        self.iterations = [0] * sites
+        self.next_site = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rng = self.rng
+        if rng.random() >= self.branch_rate:
+            return None
+        site = self.next_site
+        self.next_site = (site + 1) % len(self.sites)
+        pc, trip, bias = self.sites[site]
+        if trip:
+            self.iterations[site] = (self.iterations[site] + 1) % trip
+            taken = self.iterations[site] != 0
+        else:
+            taken = rng.random() < bias
+        return pc, taken
+
+
+def assign_dependencies(instructions, hazard_rate, load_rate=0.25, window=3, seed=None):
+    # Önceden yüklenmiş arabalara rastgele kaynak / hedef yazmaçları ata
+    for instr, (src_mask, dst_mask, is_load) in zip(instructions, DependencyStream(hazard_rate, load_rate, window, seed)):
+        instr.src_mask = src_mask
+        instr.dst_mask = dst_mask
+        instr.is_load = is_load
+    return instructions
+
+
+# Şasi numarası kaynakları (SimulationEngine.load_source için). Sınıflar tekrar
+# okunabilir: her for döngüsü baştan başlar, böylece boru hatlı ve tek vuruşlu
+# birimler kaynağı birbirini beklemeden ayrı ayrı okur.
+
+def chassis_lines(f):
+    # Açık bir dosyadan (ör. sys.stdin) satır başına veya virgülle ayrılmış şasi numaraları
+    for line in f:
+        for chassis_no in line.split(','):
+            chassis_no = chassis_no.strip()
+            if chassis_no:
+                yield chassis_no
+
+
+class ChassisFile:
+    # Şasi numaralarını dosyadan satır satır okur; dosya belleğe alınmaz
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        with open(self.path, encoding='utf-8') as f:
+            yield from chassis_lines(f)
+
+
+class SyntheticChassis:
+    # SH-001, SH-002, ... biçiminde şasi numaraları; count None ise sonsuz. prefix
+    # bir liste ise modeller sırayla dönüşümlü kullanılır (SH-001, SD-002, SH-003, ...)
+    def __init__(self, count=None, prefix='SH'):
+        self.count = count
+        self.prefix = prefix
+
+    def __iter__(self):
+        numbers = itertools.count(1) if self.count is None else range(1, self.count + 1)
+        prefixes = [self.prefix] if isinstance(self.prefix, str) else list(self.prefix)
+        for i in numbers:
+            yield f"{prefixes[(i - 1) % len(prefixes)]}-{i:03}"
+
+
+def chassis_model(chassis_no):
+    # Şasi numarasının model kodu: son '-' işaretinden önceki kısım (SH-001 -> SH)
+    model, separator, _ = chassis_no.rpartition('-')
+    return model if separator else chassis_no